@@ -0,0 +1,342 @@
+"""Timing, memory and correctness benchmarks of the computation paths.
+
+Every case runs on data sampled from a known population model
+(:mod:`synthetic`) for each ``(n, indicators, constructs)`` size of a grid,
+is timed (best of adaptive repeats) and run once more under
+:mod:`tracemalloc` for its peak memory, and checks its output against the
+population values or an independent computation::
+
+    python benchmarks/run.py                                   # quick grid
+    python benchmarks/run.py --grid full --save full.json
+    python benchmarks/run.py --compare benchmarks/baselines/quick.json --tolerance 0.3
+
+``--compare`` flags every case that got slower (or used more memory) than
+the baseline by more than the tolerance. Baselines are only comparable on
+the machine that recorded them. The script exits with 1 if a check failed
+or a case regressed.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.synthetic import population  # noqa: E402
+from smartpls_assistant import bootstrap, fsqca, htmt, loader, pls, screening  # noqa: E402
+from smartpls_assistant.bulk import read_reports  # noqa: E402
+from smartpls_assistant.data import read_data  # noqa: E402
+from smartpls_assistant.rules import RULES  # noqa: E402
+
+# (observations, indicators, constructs) per grid.
+GRIDS = {
+    "quick": [(200, 10, 3), (1000, 30, 5), (5000, 60, 8)],
+    "full": [(200, 10, 3), (1000, 30, 5), (5000, 60, 8), (20000, 120, 20), (100000, 300, 40),
+             (100000, 10, 3), (200, 300, 40)],
+}
+# Resampling cases are skipped above this many multiply-adds per draw (n * p²).
+MAX_RESAMPLING_COST = 2e9
+# Timing: repeat until this many seconds or repeats are spent (at least once).
+MIN_SECONDS = 0.5
+MAX_REPEATS = 7
+# Differences below these floors are noise, not regressions.
+MIN_SECONDS_DELTA = 0.005
+MIN_BYTES_DELTA = 2 ** 20
+# Sampling error allowance of estimates around their population values, in 1/sqrt(n).
+Z_TOLERANCE = 5.0
+# fsQCA conditions at most (the truth table has 2^k rows).
+MAX_CONDITIONS = 10
+# Share of cells deleted (completely at random) before imputation.
+MISSING_SHARE = 0.1
+
+
+@dataclass
+class Dataset:
+    """One grid point: the population, a sample of it and its files."""
+    n: int
+    p: int
+    k: int
+    population: object
+    data: pd.DataFrame
+    folder: str
+    n_boot: int
+
+    @property
+    def tolerance(self):
+        return Z_TOLERANCE / self.n ** 0.5
+
+    @property
+    def resampling(self):
+        return self.n * self.p ** 2 <= MAX_RESAMPLING_COST
+
+
+def _max_diff(a, b):
+    a, b = np.asarray(a, dtype=float), np.asarray(b, dtype=float)
+    both = ~(np.isnan(a) & np.isnan(b))
+    return float(np.abs(a[both] - b[both]).max()) if both.any() else 0.0
+
+
+# A case prepares its inputs and returns ``(work, check)``: ``work()`` is
+# what is timed and ``check(output)`` returns a dict with ``ok`` plus the
+# measured deviations.
+
+def case_rules(ds):
+    values = np.abs(ds.data.to_numpy()) / 3
+    picks = np.random.default_rng(0).integers(0, values.size, 200)
+
+    def work():
+        # Only a sample of each status array is kept, so one array is alive at a time.
+        return {metric: rule.evaluate(values).ravel()[picks] for metric, rule in RULES.items()}
+
+    def check(statuses):
+        flat = values.ravel()
+        mismatches = sum(int(statuses[metric][j] != rule.band(flat[i]).status)
+                         for metric, rule in RULES.items() for j, i in enumerate(picks))
+        return {"ok": mismatches == 0, "mismatches": mismatches}
+
+    return work, check
+
+
+def _report_tables(ds):
+    result = pls.estimate(ds.data, ds.population.spec)
+    matrix = htmt.htmt_matrix(pls.correlation(ds.data.to_numpy()), ds.population.spec)
+    matrix = matrix.where(np.tril(np.ones(matrix.shape, dtype=bool), -1))
+    return {
+        "Outer loadings": result.outer_loadings,
+        "Construct reliability and validity": result.reliability,
+        "Discriminant validity - HTMT": matrix,
+        "Path coefficients": result.path_coefficients,
+        "Latent variable scores": result.scores,
+    }
+
+
+def case_report_parsing(ds):
+    tables = _report_tables(ds)
+    path = os.path.join(ds.folder, "report.csv")
+    with open(path, "w", encoding="utf-8") as out:
+        for title, table in tables.items():
+            out.write(f"{title}\n")
+            table.to_csv(out, lineterminator="\n")
+            out.write("\n")
+
+    def check(parsed):
+        parsed = dict(parsed)
+        deviation = max(_max_diff(parsed[title].to_numpy(), table.to_numpy()) for title, table in tables.items()
+                        if title in parsed)
+        return {"ok": list(parsed) == list(tables) and deviation <= 1e-12, "sections": len(parsed),
+                "max_abs_error": deviation}
+
+    return lambda: read_reports(path), check
+
+
+def case_data_parsing(ds):
+    path = os.path.join(ds.folder, "data.csv")
+    ds.data.to_csv(path, index=False)
+
+    def check(parsed):
+        # Columns that fit are stored as float32, within the loader's relative tolerance.
+        values = ds.data.to_numpy()
+        deviation = float(np.max(np.abs(parsed.to_numpy(dtype=float) - values) / np.abs(values)))
+        return {"ok": list(parsed.columns) == list(ds.data.columns) and deviation <= loader.RTOL,
+                "max_rel_error": deviation}
+
+    return lambda: read_data(path), check
+
+
+def case_estimate(ds):
+    pop = ds.population
+    limits = pop.limits()
+
+    def check(result):
+        paths = _max_diff(result.path_coefficients, limits.path_coefficients)
+        loadings = _max_diff(result.outer_loadings, limits.outer_loadings)
+        # PLS is only consistent at large: its limits differ from the true parameters (information only).
+        limit_paths = limits.path_coefficients.to_numpy()[pop.paths != 0]
+        return {"ok": bool(result.converged) and max(paths, loadings) <= ds.tolerance,
+                "path_error": paths, "loading_error": loadings, "tolerance": ds.tolerance,
+                "consistency_bias": float(np.abs(limit_paths - pop.paths[pop.paths != 0]).max())}
+
+    return lambda: pls.estimate(ds.data, pop.spec), check
+
+
+def case_bootstrap(ds):
+    if not ds.resampling:
+        return None
+    spec = ds.population.spec
+
+    def check(result):
+        original = np.array([result.original.path_coefficients.loc[a, b] for a, b in spec.paths])
+        deviation = _max_diff(result.estimates["paths"], original)
+        std = result.draws["paths"].std(axis=0, ddof=1)
+        return {"ok": deviation <= 1e-8 and bool(np.all(std > 0)) and bool(np.all(np.isfinite(std))),
+                "max_abs_error": deviation, "n_boot": ds.n_boot}
+
+    return lambda: bootstrap.bootstrap(ds.data, spec, n_boot=ds.n_boot, n_jobs=1), check
+
+
+def case_htmt(ds):
+    if not ds.resampling:
+        return None
+    spec = ds.population.spec
+    limits = htmt.pairs(htmt.htmt_matrix(ds.population.correlation, spec))
+
+    def check(table):
+        deviation = _max_diff(table["Original sample (O)"], limits.reindex(table.index))
+        return {"ok": deviation <= ds.tolerance, "max_abs_error": deviation, "tolerance": ds.tolerance,
+                "n_boot": ds.n_boot}
+
+    return lambda: htmt.htmt_bootstrap(ds.data, spec, n_boot=ds.n_boot), check
+
+
+def case_fsqca(ds):
+    scores = pls.estimate(ds.data, ds.population.spec).scores
+    calibrated = pd.DataFrame({c: fsqca.calibrate(scores[c], *fsqca.percentile_anchors(scores[c]))
+                               for c in scores.columns})
+    conditions = calibrated.iloc[:, :min(ds.k - 1, MAX_CONDITIONS)]
+    outcome = calibrated.iloc[:, -1]
+
+    def check(table):
+        m = conditions.to_numpy()
+        strong = np.all(m != 0.5, axis=1)
+        codes = (m[strong] > 0.5) @ (1 << np.arange(m.shape[1]))
+        expected = np.bincount(codes, minlength=2 ** m.shape[1])
+        consistency = table["Raw consistency"].dropna()
+        return {"ok": bool(np.array_equal(table["Cases"].to_numpy(), expected))
+                and bool(consistency.between(0, 1).all()),
+                "rows": len(table), "cases": int(table["Cases"].sum())}
+
+    return lambda: fsqca.truth_table(conditions, outcome), check
+
+
+def case_imputation(ds):
+    masked = ds.data.mask(np.random.default_rng(0).random(ds.data.shape) < MISSING_SHARE)
+
+    def check(cleaned):
+        # Population means are 0; imputation must not leave gaps or shift them beyond sampling error.
+        values = cleaned.data.to_numpy(dtype=float)
+        deviation = float(np.abs(values.mean(axis=0)).max())
+        return {"ok": cleaned.converged and not np.isnan(values).any() and deviation <= ds.tolerance,
+                "max_abs_error": deviation, "tolerance": ds.tolerance, "iterations": cleaned.iterations}
+
+    return lambda: screening.clean(masked, "em"), check
+
+
+CASES = {
+    "rules": case_rules,
+    "report_parsing": case_report_parsing,
+    "data_parsing": case_data_parsing,
+    "estimate": case_estimate,
+    "bootstrap": case_bootstrap,
+    "htmt": case_htmt,
+    "fsqca": case_fsqca,
+    "imputation": case_imputation,
+}
+
+
+def measure(work):
+    """Best and median seconds over adaptive repeats, plus the traced peak bytes."""
+    times = []
+    while not times or (sum(times) < MIN_SECONDS and len(times) < MAX_REPEATS):
+        start = time.perf_counter()
+        output = work()
+        times.append(time.perf_counter() - start)
+        del output
+    tracemalloc.start()
+    try:
+        output = work()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"seconds": min(times), "median": float(np.median(times)), "repeats": len(times),
+            "peak_bytes": peak}, output
+
+
+def run(grid, cases=None, n_boot=100, seed=0, report=print):
+    """Results of all ``cases`` (default all) over the sizes of ``grid``, keyed ``case[n,p,k]``."""
+    results = {}
+    for n, p, k in grid:
+        pop = population(k, p, seed)
+        with tempfile.TemporaryDirectory() as folder:
+            ds = Dataset(n, p, k, pop, pop.sample(n), folder, n_boot)
+            for name, case in CASES.items():
+                if cases and name not in cases:
+                    continue
+                key = f"{name}[{n},{p},{k}]"
+                prepared = case(ds)
+                if prepared is None:
+                    report(f"skip {key}")
+                    continue
+                work, check = prepared
+                timing, output = measure(work)
+                results[key] = {"case": name, "n": n, "p": p, "k": k, **timing, "check": check(output)}
+                report(_line(key, results[key]))
+    return results
+
+
+def _line(key, result):
+    status = "ok  " if result["check"]["ok"] else "FAIL"
+    return (f"{status} {key:<32} {result['seconds'] * 1000:10.1f} ms  "
+            f"{result['peak_bytes'] / 2 ** 20:8.1f} MB  ({result['repeats']}x)")
+
+
+def machine():
+    return {"python": platform.python_version(), "numpy": np.__version__, "pandas": pd.__version__,
+            "platform": platform.platform(), "processor": platform.processor(), "cpus": os.cpu_count()}
+
+
+def compare(results, baseline, tolerance):
+    """Keys of the cases slower or larger than in ``baseline`` by more than ``tolerance``."""
+    regressions = []
+    for key, result in results.items():
+        old = baseline["results"].get(key)
+        if old is None:
+            continue
+        slower = result["seconds"] - old["seconds"]
+        larger = result["peak_bytes"] - old["peak_bytes"]
+        if slower > max(tolerance * old["seconds"], MIN_SECONDS_DELTA):
+            regressions.append((key, f"{old['seconds'] * 1000:.1f} -> {result['seconds'] * 1000:.1f} ms"))
+        if larger > max(tolerance * old["peak_bytes"], MIN_BYTES_DELTA):
+            regressions.append((key, f"{old['peak_bytes'] / 2 ** 20:.1f} -> {result['peak_bytes'] / 2 ** 20:.1f} MB"))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--grid", choices=list(GRIDS), default="quick", help="problem sizes (default: quick)")
+    parser.add_argument("--case", action="append", choices=list(CASES), help="run only these cases (repeatable)")
+    parser.add_argument("--boot", type=int, default=100, help="bootstrap subsamples per resampling case")
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.3,
+                        help="allowed relative slowdown or memory growth (default: 0.3)")
+    args = parser.parse_args(argv)
+
+    results = run(GRIDS[args.grid], args.case, args.boot)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as out:
+            json.dump({"grid": args.grid, "n_boot": args.boot, "machine": machine(),
+                       "created": time.strftime("%Y-%m-%d %H:%M:%S"), "results": results}, out, indent=1)
+            out.write("\n")
+
+    failed = [key for key, result in results.items() if not result["check"]["ok"]]
+    regressions = []
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for key, change in regressions:
+            print(f"SLOW {key:<32} {change}")
+    print(f"{len(results)} cases, {len(failed)} failed checks, {len(regressions)} regressions")
+    return 1 if failed or regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,90 @@
+"""Cold-start and rerun budgets of the Streamlit app.
+
+Each page module is imported in a fresh interpreter (after Streamlit itself,
+which every page pays for anyway) and every page is then rendered several
+times with Streamlit's AppTest harness. The script fails if a measurement
+exceeds its budget::
+
+    python benchmarks/startup.py
+
+The same budgets are checked by ``tests/test_startup.py`` with
+``pytest -m perf``.
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "SmartPLS_SEM_Analysis_Guidelines.py")
+sys.path.insert(0, ROOT)
+
+# Seconds for importing each page module on top of Streamlit.
+IMPORT_BUDGETS = {
+    "home": 0.05,
+    "planner": 1.5,
+    "screening": 1.5,
+    "measurement": 1.5,
+    "structural": 1.5,
+    "advanced": 1.5,
+    "bulk_checker": 1.5,
+    "export": 1.5,
+}
+# Seconds for the first render of a page (including its imports) and the median rerun.
+FIRST_RENDER_BUDGET = 3.0
+RERUN_BUDGET = 0.5
+RERUNS = 5
+
+_IMPORT = """
+import time, streamlit
+start = time.perf_counter()
+import smartpls_assistant.ui.{module}
+print(time.perf_counter() - start)
+"""
+
+
+def import_time(module):
+    out = subprocess.run([sys.executable, "-c", _IMPORT.format(module=module)], cwd=ROOT, check=True,
+                         capture_output=True, text=True, env={**os.environ, "PYTHONPATH": ROOT})
+    return float(out.stdout.split()[-1])
+
+
+def render_times(page):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP, default_timeout=60)
+    at.run()
+    at.sidebar.radio[0].set_value(page)
+    times = []
+    for _ in range(RERUNS + 1):
+        start = time.perf_counter()
+        at.run()
+        times.append(time.perf_counter() - start)
+        if at.exception:
+            raise RuntimeError(f"{page}: {at.exception[0].message}")
+    return times[0], statistics.median(times[1:])
+
+
+def main():
+    from smartpls_assistant.ui import PAGES
+
+    failed = []
+
+    def check(label, seconds, budget):
+        ok = seconds <= budget
+        print(f"{'ok  ' if ok else 'SLOW'} {label:<45} {seconds * 1000:8.1f} ms  (budget {budget * 1000:.0f} ms)")
+        if not ok:
+            failed.append(label)
+
+    for module, budget in IMPORT_BUDGETS.items():
+        check(f"import ui.{module}", import_time(module), budget)
+    for page in PAGES:
+        first, rerun = render_times(page)
+        check(f"first render: {page}", first, FIRST_RENDER_BUDGET)
+        check(f"rerun: {page}", rerun, RERUN_BUDGET)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
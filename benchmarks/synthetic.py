@@ -0,0 +1,90 @@
+"""Synthetic PLS-SEM datasets drawn from known population models.
+
+:func:`population` builds a reflective model with ``k`` standardized
+constructs and ``p`` indicators: roughly the first third of the constructs
+are exogenous (correlated 0.3), every other construct is explained by one to
+three earlier constructs, and each indicator loads 0.7-0.9 on its construct.
+The population indicator correlation matrix follows in closed form, so the
+values the PLS algorithm converges to as ``n`` grows (its probability
+limits, which differ from the true parameters by PLS's known consistency
+bias) are :func:`pls.estimate_correlation` of that matrix.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from smartpls_assistant import pls
+from smartpls_assistant.model import ModelSpec
+
+# Largest R² of an endogenous construct; coefficients are shrunk to respect it.
+MAX_R2 = 0.75
+
+
+@dataclass
+class Population:
+    """A population model: the spec plus its true parameters."""
+    spec: ModelSpec
+    paths: np.ndarray
+    loadings: np.ndarray
+    latent: np.ndarray
+    seed: int
+
+    @property
+    def correlation(self):
+        """Population correlation matrix of the indicators (ordered like ``spec.indicators``)."""
+        member = self.spec.membership()
+        lam = member * self.loadings[:, None]
+        R = lam @ self.latent @ lam.T
+        np.fill_diagonal(R, 1.0)
+        return R
+
+    def limits(self, scheme="path"):
+        """PLS estimates at the population correlations (the large-``n`` limits)."""
+        return pls.estimate_correlation(self.correlation, self.spec, scheme)
+
+    def sample(self, n, seed=None):
+        """``n`` observations of the indicators as a DataFrame."""
+        rng = np.random.default_rng(self.seed + 1 if seed is None else seed)
+        k = len(self.latent)
+        eta = rng.standard_normal((n, k)) @ np.linalg.cholesky(self.latent).T
+        block = self.spec.membership().argmax(axis=1)
+        noise = rng.standard_normal((n, len(block)))
+        X = eta[:, block] * self.loadings + noise * np.sqrt(1 - self.loadings ** 2)
+        return pd.DataFrame(X, columns=self.spec.indicators)
+
+
+def population(k, p, seed=0):
+    """Random population model with ``k`` constructs and ``p`` indicators (``p >= 2k``)."""
+    if k < 2 or p < 2 * k:
+        raise ValueError("Need at least two constructs and two indicators per construct.")
+    rng = np.random.default_rng(seed)
+    sizes = np.full(k, p // k)
+    sizes[:p % k] += 1
+    names = [f"C{j + 1}" for j in range(k)]
+    blocks = {c: [f"{c}_{i + 1}" for i in range(size)] for c, size in zip(names, sizes)}
+
+    exogenous = max(1, k // 3)
+    B = np.zeros((k, k))
+    latent = np.eye(k)
+    latent[:exogenous, :exogenous] = 0.3
+    np.fill_diagonal(latent, 1.0)
+    for j in range(exogenous, k):
+        # The previous construct always, and each exogenous one at least once.
+        required = [j - 1] + ([j - exogenous] if j < 2 * exogenous else [])
+        extra = rng.permutation(j)[:rng.integers(0, 4 - len(required))]
+        predictors = np.union1d(required, extra)
+        b = rng.uniform(0.25, 0.5, len(predictors)) * rng.choice([1, 1, 1, -1], len(predictors))
+        S = latent[np.ix_(predictors, predictors)]
+        r2 = b @ S @ b
+        if r2 > MAX_R2:
+            b *= np.sqrt(MAX_R2 / r2)
+        B[predictors, j] = b
+        # Standardized eta_j = b' eta_P + zeta: its correlations with the earlier constructs.
+        latent[j, :j] = latent[:j, :j][:, predictors] @ b
+        latent[:j, j] = latent[j, :j]
+
+    paths = [(names[i], names[j]) for i, j in zip(*np.nonzero(B))]
+    spec = ModelSpec(blocks, paths)
+    loadings = rng.uniform(0.7, 0.9, p)
+    return Population(spec, B, loadings, latent, seed)
@@ -0,0 +1,7 @@
+"""Computation helpers behind the SmartPLS Research Assistant app.
+
+Everything in this package is plain NumPy/pandas so it can be reused outside
+the Streamlit UI. ``python -m smartpls_assistant`` validates a directory of
+SmartPLS report exports from the command line (see :mod:`.cli`). Only the
+:mod:`.ui` subpackage, the pages of the app, imports Streamlit.
+"""
@@ -0,0 +1,5 @@
+"""``python -m smartpls_assistant``: batch validation of report exports."""
+from .cli import main
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,76 @@
+"""Process-pool helpers shared by the resampling engines.
+
+Each worker builds the (large, read-only) task state once through an
+initializer, so jobs only carry small arguments such as seeds or indices.
+"""
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+
+_STATE = None
+
+
+def _init(factory, args):
+    global _STATE
+    _STATE = factory(*args)
+
+
+def _call(func, job):
+    return func(_STATE, *job)
+
+
+def imap(factory, args, func, jobs, n_jobs=None):
+    """Yield ``(index, func(state, *job))`` as jobs finish, ``state = factory(*args)``.
+
+    ``jobs`` may be a lazy iterable: only about two jobs per worker are in
+    flight, so a consumer that stops iterating (e.g. on early stopping)
+    cancels everything not yet started. With ``n_jobs == 1`` jobs run
+    in-process, in order.
+    """
+    jobs = enumerate(jobs)
+    n_jobs = n_jobs or os.cpu_count() or 1
+    if n_jobs == 1:
+        state = factory(*args)
+        for i, job in jobs:
+            yield i, func(state, *job)
+        return
+
+    with ProcessPoolExecutor(n_jobs, initializer=_init, initargs=(factory, args)) as pool:
+        pending = {pool.submit(_call, func, job): i for i, job in islice(jobs, 2 * n_jobs)}
+        try:
+            while pending:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    i = pending.pop(future)
+                    for j, job in islice(jobs, 1):
+                        pending[pool.submit(_call, func, job)] = j
+                    yield i, future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def run(factory, args, func, jobs, n_jobs=None, progress=None, sizes=None, on_result=None):
+    """Return ``[func(state, *job) for job in jobs]``, computed with :func:`imap`.
+
+    ``progress(done, total)`` is called after every job, where each job
+    counts for its entry in ``sizes`` (default 1). ``on_result(i, result)``
+    receives every result as soon as it is available.
+    """
+    jobs = list(jobs)
+    sizes = sizes or [1] * len(jobs)
+    total, done = sum(sizes), 0
+    results = [None] * len(jobs)
+    n_jobs = 1 if len(jobs) <= 1 else min(n_jobs or os.cpu_count() or 1, len(jobs))
+    stream = imap(factory, args, func, jobs, n_jobs)
+    try:
+        for i, result in stream:
+            results[i] = result
+            if on_result:
+                on_result(i, result)
+            done += sizes[i]
+            if progress:
+                progress(done, total)
+    finally:
+        stream.close()
+    return results
@@ -0,0 +1,38 @@
+"""Small statistical helpers (standard normal and chi-square distributions) without SciPy."""
+from statistics import NormalDist
+
+import numpy as np
+
+_NORMAL = NormalDist()
+
+norm_cdf = np.vectorize(_NORMAL.cdf, otypes=[float])
+
+
+def norm_ppf(q):
+    """Standard normal quantile; 0 and 1 map to -inf and +inf."""
+    q = np.asarray(q, dtype=float)
+    out = np.full(q.shape, np.nan)
+    inside = (q > 0) & (q < 1)
+    out[inside] = np.vectorize(_NORMAL.inv_cdf, otypes=[float])(q[inside])
+    out[q == 0] = -np.inf
+    out[q == 1] = np.inf
+    return out
+
+
+def two_tailed_p(t):
+    """Two-tailed p-value of a (large-sample, normal) t statistic."""
+    return 2.0 * (1.0 - norm_cdf(np.abs(t)))
+
+
+def chi2_ppf(q, df):
+    """Chi-square quantile: exact for df 1 and 2, else the Wilson-Hilferty approximation.
+
+    The approximation is within 2% for df >= 3 at the usual tail
+    probabilities (it is up to 3% off for df = 1, hence the exact forms).
+    """
+    q = np.asarray(q, dtype=float)
+    df = np.asarray(df, dtype=float)
+    h = 2.0 / (9.0 * df)
+    out = df * np.maximum(1.0 - h + norm_ppf(q) * np.sqrt(h), 0.0) ** 3
+    out = np.where(df == 1, norm_ppf((1.0 + q) / 2.0) ** 2, out)
+    return np.where(df == 2, -2.0 * np.log1p(-q), out)
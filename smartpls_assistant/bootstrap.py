@@ -0,0 +1,244 @@
+"""Bootstrapping of PLS estimates (path coefficients, loadings and weights).
+
+Subsamples are drawn in fixed-size chunks, each with its own child seed of
+one ``np.random.SeedSequence``, so results are reproducible whatever the
+number of worker processes. A chunk is turned into a stack of resampled
+correlation matrices and re-estimated in one batched call of the PLS
+algorithm; chunks are spread over a process pool. Only the correlations the
+sparse PLS fit reads (within blocks and between connected constructs) are
+formed for each subsample, never a full p x p matrix.
+
+Specific indirect effects are not re-estimated: every draw of a chain
+``IV -> M1 -> ... -> DV`` is the product of the corresponding columns of
+the path coefficient draws, so all of them come from the same pass.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from . import _parallel, pls
+from ._stats import norm_cdf, norm_ppf, two_tailed_p
+from .rules import mediation_type
+
+STATISTICS = ("paths", "loadings", "weights")
+
+# Upper bound for the per-draw arrays one chunk holds at once.
+_CHUNK_BYTES = 64 * 2 ** 20
+# Upper bound for the indicator cross products weighted_entries forms at once.
+_ENTRY_BYTES = 4 * 2 ** 20
+
+
+class _Task:
+    """Everything a worker needs to re-estimate resamples of one dataset."""
+
+    def __init__(self, Z, spec, scheme, tol, max_iter):
+        self.Z = Z
+        self.spec = spec
+        self.scheme = scheme
+        self.tol = tol
+        self.max_iter = max_iter
+        self.structure = pls._Structure(spec)
+
+
+def weighted_entries(Z, counts, rows, cols):
+    """Entries ``(rows, cols)`` of the correlation matrices of ``Z`` with rows weighted by ``counts`` (B, n).
+
+    A bootstrap subsample is a vector of row multiplicities, so this gives
+    the resampled correlations without materializing ``Z[idx]``, and only
+    the T requested entries: O(B n T) instead of O(B n p²).
+    """
+    counts = np.atleast_2d(counts).astype(float)
+    total = counts.sum(axis=1, keepdims=True)
+    mean = counts @ Z / total
+    sd = np.sqrt(counts @ Z ** 2 / total - mean ** 2)
+    out = np.empty((len(counts), len(rows)))
+    step = max(1, _ENTRY_BYTES // (8 * len(Z)))
+    for a in range(0, len(rows), step):
+        r, c = rows[a:a + step], cols[a:a + step]
+        products = Z[:, r]
+        products *= Z[:, c]
+        out[:, a:a + step] = counts @ products / total - mean[:, r] * mean[:, c]
+    return out / (sd[:, rows] * sd[:, cols])
+
+
+def _statistics(r, s, scheme, tol, max_iter):
+    """Re-estimate a stack of correlation entries and extract the statistics.
+
+    ``"converged"`` flags the problems on which the algorithm converged.
+    """
+    w, c, L, _, converged = pls._fit_entries(r, s, scheme, tol, max_iter)
+    B, _ = pls._paths(c, s)
+    return {"paths": B, "loadings": L, "weights": w, "converged": converged}
+
+
+def _run_chunk(task, seed, size):
+    rng = np.random.default_rng(seed)
+    n = len(task.Z)
+    counts = np.stack([np.bincount(rng.integers(0, n, n), minlength=n) for _ in range(size)])
+    s = task.structure
+    r = weighted_entries(task.Z, counts, s.entry_rows, s.entry_cols)
+    return _statistics(r, s, task.scheme, task.tol, task.max_iter)
+
+
+def _jackknife(task, groups):
+    """Grouped (delete-d) jackknife estimates, used for the BCa acceleration."""
+    Z, n, s = task.Z, len(task.Z), task.structure
+    labels = np.arange(n) % groups
+    S, total = Z.T @ Z, Z.sum(axis=0)
+    r = np.empty((groups, len(s.entry_rows)))
+    for g in range(groups):
+        Zg = Z[labels == g]
+        m = n - len(Zg)
+        mean = (total - Zg.sum(axis=0)) / m
+        cov = (S - Zg.T @ Zg) / m - np.outer(mean, mean)
+        sd = np.sqrt(np.diag(cov))
+        r[g] = pls._gather(cov / np.outer(sd, sd), s)
+    return _statistics(r, s, task.scheme, task.tol, task.max_iter)
+
+
+def _indirect(paths, chains):
+    """Specific indirect effects as products of path coefficient columns."""
+    effects = np.ones(paths.shape[:-1] + (len(chains),))
+    for c, chain in enumerate(chains):
+        effects[..., c] = np.prod(paths[..., chain], axis=-1)
+    return effects
+
+
+def _chunk_sizes(n_boot, chunk_size, values):
+    """Split ``n_boot`` draws into chunks, each draw holding ``values`` float64 values."""
+    if chunk_size is None:
+        chunk_size = int(np.clip(_CHUNK_BYTES // (8 * values), 1, 500))
+    sizes = [chunk_size] * (n_boot // chunk_size)
+    if n_boot % chunk_size:
+        sizes.append(n_boot % chunk_size)
+    return sizes
+
+
+@dataclass
+class BootstrapResult:
+    """Bootstrap distributions of the PLS estimates.
+
+    ``draws`` hold the subsamples on which the PLS algorithm converged;
+    ``non_converged`` counts the others, which are left out of every
+    statistic as in SmartPLS.
+    """
+    original: pls.PLSResult
+    n_boot: int
+    seed: int
+    draws: dict
+    estimates: dict
+    jackknife: dict
+    labels: dict
+    non_converged: int = 0
+
+    def summary(self, statistic="paths", level=0.95):
+        """SmartPLS-style table: O, M, STDEV, T, P plus percentile and BCa CIs."""
+        draws, original = self.draws[statistic], self.estimates[statistic]
+        std = draws.std(axis=0, ddof=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = np.abs(original) / std
+        lo, hi = (1 - level) / 2, 1 - (1 - level) / 2
+        percentile = np.quantile(draws, [lo, hi], axis=0)
+        bca = _bca_interval(draws, original, self.jackknife[statistic], lo, hi)
+        return pd.DataFrame({
+            "Original sample (O)": original,
+            "Sample mean (M)": draws.mean(axis=0),
+            "Standard deviation (STDEV)": std,
+            "T statistics (|O/STDEV|)": t,
+            "P values": two_tailed_p(t),
+            f"{lo:.1%}": percentile[0],
+            f"{hi:.1%}": percentile[1],
+            f"BCa {lo:.1%}": bca[0],
+            f"BCa {hi:.1%}": bca[1],
+        }, index=pd.Index(self.labels[statistic], name=statistic.capitalize()))
+
+    def mediation(self, alpha=0.05, level=0.95):
+        """Specific indirect effects with the direct effect and the mediation type.
+
+        Without a direct path ``IV -> DV`` a significant indirect effect
+        counts as full mediation.
+        """
+        indirect = self.summary("indirect", level)
+        paths = self.summary("paths", level)
+        direct = [f"{chain[0]} -> {chain[-1]}" for chain in self.labels["chains"]]
+        direct_p = paths["P values"].reindex(direct).to_numpy()
+        bounds = [f"{(1 - level) / 2:.1%}", f"{1 - (1 - level) / 2:.1%}"]
+        table = indirect[["Original sample (O)", "P values", *bounds]].rename(
+            columns={"Original sample (O)": "Specific indirect effect", "P values": "P values (indirect)"})
+        table["Direct effect"] = paths["Original sample (O)"].reindex(direct).to_numpy()
+        table["P values (direct)"] = direct_p
+        table["Mediation"] = mediation_type(indirect["P values"].to_numpy(), np.nan_to_num(direct_p, nan=1.0), alpha)
+        return table
+
+
+def _bca_interval(draws, original, jack, lo, hi):
+    """Bias-corrected and accelerated percentile interval (Efron, 1987)."""
+    z0 = norm_ppf(np.mean(draws < original, axis=0))
+    diff = jack.mean(axis=0) - jack
+    with np.errstate(divide="ignore", invalid="ignore"):
+        accel = np.sum(diff ** 3, axis=0) / (6.0 * np.sum(diff ** 2, axis=0) ** 1.5)
+    accel = np.nan_to_num(accel)
+    bounds = []
+    for q in (lo, hi):
+        z = z0 + norm_ppf(q)
+        adjusted = norm_cdf(z0 + z / (1 - accel * z))
+        adjusted = np.nan_to_num(adjusted, nan=q)
+        bounds.append([np.quantile(draws[:, m], adjusted[m]) for m in range(draws.shape[1])])
+    return np.array(bounds)
+
+
+def bootstrap(data, spec, n_boot=5000, scheme="path", seed=0, n_jobs=None, chunk_size=None,
+              progress=None, tol=1e-7, max_iter=300, jackknife_groups=100, partial=None):
+    """Bootstrap the PLS model ``spec`` on raw ``data`` with ``n_boot`` subsamples.
+
+    ``n_jobs`` worker processes (default: all CPUs, ``1`` runs in-process)
+    each estimate whole chunks of subsamples at once. ``progress`` is called
+    as ``progress(done, total)`` whenever a chunk finishes and ``partial``
+    with that chunk's path coefficient draws.
+    """
+    original = pls.estimate(data, spec, scheme, tol, max_iter)
+    Z = pls.standardize(data[spec.indicators].to_numpy(dtype=float))
+    task = _Task(Z, spec, scheme, tol, max_iter)
+    # A draw holds its row counts (as integers and floats) and its T entries
+    # with the working arrays _fit_entries derives from them (up to ~5 T),
+    # never a p x p matrix.
+    sizes = _chunk_sizes(n_boot, chunk_size, 2 * len(Z) + 5 * len(task.structure.entry_rows))
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    results = _parallel.run(_Task, (Z, spec, scheme, tol, max_iter), _run_chunk, list(zip(seeds, sizes)),
+                            n_jobs=n_jobs, progress=progress, sizes=sizes,
+                            on_result=(lambda i, chunk: partial(chunk["paths"][chunk["converged"]])) if partial else None)
+
+    s = task.structure
+    items = spec.indicators
+    constructs = spec.constructs
+    labels = {
+        "paths": [f"{a} -> {b}" for a, b in spec.paths],
+        "loadings": [f"{items[h]} <- {constructs[j]}" for h, j in zip(s.items, s.block)],
+        "weights": [f"{items[h]} -> {constructs[j]}" for h, j in zip(s.items, s.block)],
+    }
+    chains = spec.indirect_paths()
+    edge = {path: m for m, path in enumerate(spec.paths)}
+    links = [[edge[a, b] for a, b in zip(chain, chain[1:])] for chain in chains]
+    labels["indirect"] = [" -> ".join(chain) for chain in chains]
+    labels["chains"] = chains
+
+    R = Z.T @ Z / len(Z)
+    # Subsamples on which the algorithm did not converge are left out (as in SmartPLS).
+    converged = np.concatenate([r["converged"] for r in results])
+    draws = {key: np.concatenate([r[key] for r in results])[converged] for key in STATISTICS}
+    estimates = {key: value[0] for key, value in _statistics(pls._gather(R, s)[None], s, scheme, tol, max_iter).items()
+                 if key in STATISTICS}
+    jackknife = _jackknife(task, min(jackknife_groups, len(Z)))
+    for values in (draws, estimates, jackknife):
+        values["indirect"] = _indirect(values["paths"], links)
+    return BootstrapResult(
+        original=original,
+        n_boot=n_boot,
+        seed=seed,
+        draws=draws,
+        estimates=estimates,
+        jackknife=jackknife,
+        labels=labels,
+        non_converged=int(np.count_nonzero(~converged)),
+    )
@@ -0,0 +1,166 @@
+"""Bulk checking of SmartPLS report exports.
+
+Instead of typing one value per form submit, a whole SmartPLS table (Outer
+Loadings, Construct Reliability, HTMT, Collinearity Statistics or Path
+Coefficients) is uploaded and every estimate is classified in a single
+vectorized pass, using the same rules (:mod:`smartpls_assistant.rules`) as
+the interactive checkers. Bootstrapping exports of single-metric reports
+("Outer loadings - Mean, STDEV, T values, p values") are graded on their
+``Original sample (O)`` column only; mean, STDEV, T, p and confidence
+interval columns have no threshold of their own.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from . import loader
+from .rules import FAIL, PASS, WARN, RULES
+
+# Report name -> metric used for every estimate column, or a mapping of
+# (lower-case) column-name fragments -> metric for column-wise reports.
+REPORTS = {
+    "Outer Loadings": "loading",
+    "Construct Reliability": {
+        "alpha": "reliability",
+        "rho": "reliability",
+        "ave": "ave",
+    },
+    "HTMT": "htmt",
+    "Collinearity Statistics (VIF)": "vif",
+    "Path Coefficients (Bootstrapping)": {
+        "p value": "p_value",
+        "p-value": "p_value",
+    },
+}
+
+
+# Lower-case column-name fragments of bootstrap statistics, which are not
+# estimates of the report's metric (confidence bounds are named "2.5%", ...).
+STATISTIC_COLUMNS = ("sample mean", "stdev", "standard deviation", "standard error", "t statistic", "t value",
+                     "p value", "p-value", "bias", "%")
+
+# Lower-case file-name fragments identifying a report, checked in order
+# (SmartPLS names its exports after the table, e.g. "Outer loadings.csv").
+# ``None`` marks tables without thresholds whose names would match later hints.
+NAME_HINTS = (
+    ("cross loading", None),
+    ("htmt", "HTMT"),
+    ("collinearity", "Collinearity Statistics (VIF)"),
+    ("vif", "Collinearity Statistics (VIF)"),
+    ("reliability", "Construct Reliability"),
+    ("loading", "Outer Loadings"),
+    ("path coefficient", "Path Coefficients (Bootstrapping)"),
+    ("path_coefficient", "Path Coefficients (Bootstrapping)"),
+)
+
+
+def classify(values, metric):
+    """Classify an array of values for ``metric`` in one vectorized pass.
+
+    Returns an object array of ``"pass"``/``"warn"``/``"fail"``; missing
+    values (NaN) get an empty string.
+    """
+    return RULES[metric].evaluate(values)
+
+
+def read_report(file, name=None, section=None):
+    """Read a SmartPLS CSV/XLSX export into a DataFrame indexed by row label.
+
+    ``section`` picks one table of a multi-table export (a title or a
+    :class:`~smartpls_assistant.loader.Section`, default the first).
+    Values are read as float64 so that they compare exactly with the
+    thresholds.
+    """
+    return loader.read_table(file, name, section, index_col=0, dtype=np.float64).frame()
+
+
+def read_reports(file, name=None):
+    """Every table of an export as ``(title, DataFrame)`` pairs."""
+    return [(section.title, read_report(file, name, section)) for section in loader.sections(file, name)]
+
+
+def _column_metrics(columns, mapping):
+    """Match each column to a metric using the first fitting name fragment."""
+    metrics = []
+    for column in columns:
+        key = column.lower().strip()
+        metric = next((m for fragment, m in mapping.items() if fragment in key), None)
+        metrics.append(metric)
+    return metrics
+
+
+def estimate_columns(columns):
+    """Boolean mask of the columns holding estimates rather than bootstrap statistics."""
+    return np.array([not any(fragment in str(column).lower() for fragment in STATISTIC_COLUMNS)
+                     for column in columns], dtype=bool)
+
+
+def _fits(report, table):
+    """Whether ``table`` has a column a column-wise ``report`` checks (always true without a table)."""
+    layout = REPORTS[report]
+    return table is None or isinstance(layout, str) or any(_column_metrics(table.columns, layout))
+
+
+def detect_report(name, table=None):
+    """Guess which report a file holds from its name, then from its columns.
+
+    A column-wise report is only detected when ``table`` has one of its
+    columns, so a PLS-algorithm "Path coefficients" table (no p values) is
+    not taken for the bootstrapping report. Returns a key of
+    :data:`REPORTS`, or ``None`` if the report is unknown.
+    """
+    lower = os.path.basename(str(name)).lower()
+    for fragment, report in NAME_HINTS:
+        if fragment in lower:
+            return report if report is None or _fits(report, table) else None
+    if table is not None:
+        for report, layout in REPORTS.items():
+            if isinstance(layout, dict) and any(_column_metrics(table.columns, layout)):
+                return report
+    return None
+
+
+def classify_report(table, report):
+    """Classify every estimate of a SmartPLS ``report`` table.
+
+    Returns a DataFrame of statuses with the same shape as ``table``. Cells
+    that are empty, non-numeric, bootstrap statistics (see
+    :data:`STATISTIC_COLUMNS`) or in columns without a threshold get ``""``.
+    """
+    values = table.apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+    layout = REPORTS[report]
+    if isinstance(layout, str):
+        statuses = np.full(values.shape, "", dtype=object)
+        cols = estimate_columns(table.columns)
+        statuses[:, cols] = classify(values[:, cols], layout)
+    else:
+        statuses = np.full(values.shape, "", dtype=object)
+        metrics = np.array(_column_metrics(table.columns, layout), dtype=object)
+        for metric in set(metrics) - {None}:
+            cols = metrics == metric
+            statuses[:, cols] = classify(values[:, cols], metric)
+    return pd.DataFrame(statuses, index=table.index, columns=table.columns)
+
+
+def summarize(statuses):
+    """Count pass/warn/fail cells of a status DataFrame."""
+    flat = statuses.to_numpy().ravel()
+    return {status: int(np.count_nonzero(flat == status)) for status in (PASS, WARN, FAIL)}
+
+
+def verdict(counts):
+    """Overall status of a report: its worst cell (``""`` if nothing was checked)."""
+    return next((status for status in (FAIL, WARN, PASS) if counts.get(status)), "")
+
+
+def flagged(table, statuses):
+    """Long table of the cells that did not pass (row, column, value, status)."""
+    mask = statuses.isin([WARN, FAIL]).to_numpy()
+    rows, cols = np.nonzero(mask)
+    return pd.DataFrame({
+        "Row": table.index[rows],
+        "Column": table.columns[cols],
+        "Value": pd.to_numeric(table.to_numpy()[rows, cols], errors="coerce"),
+        "Status": statuses.to_numpy()[rows, cols],
+    })
@@ -0,0 +1,257 @@
+"""Content-addressed result cache with an LRU memory budget and disk spill.
+
+Entries are keyed by a hash of their inputs (uploaded file content, model
+syntax, algorithm settings), so identical work is shared by every session
+of a server process. Memory use is tracked per entry (NumPy/pandas buffers
+counted exactly, containers and dataclasses recursively) and the least
+recently used entries are evicted once the budget is exceeded. With a spill
+directory every entry is also pickled to disk, so evicted results and
+results from before a server restart are reloaded instead of recomputed.
+
+Cached values are shared objects: callers must treat them as read-only.
+"""
+import dataclasses
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import nullcontext, suppress
+
+import numpy as np
+import pandas as pd
+
+from . import profiling
+
+MISSING = object()
+
+# Seconds between ``waiting`` callbacks while another thread computes the same key.
+_POLL = 0.1
+
+
+def _token(part):
+    if isinstance(part, pd.DataFrame):
+        from .data import dataset_hash
+        return f"df:{dataset_hash(part)}"
+    if isinstance(part, np.ndarray):
+        return f"nd:{part.dtype}:{part.shape}:{hashlib.sha1(np.ascontiguousarray(part).tobytes()).hexdigest()}"
+    if isinstance(part, (list, tuple)):
+        return "(" + ",".join(_token(p) for p in part) + ")"
+    return repr(part)
+
+
+def key(*parts):
+    """Stable hex key for strings, numbers, tuples, arrays and DataFrames."""
+    return hashlib.sha1("\x1f".join(_token(p) for p in parts).encode()).hexdigest()
+
+
+def file_hash(file):
+    """SHA-1 of an uploaded file's bytes (the stream position is restored)."""
+    if hasattr(file, "getvalue"):
+        return hashlib.sha1(file.getvalue()).hexdigest()
+    position = file.tell()
+    file.seek(0)
+    digest = hashlib.sha1()
+    for block in iter(lambda: file.read(2 ** 20), b""):
+        digest.update(block)
+    file.seek(position)
+    return digest.hexdigest()
+
+
+def sizeof(value, _seen=None):
+    """Approximate memory footprint of ``value`` in bytes."""
+    seen = set() if _seen is None else _seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(deep=True, index=True)
+        return int(usage.sum() if isinstance(value, pd.DataFrame) else usage)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(sizeof(k, seen) + sizeof(v, seen) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(sizeof(v, seen) for v in value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return sys.getsizeof(value) + sum(sizeof(getattr(value, f.name), seen) for f in dataclasses.fields(value))
+    return sys.getsizeof(value)
+
+
+class ResultCache:
+    """Thread-safe LRU cache of computed results within ``max_bytes``.
+
+    ``spill_dir`` enables the on-disk copy, pruned to ``max_disk_bytes`` by
+    last access (together with any ``.npy`` conversions stored there by
+    :func:`smartpls_assistant.loader.load`). Concurrent requests for the same missing key compute it
+    only once.
+    """
+
+    def __init__(self, max_bytes=512 * 2 ** 20, spill_dir=None, max_disk_bytes=4 * 2 ** 30):
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self.max_disk_bytes = max_disk_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self._pending = {}
+        self._stats = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, k):
+        return k in self._entries or bool(self.spill_dir and os.path.exists(self._path(k)))
+
+    def _path(self, k):
+        return os.path.join(self.spill_dir, f"{k}.pkl")
+
+    def get(self, k, default=MISSING):
+        with self._lock:
+            if k in self._entries:
+                self._entries.move_to_end(k)
+                self._stats["hits"] += 1
+                return self._entries[k][0]
+        value = self._load(k)
+        if value is MISSING:
+            with self._lock:
+                self._stats["misses"] += 1
+            return default
+        with self._lock:
+            self._stats["disk_hits"] += 1
+        self._remember(k, value)
+        return value
+
+    def put(self, k, value):
+        self._remember(k, value)
+        self._spill(k, value)
+        return value
+
+    def get_or_compute(self, k, compute, *args, waiting=None, **kwargs):
+        """Cached ``compute(*args, **kwargs)``, computed at most once at a time per key.
+
+        While another thread computes the same key, ``waiting()`` is called
+        every ``_POLL`` seconds; it may raise to stop waiting (a cancelled
+        job does).
+        """
+        value = self.get(k)
+        if value is not MISSING:
+            return value
+        with self._lock:
+            lock = self._pending.setdefault(k, threading.Lock())
+        while not lock.acquire(timeout=_POLL):
+            if waiting:
+                waiting()
+        try:
+            value = self.get(k)
+            if value is MISSING:
+                value = self.put(k, compute(*args, **kwargs))
+        finally:
+            lock.release()
+            with self._lock:
+                self._pending.pop(k, None)
+        return value
+
+    def clear(self, disk=False):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if disk and self.spill_dir:
+            for name in os.listdir(self.spill_dir):
+                if name.endswith((".pkl", ".npy")):
+                    os.remove(os.path.join(self.spill_dir, name))
+
+    def stats(self):
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries), "bytes": self._bytes, "max_bytes": self.max_bytes}
+
+    def _remember(self, k, value):
+        size = sizeof(value)
+        with self._lock:
+            if k in self._entries:
+                self._bytes -= self._entries.pop(k)[1]
+            self._entries[k] = (value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes and self._entries:
+                _, (_, dropped) = self._entries.popitem(last=False)
+                self._bytes -= dropped
+                self._stats["evictions"] += 1
+
+    def _load(self, k):
+        if not self.spill_dir:
+            return MISSING
+        path = self._path(k)
+        try:
+            with open(path, "rb") as fh:
+                value = pickle.load(fh)
+            os.utime(path)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return MISSING
+        return value
+
+    def _spill(self, k, value):
+        if not self.spill_dir:
+            return
+        tmp = None
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.spill_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as fh:
+                pickle.dump(value, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path(k))
+        except (OSError, pickle.PicklingError, AttributeError, TypeError):
+            if tmp and os.path.exists(tmp):
+                os.remove(tmp)
+            return
+        self._prune()
+
+    def _prune(self):
+        files = []
+        for name in os.listdir(self.spill_dir):
+            if name.endswith((".pkl", ".npy")):
+                path = os.path.join(self.spill_dir, name)
+                with suppress(OSError):
+                    info = os.stat(path)
+                    files.append((info.st_mtime, info.st_size, path))
+        total = 0
+        for _, size, path in sorted(files, reverse=True):
+            total += size
+            if total > self.max_disk_bytes:
+                with suppress(OSError):
+                    os.remove(path)
+
+
+def memoize(get_cache, around=None, waiting=None):
+    """Decorator caching a function in ``get_cache()`` like ``st.cache_data``.
+
+    Arguments whose parameter name starts with ``_`` are not part of the
+    key (pass data already identified by a hash argument that way).
+    ``around`` returns a context manager entered only when computing, e.g.
+    a spinner. ``waiting(*args)`` is called while an identical call computes
+    in another thread, so that a cancelled job can stop waiting for it. Hits, misses and computation times are reported to
+    :mod:`smartpls_assistant.profiling`.
+    """
+    def decorate(func):
+        names = list(inspect.signature(func).parameters)
+        label = func.__name__.removeprefix("cached_")
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            k = key(func.__qualname__, *[a for n, a in zip(names, args) if not n.startswith("_")])
+            cache = get_cache()
+            value = cache.get(k)
+            if value is not MISSING:
+                profiling.count("cache hits")
+                return value
+            profiling.count("cache misses")
+            with around() if around else nullcontext(), profiling.span(label, "computation"):
+                return cache.get_or_compute(k, func, *args, waiting=waiting and (lambda: waiting(*args)))
+
+        return wrapper
+
+    return decorate
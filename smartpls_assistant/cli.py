@@ -0,0 +1,171 @@
+"""Command-line batch validation of SmartPLS report exports.
+
+Walks a directory of exported tables (CSV/XLSX), classifies every file with
+the bulk checker (:mod:`smartpls_assistant.bulk`) in worker processes and
+writes one consolidated verdict report::
+
+    python -m smartpls_assistant exports/ -o verdicts.json
+    python -m smartpls_assistant exports/ -o verdicts.csv --jobs 8
+
+Every table of a file (worksheets, titled sections) is checked; its report
+type is detected from the sheet or section title or the file name (``Outer
+loadings.csv``, ``Discriminant validity - HTMT.csv``, ...) or its columns,
+or forced with ``--report``. Files are sent to the workers in batches, so
+process overhead is paid per batch rather than per file. The exit status
+is 1 if any report fails a threshold, cannot be read or has nothing to
+check, else 0.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+
+from . import _parallel, bulk
+from .rules import FAIL, PASS, WARN
+
+EXTENSIONS = (".csv", ".txt", ".xlsx", ".xls")
+ERROR = "error"
+# Verdict of a readable table in which no value has a threshold: not a pass.
+UNCHECKED = "unchecked"
+# Per-table columns of the CSV report (the JSON report also lists flagged cells).
+FIELDS = ("file", "section", "report", "verdict", "cells", PASS, WARN, FAIL, "error")
+
+
+def find_exports(root, extensions=EXTENSIONS, exclude=()):
+    """Sorted paths of all export files below ``root`` (hidden entries skipped)."""
+    exclude = {os.path.abspath(path) for path in exclude}
+    found = []
+    for folder, dirs, files in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        for name in sorted(files):
+            path = os.path.join(folder, name)
+            if name.lower().endswith(extensions) and not name.startswith((".", "~$")) \
+                    and os.path.abspath(path) not in exclude:
+                found.append(path)
+    return found
+
+
+def _record(path, root, report, section=""):
+    return {"file": os.path.relpath(path, root) if root else path, "section": section, "report": report or "",
+            "verdict": ERROR, "cells": 0, PASS: 0, WARN: 0, FAIL: 0, "error": "", "flagged": []}
+
+
+def check_file(path, report=None, root=None):
+    """Verdict records of one export file, one per recognized table.
+
+    Multi-table exports (sheets, titled sections) are split with
+    :func:`smartpls_assistant.loader.sections`; tables of an unknown type
+    are skipped, and a file without any known table is one error record.
+    A table in which no value could be checked is :data:`UNCHECKED`.
+    Errors are recorded, not raised.
+    """
+    try:
+        tables = bulk.read_reports(path)
+    except Exception as exc:  # one unreadable export must not abort the batch
+        record = _record(path, root, report)
+        record["error"] = f"{type(exc).__name__}: {exc}"
+        return [record]
+    records = []
+    for title, table in tables:
+        kind = report or bulk.detect_report(title, table) or (len(tables) == 1 and bulk.detect_report(path, table))
+        if not kind:
+            continue
+        record = _record(path, root, kind, title if len(tables) > 1 else "")
+        statuses = bulk.classify_report(table, kind)
+        counts = bulk.summarize(statuses)
+        record.update(counts, verdict=bulk.verdict(counts) or UNCHECKED, cells=sum(counts.values()))
+        if not record["cells"]:
+            record["error"] = "no value with a threshold was found (wrong --report?)"
+        record["flagged"] = bulk.flagged(table, statuses).to_dict("records")
+        records.append(record)
+    if not records:
+        record = _record(path, root, report)
+        record["error"] = "no table of a known report type (use --report)"
+        records.append(record)
+    return records
+
+
+def _settings(report, root):
+    return {"report": report, "root": root}
+
+
+def _check_batch(settings, paths):
+    return [record for path in paths for record in check_file(path, settings["report"], settings["root"])]
+
+
+def check_all(paths, report=None, root=None, n_jobs=None, batch=64, progress=None):
+    """Verdict records of all ``paths``, in order, checked in ``batch``-sized jobs."""
+    batches = [paths[i:i + batch] for i in range(0, len(paths), batch)]
+    results = _parallel.run(_settings, (report, root), _check_batch, [(b,) for b in batches],
+                            n_jobs, progress, [len(b) for b in batches])
+    return [record for records in results for record in records]
+
+
+def summary(records):
+    """Number of tables per verdict."""
+    counts = dict.fromkeys((PASS, WARN, FAIL, UNCHECKED, ERROR), 0)
+    for record in records:
+        counts[record["verdict"]] += 1
+    return counts
+
+
+def write_json(records, out, root=None):
+    report = {"root": root, "files": len({r["file"] for r in records}), "tables": len(records), "summary": summary(records), "reports": records}
+    json.dump(report, out, indent=1, default=str)
+    out.write("\n")
+
+
+def write_csv(records, out):
+    writer = csv.DictWriter(out, FIELDS, extrasaction="ignore", lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(records)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m smartpls_assistant",
+        description="Validate a directory of SmartPLS report exports against the Hair et al. (2019) thresholds.")
+    parser.add_argument("root", help="directory (searched recursively) or a single export file")
+    parser.add_argument("-o", "--output", default="-",
+                        help="report file, .json or .csv (default: JSON on standard output)")
+    parser.add_argument("--report", choices=list(bulk.REPORTS), help="treat every file as this report")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: all CPUs)")
+    parser.add_argument("--batch", type=int, default=64, help="files per worker job (default: 64)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="no progress on standard error")
+    args = parser.parse_args(argv)
+
+    if os.path.isfile(args.root):
+        paths, root = [args.root], os.path.dirname(args.root) or "."
+    elif os.path.isdir(args.root):
+        root = args.root
+        paths = find_exports(root, exclude=[args.output] if args.output != "-" else [])
+    else:
+        parser.error(f"{args.root} does not exist")
+
+    def progress(done, total):
+        print(f"\rChecked {done:,} / {total:,} files", end="", file=sys.stderr, flush=True)
+
+    start = time.perf_counter()
+    records = check_all(paths, args.report, root, args.jobs, max(1, args.batch),
+                        None if args.quiet else progress)
+    elapsed = time.perf_counter() - start
+
+    as_csv = args.output.lower().endswith(".csv")
+    if args.output == "-":
+        write_json(records, sys.stdout, root)
+    else:
+        with open(args.output, "w", newline="" if as_csv else None, encoding="utf-8") as out:
+            if as_csv:
+                write_csv(records, out)
+            else:
+                write_json(records, out, root)
+
+    counts = summary(records)
+    if not args.quiet:
+        rate = len(paths) / elapsed * 60 if elapsed else 0
+        print(f"\r{len(paths):,} files in {elapsed:.1f} s ({rate:,.0f} per minute); tables: "
+              + ", ".join(f"{n:,} {status}" for status, n in counts.items()), file=sys.stderr)
+    return 1 if counts[FAIL] or counts[UNCHECKED] or counts[ERROR] else 0
+
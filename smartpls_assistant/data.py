@@ -0,0 +1,29 @@
+"""Reading raw indicator data for the estimation engines."""
+import hashlib
+
+import pandas as pd
+
+from .loader import load, whole
+
+
+def read_data(file, name=None, cache_dir=None, key=None):
+    """Read a raw data file (CSV/XLSX, one column per indicator) into a DataFrame.
+
+    Non-numeric columns (e.g. respondent IDs or group labels) are kept as-is;
+    the estimation functions only select the indicator columns they need.
+    Rows of empty cells are kept as missing values, not read as section
+    breaks. The file is streamed by :mod:`smartpls_assistant.loader`:
+    numeric columns share one float32 block where precision allows. With
+    ``cache_dir`` the block is converted once and memory-mapped (``key``
+    identifies the content of file objects).
+    """
+    data = load(file, name, whole(file, name), cache_dir=cache_dir, key=key).frame()
+    data.columns = data.columns.map(lambda c: str(c).strip())
+    return data
+
+
+def dataset_hash(data):
+    """Stable content hash of a DataFrame (values, index and column names)."""
+    digest = hashlib.sha1(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    digest.update("\x1f".join(map(str, data.columns)).encode())
+    return digest.hexdigest()
@@ -0,0 +1,276 @@
+"""Fuzzy-set QCA: direct calibration, truth table and Boolean minimization.
+
+A configuration of ``k`` conditions is an integer bitmask (bit ``j`` set =
+condition ``j`` present), so truth-table row ``r`` is simply index ``r`` of
+every array. The row sums behind consistency never materialize the
+(cases x 2^k) membership matrix: with ``low_j = min(m_j, 1 - m_j)``, a case's
+membership in a row that differs from its best-fit row in the conditions
+``D`` is ``min(low_j for j in D)``. Sorting ``low`` per case splits the
+hypercube into ``k`` subcubes of constant membership (plus the best-fit row),
+so every case adds ``k + 1`` constants into a ternary (0 / 1 / free) array
+of size 3^k, which is expanded to the ``2^k`` rows at the end:
+O(n k log k + k 3^k) instead of O(n 2^k).
+
+Implicants are ``(value, mask)`` pairs of bitmasks (``mask`` marks the
+eliminated conditions). Quine-McCluskey merging is vectorized with a sorted
+search for the partner of every term and bit; the prime implicant chart is
+then covered by the essential implicants plus a greedy choice, preferring
+shorter terms.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+SOLUTIONS = ("complex", "intermediate", "parsimonious")
+
+# Upper bound for the subcube index arrays of one block of cases.
+_BLOCK_BYTES = 32 * 2 ** 20
+
+
+def calibrate(x, full_out, crossover, full_in):
+    """Direct method (Ragin, 2008): log odds of +-3 at the full anchors."""
+    x = np.asarray(x, dtype=float)
+    if not (full_out < crossover < full_in or full_out > crossover > full_in):
+        raise ValueError("The crossover must lie between the full non-membership and full membership anchors.")
+    deviation = x - crossover
+    scale = np.where(deviation * np.sign(full_in - crossover) >= 0, full_in - crossover, crossover - full_out)
+    return 1 / (1 + np.exp(-3 * deviation / scale))
+
+
+def percentile_anchors(x, q=(5, 50, 95)):
+    """Full non-membership, crossover and full membership anchors from percentiles."""
+    return tuple(np.percentile(np.asarray(x, dtype=float), q))
+
+
+def _expand(T, k):
+    """Sum a ternary (0 / 1 / free) array of subcube constants into the 2^k rows."""
+    T = T.reshape((3,) * k) if k else T
+    for axis in range(k):
+        fixed, free = np.split(T, [2], axis=axis)
+        T = fixed + free
+    return T.reshape(-1)
+
+
+def _row_sums(m, weights):
+    """``sum_i min(membership_i(r), w_i)`` for every row ``r`` and weight vector ``w``.
+
+    Memberships are never formed: each case contributes to one subcube per
+    condition (ordered by ``low``) and to its best-fit row.
+    """
+    n, k = m.shape
+    low = np.minimum(m, 1 - m)
+    best = (m > 0.5).astype(np.int64)
+    order = np.argsort(low, axis=1)
+    low = np.take_along_axis(low, order, axis=1)
+    bits = np.take_along_axis(best, order, axis=1)
+    place = 3 ** order
+    # The first t sorted conditions fixed at the best-fit value, condition t flipped, the rest free.
+    fixed = np.cumsum((bits - 2) * place, axis=1) - (bits - 2) * place
+    index = (3 ** k - 1) + fixed + (1 - bits - 2) * place
+    corner = best @ 3 ** np.arange(k)
+    value = np.concatenate([low, 1 - low[:, -1:]], axis=1)
+    index = np.concatenate([index, corner[:, None]], axis=1).ravel()
+    return [_expand(np.bincount(index, np.minimum(value, w[:, None]).ravel(), minlength=3 ** k), k) for w in weights]
+
+
+def truth_table(conditions, outcome, frequency=1, consistency=0.8, pri=None):
+    """Truth table with all ``2^k`` configurations, indexed by their bitmask.
+
+    ``conditions`` holds calibrated memberships (one column per condition).
+    A row is positive (``Outcome`` 1) if at least ``frequency`` cases are
+    more in than out of it and its raw (and, if given, PRI) consistency
+    reaches the thresholds; rows below ``frequency`` are remainders (NaN).
+    """
+    m = conditions.to_numpy(dtype=float)
+    y = np.asarray(outcome, dtype=float)
+    n, k = m.shape
+    if np.isnan(m).any() or np.isnan(y).any():
+        raise ValueError("The calibrated data contain missing values.")
+    rows = 2 ** k
+    total, hits, both = np.zeros(rows), np.zeros(rows), np.zeros(rows)
+    block = max(1, _BLOCK_BYTES // (8 * (k + 1)))
+    for start in range(0, n, block):
+        mb, yb = m[start:start + block], y[start:start + block]
+        t, h, b = _row_sums(mb, (np.ones(len(mb)), yb, np.minimum(yb, 1 - yb)))
+        total += t
+        hits += h
+        both += b
+
+    strong = np.all(m != 0.5, axis=1)
+    codes = (m[strong] > 0.5) @ (1 << np.arange(k))
+    cases = np.bincount(codes, minlength=rows)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        raw = hits / total
+        pri_consistency = (hits - both) / (total - both)
+    positive = raw >= consistency
+    if pri is not None:
+        positive &= pri_consistency >= pri
+    table = pd.DataFrame(((np.arange(rows)[:, None] >> np.arange(k)) & 1), columns=conditions.columns)
+    table["Cases"] = cases
+    table["Raw consistency"] = raw
+    table["PRI consistency"] = pri_consistency
+    table["Outcome"] = np.where(cases >= frequency, positive.astype(float), np.nan)
+    table.index.name = "Configuration"
+    return table
+
+
+def _prime_implicants(minterms, k):
+    """Quine-McCluskey prime implicants of ``minterms`` as (values, masks)."""
+    values = np.unique(np.asarray(minterms, dtype=np.int64))
+    masks = np.zeros_like(values)
+    primes_v, primes_m = [], []
+    while len(values):
+        keys = (masks << k) | values
+        order = np.argsort(keys)
+        sorted_keys = keys[order]
+        merged = np.zeros(len(values), dtype=bool)
+        new_v, new_m = [], []
+        for b in range(k):
+            bit = 1 << b
+            candidate = np.flatnonzero((masks & bit == 0) & (values & bit == 0))
+            partner = (masks[candidate] << k) | values[candidate] | bit
+            pos = np.minimum(np.searchsorted(sorted_keys, partner), len(keys) - 1)
+            found = sorted_keys[pos] == partner
+            merged[candidate[found]] = True
+            merged[order[pos[found]]] = True
+            new_v.append(values[candidate[found]])
+            new_m.append(masks[candidate[found]] | bit)
+        primes_v.append(values[~merged])
+        primes_m.append(masks[~merged])
+        keys = np.unique((np.concatenate(new_m) << k) | np.concatenate(new_v))
+        values, masks = keys & ((1 << k) - 1), keys >> k
+    return np.concatenate(primes_v), np.concatenate(primes_m)
+
+
+def _cover(values, masks, minterms, k):
+    """Essential implicants plus a greedy cover of the remaining minterms."""
+    minterms = np.asarray(minterms, dtype=np.int64)
+    chart = (minterms[None, :] & ~masks[:, None]) == values[:, None]
+    literals = k - np.array([bin(mask).count("1") for mask in masks])
+    selected = set()
+    single = chart.sum(axis=0) == 1
+    for t in np.flatnonzero(single):
+        selected.add(int(np.flatnonzero(chart[:, t])[0]))
+    uncovered = ~chart[list(selected)].any(axis=0) if selected else np.ones(len(minterms), dtype=bool)
+    while uncovered.any():
+        gain = chart[:, uncovered].sum(axis=1)
+        best = int(np.lexsort((literals, -gain))[0])
+        selected.add(best)
+        uncovered &= ~chart[best]
+    chosen = sorted(selected, key=lambda i: (literals[i], values[i]))
+    return values[chosen], masks[chosen]
+
+
+def _intermediate(complex_terms, parsimonious_terms, primes, expectations, k):
+    """Ragin & Sonnett (2005): drop only literals that contradict the expectations.
+
+    Each complex term keeps the literals of a parsimonious term that contains
+    it (from the parsimonious solution if possible, else any prime implicant)
+    plus its own literals that agree with ``expectations`` (1 present,
+    0 absent, -1 none, in which case the literal is kept).
+    """
+    full = (1 << k) - 1
+    expect_present = sum(1 << j for j, e in enumerate(expectations) if e == 1)
+    expect_absent = sum(1 << j for j, e in enumerate(expectations) if e == 0)
+    terms = set()
+    for value, mask in zip(*complex_terms):
+        care = full & ~mask
+        agree = care & ~((value & expect_absent) | (~value & expect_present))
+        for candidates in (parsimonious_terms, primes):
+            containing = [full & ~p_mask for p_value, p_mask in zip(*candidates)
+                          if not (full & ~p_mask) & ~care and value & ~p_mask & full == p_value]
+            if containing:
+                break
+        for p_care in containing:
+            keep = p_care | agree
+            terms.add((int(value & keep), int(full & ~keep)))
+    values, masks = (np.array(x, dtype=np.int64) for x in zip(*sorted(terms)))
+    return values, masks
+
+
+def _term_membership(m, value, mask):
+    care = [j for j in range(m.shape[1]) if not mask >> j & 1]
+    if not care:
+        return np.ones(len(m))
+    return np.min([m[:, j] if value >> j & 1 else 1 - m[:, j] for j in care], axis=0)
+
+
+def term_label(value, mask, names):
+    """fsQCA notation of an implicant, e.g. ``A*~B*D``."""
+    parts = [name if value >> j & 1 else f"~{name}" for j, name in enumerate(names) if not mask >> j & 1]
+    return "*".join(parts) or "1"
+
+
+@dataclass
+class Solution:
+    """One solution formula with the usual fsQCA parameters of fit."""
+    kind: str
+    terms: pd.DataFrame
+    consistency: float
+    coverage: float
+
+    @property
+    def formula(self):
+        return " + ".join(self.terms.index) or "(no solution)"
+
+
+def _solution(kind, values, masks, m, y, names):
+    memberships = np.array([_term_membership(m, v, mk) for v, mk in zip(values, masks)]).reshape(len(values), len(m))
+    hits = np.minimum(memberships, y).sum(axis=1)
+    solution = memberships.max(axis=0, initial=0)
+    solution_hits = np.minimum(solution, y).sum()
+    unique = np.empty(len(values))
+    for i in range(len(values)):
+        others = np.delete(memberships, i, axis=0).max(axis=0, initial=0)
+        unique[i] = solution_hits - np.minimum(others, y).sum()
+    terms = pd.DataFrame({
+        "Raw coverage": hits / y.sum(),
+        "Unique coverage": unique / y.sum(),
+        "Consistency": hits / memberships.sum(axis=1),
+    }, index=pd.Index([term_label(v, mk, names) for v, mk in zip(values, masks)], name="Configuration"))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        consistency = solution_hits / solution.sum()
+    return Solution(kind, terms, float(consistency), float(solution_hits / y.sum()))
+
+
+@dataclass
+class FsQCAResult:
+    """Truth table and the complex, intermediate and parsimonious solutions."""
+    truth_table: pd.DataFrame
+    solutions: dict
+
+    @property
+    def observed(self):
+        """Truth-table rows with at least one case, the usual report view."""
+        table = self.truth_table[self.truth_table["Cases"] > 0]
+        return table.sort_values(["Outcome", "Raw consistency"], ascending=False)
+
+
+def fsqca(conditions, outcome, frequency=1, consistency=0.8, pri=None, expectations=None):
+    """Truth table and solutions for calibrated ``conditions`` and ``outcome``.
+
+    ``expectations`` lists the directional expectation per condition (1
+    present, 0 absent, -1 none) for the intermediate solution; by default
+    every condition is expected to contribute by its presence.
+    """
+    names = list(conditions.columns)
+    k = len(names)
+    if not 1 <= k <= 14:
+        raise ValueError("fsQCA needs between 1 and 14 conditions.")
+    table = truth_table(conditions, outcome, frequency, consistency, pri)
+    positive = np.flatnonzero(table["Outcome"].to_numpy() == 1)
+    remainders = np.flatnonzero(table["Outcome"].isna().to_numpy())
+    m, y = conditions.to_numpy(dtype=float), np.asarray(outcome, dtype=float)
+    if not len(positive):
+        empty = (np.array([], dtype=np.int64), np.array([], dtype=np.int64))
+        return FsQCAResult(table, {kind: _solution(kind, *empty, m, y, names) for kind in SOLUTIONS})
+
+    complex_terms = _cover(*_prime_implicants(positive, k), positive, k)
+    primes = _prime_implicants(np.concatenate([positive, remainders]), k)
+    parsimonious_terms = _cover(*primes, positive, k)
+    expectations = [1] * k if expectations is None else list(expectations)
+    candidates = _intermediate(complex_terms, parsimonious_terms, primes, expectations, k)
+    intermediate_terms = _cover(*candidates, positive, k)
+    terms = {"complex": complex_terms, "intermediate": intermediate_terms, "parsimonious": parsimonious_terms}
+    return FsQCAResult(table, {kind: _solution(kind, *terms[kind], m, y, names) for kind in SOLUTIONS})
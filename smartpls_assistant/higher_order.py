@@ -0,0 +1,99 @@
+"""Two-stage estimation of higher-order constructs.
+
+The repeated indicators approach estimates a higher-order construct in one
+model: its block holds all indicators of its lower-order constructs (see
+:mod:`.model`). The two-stage approaches (Becker et al., 2012; Sarstedt et
+al., 2019) use lower-order construct scores from a first stage as the
+higher-order construct's indicators in a second stage:
+
+* ``"embedded"``: stage one is the repeated indicators model;
+* ``"disjoint"``: stage one leaves the higher-order constructs out and
+  links their lower-order constructs directly to the constructs the
+  higher-order construct is related to.
+
+Stage two drops the lower-order constructs and measures each higher-order
+construct (reflective ``=~`` or formative ``<~``, as specified) by their
+scores. Only second-order constructs are supported, and structural paths
+must run through the higher-order construct, not its lower-order parts.
+"""
+from dataclasses import dataclass
+
+import pandas as pd
+
+from . import pls
+from .model import ModelSpec
+
+APPROACHES = ("embedded", "disjoint")
+
+
+def _lower_order(spec):
+    """Lower-order constructs of the spec, checked for two-stage estimation."""
+    if not spec.higher_order:
+        raise ValueError("The model has no higher-order constructs.")
+    for construct, lower in spec.higher_order.items():
+        nested = [c for c in lower if c in spec.higher_order]
+        if nested:
+            raise ValueError(f"Two-stage estimation supports second-order constructs only; '{construct}' contains '{nested[0]}'.")
+    lower = {c for parts in spec.higher_order.values() for c in parts}
+    implied = set(spec.higher_order_paths())
+    for a, b in spec.paths:
+        if (a, b) not in implied and (a in lower or b in lower):
+            raise ValueError(f"Path {a} -> {b} uses a lower-order construct; connect its higher-order construct instead.")
+    return lower
+
+
+def disjoint_spec(spec):
+    """Stage-one model of the disjoint approach.
+
+    The higher-order constructs are removed and every structural path of
+    one is replaced by paths of each of its lower-order constructs.
+    """
+    _lower_order(spec)
+    implied = set(spec.higher_order_paths())
+    blocks = {c: items for c, items in spec.blocks.items() if c not in spec.higher_order}
+    paths = []
+    for a, b in spec.paths:
+        if (a, b) not in implied:
+            paths += [(x, y) for x in spec.higher_order.get(a, [a]) for y in spec.higher_order.get(b, [b])]
+    return ModelSpec(blocks, paths, spec.modes)
+
+
+def stage_two_spec(spec):
+    """Stage-two model: each higher-order construct measured by its lower-order construct scores."""
+    lower = _lower_order(spec)
+    implied = set(spec.higher_order_paths())
+    blocks = {c: spec.higher_order.get(c, items) for c, items in spec.blocks.items() if c not in lower}
+    return ModelSpec(blocks, [path for path in spec.paths if path not in implied], spec.modes)
+
+
+@dataclass
+class TwoStageResult:
+    """Both stages of a two-stage estimation and the data of stage two."""
+    approach: str
+    stage_one: pls.PLSResult
+    stage_two: pls.PLSResult
+    data: pd.DataFrame
+
+
+def two_stage(data, spec, approach="embedded", scheme="path", tol=1e-7, max_iter=300):
+    """Estimate the higher-order constructs of ``spec`` with the two-stage approach.
+
+    ``stage_two`` holds the higher-order results (outer weights and
+    loadings of the lower-order constructs, structural paths); ``data``
+    is the raw data of the remaining indicators plus the lower-order
+    scores, ready for bootstrapping ``stage_two.spec``.
+    """
+    if approach not in APPROACHES:
+        raise ValueError(f"Unknown approach '{approach}'. Use one of {APPROACHES}.")
+    second = stage_two_spec(spec)
+    first = spec if approach == "embedded" else disjoint_spec(spec)
+    lower = [c for c in first.constructs if c in _lower_order(spec)]
+    clash = [c for c in lower if c in data.columns]
+    if clash:
+        raise ValueError(f"Lower-order construct names are also data columns: {', '.join(clash)}.")
+
+    stage_one = pls.estimate(data, first, scheme, tol, max_iter)
+    items = [item for item in second.indicators if item not in lower]
+    stage_data = pd.concat([data[items], stage_one.scores[lower]], axis=1)
+    stage_two = pls.estimate(stage_data, second, scheme, tol, max_iter)
+    return TwoStageResult(approach=approach, stage_one=stage_one, stage_two=stage_two, data=stage_data)
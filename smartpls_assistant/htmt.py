@@ -0,0 +1,131 @@
+"""Discriminant validity: HTMT matrix, its bootstrap and Fornell-Larcker.
+
+HTMT averages absolute indicator correlations (Henseler et al., 2015), so
+negatively related constructs and reverse-keyed items are rated by the
+strength of their correlations. All ratios come from block sums ``S`` of
+one matrix of absolute correlations: ``S[i, j]`` sums every heterotrait
+correlation between blocks ``i`` and ``j``, and ``S[i, i]`` the monotrait
+correlations of block ``i`` (plus its unit diagonal). The sums are taken
+with ``np.add.reduceat`` over the block index arrays, without an
+indicator-to-construct membership matrix. A bootstrap subsample only forms
+the correlation entries of distinct indicator pairs, grouped by block pair,
+never its p x p correlation matrix.
+"""
+import numpy as np
+import pandas as pd
+
+from . import pls
+from .bootstrap import _chunk_sizes, weighted_entries
+
+
+def _htmt_from_sums(S, q):
+    """HTMT ratios from block correlation sums ``S`` (..., k, k) and block sizes ``q``."""
+    hetero = S / np.outer(q, q)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mono = (np.diagonal(S, axis1=-2, axis2=-1) - q) / (q * (q - 1))
+        ratio = hetero / np.sqrt(mono[..., :, None] * mono[..., None, :])
+    k = len(q)
+    ratio[..., np.arange(k), np.arange(k)] = np.nan
+    return ratio
+
+
+def _block_sums(R, s):
+    """Block sums (..., k, k) of absolute correlations over the outer edges of the structure ``s``."""
+    block = np.add.reduceat(np.abs(R[..., s.items[:, None], s.items]), s.starts, axis=-1)
+    return np.add.reduceat(block, s.starts, axis=-2)
+
+
+class _Pairs:
+    """Distinct outer-edge pairs ``(a, b)``, ``a < b``, grouped by block pair for ``np.add.reduceat``."""
+
+    def __init__(self, s):
+        a, b = np.triu_indices(s.m, k=1)
+        # Edges are ordered block by block, so block[a] <= block[b].
+        code = s.block[a] * s.k + s.block[b]
+        order = np.argsort(code, kind="stable")
+        self.rows, self.cols = s.items[a[order]], s.items[b[order]]
+        codes, self.starts = np.unique(code[order], return_index=True)
+        self.left, self.right = np.divmod(codes, s.k)
+        self.s = s
+
+    def block_sums(self, r):
+        """Block sums (..., k, k) like :func:`_block_sums` from the pair entries ``r`` (..., T)."""
+        s = self.s
+        S = np.zeros(r.shape[:-1] + (s.k, s.k))
+        S[..., self.left, self.right] = np.add.reduceat(np.abs(r), self.starts, axis=-1)
+        S += np.swapaxes(S, -1, -2)
+        S[..., np.arange(s.k), np.arange(s.k)] += s.size
+        return S
+
+
+def _htmt(R, s):
+    """HTMT ratios (Henseler et al., 2015) for correlation matrices (..., p, p)."""
+    return _htmt_from_sums(_block_sums(R, s), s.size)
+
+
+def htmt_matrix(R, spec):
+    """HTMT matrix (constructs x constructs) from the indicator correlation matrix.
+
+    Constructs with a single indicator have no monotrait correlations, so
+    their ratios are NaN.
+    """
+    ratio = _htmt(np.asarray(R), pls._Structure(spec))
+    return pd.DataFrame(ratio, index=spec.constructs, columns=spec.constructs)
+
+
+def pairs(matrix):
+    """Long table of the lower-triangle entries (``A <-> B`` rows)."""
+    names = list(matrix.index)
+    rows, cols = np.tril_indices(len(names), k=-1)
+    labels = [f"{names[i]} <-> {names[j]}" for i, j in zip(rows, cols)]
+    return pd.Series(matrix.to_numpy()[rows, cols], index=labels, name="HTMT")
+
+
+def htmt_bootstrap(data, spec, n_boot=5000, seed=0, level=0.95, chunk_size=None):
+    """HTMT with one-sided bootstrap upper confidence bounds for every pair.
+
+    Discriminant validity is established for a pair when the upper bound is
+    below the threshold (0.85 or 0.90). Resampling only needs the
+    correlation matrix, so no model re-estimation is involved.
+    """
+    Z = pls.standardize(data[spec.indicators].to_numpy(dtype=float))
+    s = pls._Structure(spec)
+    layout = _Pairs(s)
+    n = len(Z)
+    # A draw holds its row counts (as integers and floats) and its T pair
+    # entries with their absolute values.
+    sizes = _chunk_sizes(n_boot, chunk_size, 2 * n + 3 * len(layout.rows))
+    draws = []
+    for child, size in zip(np.random.SeedSequence(seed).spawn(len(sizes)), sizes):
+        rng = np.random.default_rng(child)
+        counts = np.stack([np.bincount(rng.integers(0, n, n), minlength=n) for _ in range(size)])
+        r = weighted_entries(Z, counts, layout.rows, layout.cols)
+        draws.append(_htmt_from_sums(layout.block_sums(r), s.size))
+    draws = np.concatenate(draws)
+
+    original = pairs(htmt_matrix(Z.T @ Z / n, spec))
+    rows, cols = np.tril_indices(len(spec.constructs), k=-1)
+    upper = np.quantile(draws[:, rows, cols], level, axis=0)
+    return pd.DataFrame({
+        "Original sample (O)": original.to_numpy(),
+        "Sample mean (M)": draws[:, rows, cols].mean(axis=0),
+        f"{level:.0%} upper bound": upper,
+    }, index=original.index)
+
+
+def fornell_larcker(result):
+    """Fornell-Larcker table: latent correlations with sqrt(AVE) on the diagonal.
+
+    Returns the lower-triangular table and a Series telling, per construct,
+    whether sqrt(AVE) exceeds its largest correlation with any other construct.
+    """
+    C = result.latent_correlations.to_numpy().copy()
+    root_ave = np.sqrt(result.reliability["Average variance extracted (AVE)"].to_numpy())
+    k = len(root_ave)
+    off = np.abs(C)
+    off[np.arange(k), np.arange(k)] = -np.inf
+    valid = root_ave > off.max(axis=1)
+    C[np.arange(k), np.arange(k)] = root_ave
+    C[np.triu_indices(k, k=1)] = np.nan
+    names = result.latent_correlations.index
+    return pd.DataFrame(C, index=names, columns=names), pd.Series(valid, index=names, name="Fornell-Larcker met")
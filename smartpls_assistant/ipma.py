@@ -0,0 +1,80 @@
+"""Importance-performance map analysis (Ringle & Sarstedt, 2016).
+
+Indicators are rescaled to 0-100 (``(x - min) / (max - min) * 100``, using
+the scale bounds or the observed range) and the outer weights turned into
+unstandardized weights of the rescaled indicators that sum to one per
+construct, so rescaled scores are 0-100 as well. Performance is the mean
+rescaled score. Because rescaled and standardized scores differ only by an
+affine map, the unstandardized path coefficients are ``b * sd_target /
+sd_predictor`` and all total effects follow from one inversion,
+``T = (I - B)⁻¹ - I``. An indicator's importance is its rescaled weight
+times its construct's total effect on the target.
+"""
+import numpy as np
+import pandas as pd
+
+QUADRANTS = {
+    (True, True): "Q1: Keep up the good work",
+    (False, True): "Q2: Low priority",
+    (False, False): "Q3: Lowest priority",
+    (True, False): "Q4: High priority to fix",
+}
+
+
+def total_effects(B):
+    """All total effects ``[i, j]`` of construct i on construct j."""
+    I = np.eye(len(B))
+    return np.linalg.inv(I - B) - I
+
+
+def _quadrants(table):
+    high_importance = table["Importance"] >= table["Importance"].mean()
+    high_performance = table["Performance"] >= table["Performance"].mean()
+    return [QUADRANTS[key] for key in zip(high_importance, high_performance)]
+
+
+def ipma(result, data, target, scale=None):
+    """Construct- and indicator-level importance-performance tables for ``target``.
+
+    ``scale`` is the ``(minimum, maximum)`` of the response scale, e.g.
+    ``(1, 7)``; by default each indicator's observed range is used. Rows
+    are the constructs with a (direct or indirect) effect on ``target``
+    and their indicators. Quadrants split at the mean importance and
+    performance.
+    """
+    spec = result.spec
+    X = data[spec.indicators].to_numpy(dtype=float)
+    if scale is None:
+        lower, upper = X.min(axis=0), X.max(axis=0)
+    else:
+        lower, upper = np.full(X.shape[1], float(scale[0])), np.full(X.shape[1], float(scale[1]))
+        if (X < lower).any() or (X > upper).any():
+            raise ValueError(f"Some values lie outside the scale {scale[0]}-{scale[1]}.")
+    rescaled = (X - lower) / (upper - lower) * 100
+
+    W = np.nan_to_num(result.outer_weights.to_numpy(dtype=float))
+    U = W / X.std(axis=0)[:, None] * ((upper - lower) / 100)[:, None]
+    U = U / U.sum(axis=0)
+    scores = rescaled @ U
+    sd = scores.std(axis=0)
+    B = np.nan_to_num(result.path_coefficients.to_numpy(dtype=float)) * sd[None, :] / sd[:, None]
+    j = spec.constructs.index(target)
+    importance = total_effects(B)[:, j]
+
+    drivers = np.flatnonzero(np.abs(importance) > 1e-12)
+    constructs = pd.DataFrame({
+        "Importance": importance[drivers],
+        "Performance": scores.mean(axis=0)[drivers],
+    }, index=pd.Index([spec.constructs[i] for i in drivers], name="Construct"))
+    constructs["Quadrant"] = _quadrants(constructs)
+
+    block = spec.membership(higher_order=False).argmax(axis=1)
+    items = np.flatnonzero(np.isin(block, drivers))
+    indicators = pd.DataFrame({
+        "Construct": [spec.constructs[block[h]] for h in items],
+        "Rescaled weight": U[items, block[items]],
+        "Importance": U[items, block[items]] * importance[block[items]],
+        "Performance": rescaled.mean(axis=0)[items],
+    }, index=pd.Index([spec.indicators[h] for h in items], name="Indicator"))
+    indicators["Quadrant"] = _quadrants(indicators)
+    return constructs, indicators
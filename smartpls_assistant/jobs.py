@@ -0,0 +1,180 @@
+"""Server-wide background jobs with per-owner fair queuing and cancellation.
+
+Long computations (bootstrapping, MGA, blindfolding, PLSpredict) run in
+background threads, so the page that submitted them keeps responding and
+only polls their progress. At most ``max_running`` jobs run at once and
+each one may use ``workers_per_job`` worker processes, which bounds the
+total number of processes on the server. Queued jobs are dispatched
+round-robin over their owners (one session each): a user who queues many
+jobs cannot starve the others.
+
+A job function receives its :class:`Job` as the last argument and passes
+``job.progress`` as the engine's progress callback: the callback records
+``(done, total)`` and raises :class:`Cancelled` once cancellation was
+requested, which stops the engine at its next chunk. A job that finds an
+identical one already computing the same cached result waits for it through
+``job.wait``, which stays cancellable as well. Every finished job is
+logged (queueing and run time) through :func:`smartpls_assistant.profiling.log`.
+"""
+import itertools
+import os
+import threading
+import time
+from collections import deque
+
+from . import profiling
+
+QUEUED, RUNNING, DONE, FAILED, CANCELLED = "queued", "running", "done", "failed", "cancelled"
+
+# Finished jobs kept per owner for display.
+_HISTORY = 20
+
+
+class Cancelled(Exception):
+    """Raised inside a job's progress callback after it was cancelled."""
+
+
+class Job:
+    """One submitted computation and its live state."""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, owner, label, func, args, n_jobs):
+        self.id = next(self._ids)
+        self.owner = owner
+        self.label = label
+        self.func = func
+        self.args = args
+        self.n_jobs = n_jobs
+        self.status = QUEUED
+        self.done = 0
+        self.total = 0
+        self.result = None
+        self.partial = None
+        self.error = None
+        self.waiting = False
+        self.submitted = time.time()
+        self.started = None
+        self.finished_at = None
+        self._cancel = threading.Event()
+
+    @property
+    def finished(self):
+        return self.status in (DONE, FAILED, CANCELLED)
+
+    @property
+    def fraction(self):
+        return self.done / self.total if self.total else 0.0
+
+    @property
+    def message(self):
+        if self.status == RUNNING and self.waiting:
+            return "waiting for an identical job"
+        if self.status == RUNNING and self.total:
+            return f"{self.done:,} / {self.total:,}"
+        return self.status
+
+    def progress(self, done, total):
+        """Engine progress callback; raises :class:`Cancelled` when cancelled."""
+        self.done, self.total = done, total
+        self.waiting = False
+        if self._cancel.is_set():
+            raise Cancelled()
+
+    def wait(self):
+        """Callback while an identical job computes the result; raises :class:`Cancelled` when cancelled."""
+        self.waiting = True
+        if self._cancel.is_set():
+            raise Cancelled()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def _run(self):
+        self.status, self.started = RUNNING, time.time()
+        try:
+            self.result = self.func(*self.args, self)
+            self.status = DONE
+        except Cancelled:
+            self.status = CANCELLED
+        except Exception as exc:  # surfaced to the page instead of killing the worker thread
+            self.error = str(exc) or type(exc).__name__
+            self.status = FAILED
+        finally:
+            self.finished_at = time.time()
+            profiling.log({"event": "job", "label": self.label, "status": self.status, "owner": self.owner,
+                           "queued_s": round(self.started - self.submitted, 3),
+                           "run_s": round(self.finished_at - self.started, 3)})
+
+
+class JobScheduler:
+    """Bounded, fair scheduler shared by all sessions of a server process."""
+
+    def __init__(self, max_workers=None, max_running=None):
+        max_workers = max_workers or os.cpu_count() or 1
+        self.max_running = max_running or max(1, max_workers // 4)
+        self.workers_per_job = max(1, max_workers // self.max_running)
+        self._queues = {}
+        self._served = {}
+        self._ticks = itertools.count()
+        self._running = set()
+        self._history = {}
+        self._lock = threading.Lock()
+
+    def submit(self, owner, label, func, *args):
+        """Queue ``func(*args, job)`` for ``owner`` and return the :class:`Job`."""
+        job = Job(owner, label, func, args, self.workers_per_job)
+        with self._lock:
+            self._queues.setdefault(owner, deque()).append(job)
+            self._history.setdefault(owner, deque(maxlen=_HISTORY)).append(job)
+        self._dispatch()
+        return job
+
+    def cancel(self, job):
+        """Cancel a queued job now, or a running one at its next progress report."""
+        job.cancel()
+        with self._lock:
+            queue = self._queues.get(job.owner)
+            if queue and job in queue:
+                queue.remove(job)
+                job.status = CANCELLED
+                job.finished_at = time.time()
+
+    def jobs(self, owner):
+        """The owner's recent jobs, newest first."""
+        with self._lock:
+            return list(reversed(self._history.get(owner, ())))
+
+    def queued(self):
+        with self._lock:
+            return sum(len(queue) for queue in self._queues.values())
+
+    def running(self):
+        with self._lock:
+            return len(self._running)
+
+    def _next(self):
+        """Round-robin: the owner with queued work who was served least recently."""
+        waiting = [owner for owner, queue in self._queues.items() if queue]
+        if not waiting:
+            return None
+        owner = min(waiting, key=lambda o: self._served.get(o, -1))
+        self._served[owner] = next(self._ticks)
+        return self._queues[owner].popleft()
+
+    def _dispatch(self):
+        with self._lock:
+            while len(self._running) < self.max_running:
+                job = self._next()
+                if job is None:
+                    break
+                self._running.add(job)
+                threading.Thread(target=self._work, args=(job,), daemon=True, name=f"job-{job.id}").start()
+
+    def _work(self, job):
+        try:
+            job._run()
+        finally:
+            with self._lock:
+                self._running.discard(job)
+            self._dispatch()
@@ -0,0 +1,428 @@
+"""Streaming, memory-bounded reading of large SmartPLS exports and raw data.
+
+SmartPLS writes several tables into one export: one per worksheet, and
+within a sheet (or a CSV) as sections of a title row, a header row and the
+data rows, separated by blank rows. :func:`sections` finds them without
+loading the file (text is scanned in blocks with a regular expression, only
+blank lines are ever looked at individually) and :func:`read_table` reads
+one section in chunks straight into a preallocated NumPy array, so bootstrap
+sample exports with thousands of rows per path and raw datasets of hundreds
+of MB never exist as several pandas copies: peak memory is the final array
+plus one chunk. Raw data are not split into sections (:func:`whole`): there
+a row of empty cells is a respondent who skipped every item, not a break.
+
+Numeric columns form one contiguous 2-D block, stored as float32 whenever
+every value survives the round trip (integers exactly, others to a relative
+1e-6), else as float64. Text columns (row labels, group variables) are kept
+separately. With ``cache_dir``, :func:`load` converts a file once to
+``.npy`` and afterwards memory-maps it.
+"""
+import os
+import pickle
+import re
+import tempfile
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass
+from itertools import islice
+
+import numpy as np
+import pandas as pd
+
+from . import cache
+
+CHUNK_ROWS = 50_000
+DELIMITERS = ("\t", ";", ",")
+# Largest relative error accepted when storing non-integral values as float32.
+RTOL = 1e-6
+_BLOCK = 2 ** 24
+_BLANK = re.compile(rb"^[,;\t \r]*$", re.M)
+
+
+@dataclass
+class Section:
+    """One table of an export: ``rows`` data rows below a header row."""
+    title: str
+    header: int
+    rows: int
+    sheet: str = None
+    offset: int = 0
+
+
+@dataclass
+class Table:
+    """A table read by :func:`read_table`, numeric columns as one array."""
+    values: np.ndarray
+    numeric: list
+    columns: list
+    index: pd.Index = None
+    other: pd.DataFrame = None
+
+    def frame(self):
+        """The table as a DataFrame backed by :attr:`values` (not copied)."""
+        frame = pd.DataFrame(self.values, index=self.index, columns=self.numeric, copy=False)
+        if self.other is not None:
+            for column in self.other.columns:
+                frame.insert(self.columns.index(column), column, self.other[column].to_numpy())
+        return frame
+
+
+def _is_excel(name):
+    return str(name).lower().endswith((".xlsx", ".xlsm", ".xls"))
+
+
+@contextmanager
+def _binary(file):
+    """Binary stream of a path or file object, rewound (and restored) for reading."""
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "rb") as fh:
+            yield fh
+        return
+    position = file.tell()
+    file.seek(0)
+    try:
+        yield file
+    finally:
+        file.seek(position)
+
+
+def sniff(head):
+    """Delimiter and decimal mark of delimited text, from its first bytes."""
+    lines = [line for line in head.splitlines()[:20] if not _BLANK.fullmatch(line)]
+    counts = {d: max((line.count(d.encode()) for line in lines), default=0) for d in DELIMITERS}
+    delimiter = max(DELIMITERS, key=lambda d: counts[d])
+    if not counts[delimiter]:
+        delimiter = ","
+    decimal = "," if delimiter != "," and re.search(rb"\d,\d", head) else "."
+    return delimiter, decimal
+
+
+def _scan_text(stream):
+    """Total line count and ``(line, offset)`` of every blank line's successor."""
+    blanks, lines, offset, tail = [], 0, 0, b""
+    while True:
+        data = stream.read(_BLOCK)
+        chunk = tail + data
+        if not data:
+            if not chunk:
+                break
+            chunk += b"\n"
+        end = chunk.rfind(b"\n") + 1
+        block, tail = chunk[:end], chunk[end:]
+        counted = 0
+        for match in _BLANK.finditer(block):
+            if match.start() == len(block):
+                break
+            counted_to = match.start()
+            lines += block.count(b"\n", counted, counted_to)
+            counted = counted_to
+            blanks.append((lines, offset + match.end() + 1))
+        lines += block.count(b"\n", counted)
+        offset += len(block)
+        if not data:
+            break
+    return lines, blanks
+
+
+def _cells(line, delimiter):
+    return [cell.strip().strip('"') for cell in line.split(delimiter)]
+
+
+def _runs(lines, blanks):
+    """``(first line, offset, stop)`` of every run of non-blank lines."""
+    blank = {line for line, _ in blanks}
+    starts = [] if 0 in blank else [(0, 0)]
+    starts += [(line + 1, offset) for line, offset in blanks if line + 1 < lines and line + 1 not in blank]
+    stops = sorted(blank) + [lines]
+    return [(line, offset, stops[np.searchsorted(stops, line)]) for line, offset in starts]
+
+
+def _section(first, second, line, stop, default):
+    """Section of a run whose first two rows are ``first`` and ``second`` (cell lists).
+
+    The run is titled if its first row has only a first cell (a report
+    header row has an empty first cell above the row labels).
+    """
+    titled = second is not None and bool(first[0]) and not any(first[1:]) and len(second) > 1
+    header = line + 1 if titled else line
+    rows = stop - header - 1
+    if rows <= 0 or len(second if titled else first) < 2:
+        return None
+    return Section(first[0] if titled else default, header, rows), titled
+
+
+def sections(file, name=None):
+    """All tables of an export (CSV/TXT, or every sheet of an XLSX), in file order.
+
+    An untitled table is named after the sheet, or the file for text files.
+    """
+    name = name or getattr(file, "name", str(file))
+    default = os.path.splitext(os.path.basename(str(name)))[0]
+    if _is_excel(name):
+        return _excel_sections(file, name)
+    found = []
+    with _binary(file) as stream:
+        delimiter, _ = sniff(stream.read(2 ** 16))
+        stream.seek(0)
+        lines, blanks = _scan_text(stream)
+        for line, offset, stop in _runs(lines, blanks):
+            stream.seek(offset)
+            first = _cells(stream.readline().decode("utf-8-sig", "replace"), delimiter)
+            second = _cells(stream.readline().decode("utf-8", "replace"), delimiter) if stop - line > 1 else None
+            section = _section(first, second, line, stop, default)
+            if section:
+                section, titled = section
+                section.offset = offset
+                if titled:
+                    stream.seek(offset)
+                    stream.readline()
+                    section.offset = stream.tell()
+                found.append(section)
+    return found
+
+
+def _count_lines(stream):
+    lines, last = 0, b"\n"
+    while True:
+        data = stream.read(_BLOCK)
+        if not data:
+            break
+        lines += data.count(b"\n")
+        last = data[-1:]
+    return lines + (last != b"\n")
+
+
+def whole(file, name=None):
+    """The entire file (the first sheet of a workbook) as one untitled section.
+
+    Use it for raw data: rows whose cells are all empty are kept as rows of
+    missing values, as :func:`pandas.read_csv` does; only truly empty lines
+    of text files are skipped.
+    """
+    name = name or getattr(file, "name", str(file))
+    default = os.path.splitext(os.path.basename(str(name)))[0]
+    if _is_excel(name):
+        return Section(default, 0, -1)
+    with _binary(file) as stream:
+        return Section(default, 0, max(_count_lines(stream) - 1, 0))
+
+
+def _excel_sections(file, name):
+    if str(name).lower().endswith(".xls"):
+        with _binary(file) as stream:
+            sheets = pd.ExcelFile(stream).sheet_names
+        return [Section(sheet, 0, -1, sheet) for sheet in sheets]
+    from openpyxl import load_workbook
+
+    found = []
+    with _binary(file) as stream:
+        book = load_workbook(stream, read_only=True, data_only=True)
+        try:
+            for sheet in book.worksheets:
+                # Only the blank rows and the first two rows of each run are kept.
+                lines, blanks, heads, starts = 0, [], {}, set()
+                for lines, row in enumerate(_rows(sheet), 1):
+                    i = lines - 1
+                    cells = ["" if v is None else str(v).strip() for v in row]
+                    if not any(cells):
+                        blanks.append((i, 0))
+                    elif i == 0 or (blanks and blanks[-1][0] == i - 1):
+                        heads[i] = cells
+                        starts.add(i)
+                    elif i - 1 in starts:
+                        heads[i] = cells
+                for line, _, stop in _runs(lines, blanks):
+                    section = _section(heads[line], heads.get(line + 1) if stop - line > 1 else None,
+                                       line, stop, sheet.title)
+                    if section:
+                        section[0].sheet = sheet.title
+                        found.append(section[0])
+        finally:
+            book.close()
+    return found
+
+
+def _rows(sheet):
+    """Rows of a read-only worksheet as tuples of cell values."""
+    return sheet.iter_rows(values_only=True)
+
+
+def fits_float32(values):
+    """Whether ``values`` survive a round trip through float32 (see :data:`RTOL`)."""
+    with np.errstate(invalid="ignore", over="ignore"):
+        back = values.astype(np.float32).astype(float)
+        integral = values == np.round(values)
+        ok = np.where(integral, back == values, np.abs(back - values) <= RTOL * np.abs(values))
+    return bool(np.all(ok | np.isnan(values)))
+
+
+class _Builder:
+    """Accumulates chunks of a table into one growing numeric array."""
+
+    def __init__(self, rows, dtype):
+        self.capacity = max(rows, 1)
+        self.dtype = dtype
+        self.values = None
+        self.n = 0
+        self.numeric = None
+        self.columns = None
+        self.index, self.other = [], []
+
+    def add(self, chunk):
+        if self.numeric is None:
+            self.columns = [str(c) for c in chunk.columns]
+            self.numeric = [c for c, column in zip(self.columns, chunk.columns) if _numeric(chunk[column])]
+            chunk.columns = self.columns
+        else:
+            chunk.columns = self.columns
+        block = chunk[self.numeric].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+        if self.values is None:
+            dtype = np.float32 if self.dtype == "auto" else self.dtype
+            self.values = np.empty((self.capacity, len(self.numeric)), dtype=dtype)
+        if self.values.dtype == np.float32 and self.dtype == "auto" and not fits_float32(block):
+            self.values = self.values.astype(float)
+        if self.n + len(block) > len(self.values):
+            grown = np.empty((max(2 * len(self.values), self.n + len(block)), self.values.shape[1]), self.values.dtype)
+            grown[:self.n] = self.values[:self.n]
+            self.values = grown
+        self.values[self.n:self.n + len(block)] = block
+        self.n += len(block)
+        self.index.append(chunk.index)
+        if len(self.numeric) < len(self.columns):
+            self.other.append(chunk.drop(columns=self.numeric))
+
+    def table(self, index_col):
+        if self.values is None:
+            return Table(np.empty((0, 0), np.float32), [], [])
+        index = self.index[0].append(self.index[1:]) if index_col is not None else None
+        if index is not None:
+            index = index.map(str)
+        other = pd.concat(self.other) if self.other else None
+        return Table(self.values[:self.n], self.numeric, self.columns, index, other)
+
+
+def _numeric(column):
+    if pd.api.types.is_bool_dtype(column):
+        return False
+    if pd.api.types.is_numeric_dtype(column):
+        return True
+    present = column.dropna()
+    return bool(len(present)) and pd.to_numeric(present, errors="coerce").notna().all()
+
+
+def read_table(file, name=None, section=None, index_col=None, dtype="auto", chunk_rows=CHUNK_ROWS):
+    """Read one section (default: the first) of an export in chunks.
+
+    ``section`` is a :class:`Section` or a section title. ``index_col=0``
+    uses the first column as row labels (report tables). ``dtype`` is
+    ``"auto"`` (float32 where precision allows), ``np.float32`` or
+    ``np.float64``.
+    """
+    name = name or getattr(file, "name", str(file))
+    if not isinstance(section, Section):
+        found = sections(file, name)
+        if not found:
+            raise ValueError(f"No table found in {os.path.basename(str(name))}.")
+        if section is None:
+            section = found[0]
+        else:
+            matches = [s for s in found if s.title == section]
+            if not matches:
+                raise ValueError(f"No table '{section}' in {os.path.basename(str(name))}.")
+            section = matches[0]
+    builder = _Builder(max(section.rows, 0), dtype)
+    if _is_excel(name):
+        for chunk in _excel_chunks(file, name, section, index_col, chunk_rows):
+            builder.add(chunk)
+    else:
+        with _binary(file) as stream:
+            delimiter, decimal = sniff(stream.read(2 ** 16))
+            stream.seek(section.offset)
+            reader = pd.read_csv(stream, sep=delimiter, decimal=decimal, index_col=index_col, nrows=section.rows,
+                                 chunksize=chunk_rows, skipinitialspace=True, encoding="utf-8-sig")
+            with reader:
+                for chunk in reader:
+                    builder.add(chunk)
+    return builder.table(index_col)
+
+
+def _excel_chunks(file, name, section, index_col, chunk_rows):
+    if str(name).lower().endswith(".xls"):
+        with _binary(file) as stream:
+            yield pd.read_excel(stream, sheet_name=section.sheet or 0, index_col=index_col)
+        return
+    from openpyxl import load_workbook
+
+    with _binary(file) as stream:
+        book = load_workbook(stream, read_only=True, data_only=True)
+        try:
+            sheet = book[section.sheet] if section.sheet else book.worksheets[0]
+            if section.rows < 0:
+                rows = _trimmed(islice(_rows(sheet), section.header, None))
+            else:
+                rows = islice(_rows(sheet), section.header, section.header + 1 + section.rows)
+            header = [("" if v is None else str(v).strip()) or f"Unnamed: {i}" for i, v in enumerate(next(rows))]
+            while True:
+                block = list(islice(rows, chunk_rows))
+                if not block:
+                    break
+                chunk = pd.DataFrame(block, columns=header[:len(block[0])])
+                if index_col is not None:
+                    chunk = chunk.set_index(chunk.columns[index_col])
+                    if chunk.index.name.startswith("Unnamed: "):
+                        chunk.index.name = None
+                yield chunk
+        finally:
+            book.close()
+
+
+def _trimmed(rows):
+    """``rows`` without the empty rows at their end (a sheet's formatted but unused rows)."""
+    pending = []
+    for row in rows:
+        if all(v is None or str(v).strip() == "" for v in row):
+            pending.append(row)
+            continue
+        yield from pending
+        pending.clear()
+        yield row
+
+
+def _source_key(file, name, key):
+    if key is not None:
+        return key
+    if isinstance(file, (str, os.PathLike)):
+        info = os.stat(file)
+        return f"{os.path.abspath(file)}:{info.st_size}:{info.st_mtime_ns}"
+    return cache.file_hash(file)
+
+
+def load(file, name=None, section=None, index_col=None, dtype="auto", cache_dir=None, key=None):
+    """:func:`read_table`, converted once to ``.npy`` in ``cache_dir`` and memory-mapped.
+
+    ``key`` identifies the file's content (default: path, size and
+    modification time for paths, the content hash for file objects).
+    """
+    if not cache_dir:
+        return read_table(file, name, section, index_col, dtype)
+    title = (section.title, section.header, section.rows) if isinstance(section, Section) else section
+    k = cache.key("loader", _source_key(file, name, key), title, index_col, str(dtype))
+    values_path = os.path.join(cache_dir, f"{k}.npy")
+    meta_path = os.path.join(cache_dir, f"{k}.meta.pkl")
+    with suppress(OSError, pickle.UnpicklingError, EOFError, ValueError):
+        with open(meta_path, "rb") as fh:
+            meta = pickle.load(fh)
+        values = np.load(values_path, mmap_mode="r")
+        for path in (values_path, meta_path):
+            os.utime(path)
+        return Table(values, **meta)
+
+    table = read_table(file, name, section, index_col, dtype)
+    os.makedirs(cache_dir, exist_ok=True)
+    meta = {"numeric": table.numeric, "columns": table.columns, "index": table.index, "other": table.other}
+    for path, write in ((values_path, lambda fh: np.save(fh, table.values)),
+                        (meta_path, lambda fh: pickle.dump(meta, fh, protocol=pickle.HIGHEST_PROTOCOL))):
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as fh:
+            write(fh)
+        os.replace(tmp, path)
+    return Table(np.load(values_path, mmap_mode="r"), **meta)
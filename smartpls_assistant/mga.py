@@ -0,0 +1,178 @@
+"""Multigroup analysis (MGA) of path coefficients between two groups.
+
+* Permutation test (Chin & Dibbern, 2010): group labels are shuffled and the
+  model is re-estimated for both pseudo-groups; the p value of a path is the
+  share of permutations whose absolute difference reaches the observed one.
+* Henseler's bootstrap MGA (Henseler et al., 2009): both groups are
+  bootstrapped separately and every pair of draws is compared.
+
+Permutations are estimated in batches: a pseudo-group's correlation matrix
+comes from its rows' cross products, the other group's from subtracting
+them from the full-sample cross products. Both stacks are fitted in one
+batched call of the PLS core. Batches run on the shared process pool and
+optional sequential early stopping ends the test once every path's p value
+is confidently above or below alpha.
+"""
+import numpy as np
+import pandas as pd
+
+from . import _parallel, pls
+from .bootstrap import bootstrap
+
+# z value of the Wilson interval used for sequential early stopping (99%).
+_STOP_Z = 2.576
+
+
+class _Task:
+    """Centered data and full-sample cross products shared by all batches."""
+
+    def __init__(self, X, spec, size_a, scheme, tol, max_iter):
+        self.X = X - X.mean(axis=0)
+        self.XtX = self.X.T @ self.X
+        self.size_a = size_a
+        self.scheme = scheme
+        self.tol = tol
+        self.max_iter = max_iter
+        self.structure = pls._Structure(spec)
+
+
+def _corr(S, total, count):
+    mean = total / count
+    cov = S / count - np.outer(mean, mean)
+    sd = np.sqrt(np.diag(cov))
+    return cov / np.outer(sd, sd)
+
+
+def _group_corr(X, XtX, rows):
+    """Correlation matrices of the rows ``rows`` and of all remaining rows.
+
+    ``X`` is centered, so the remaining rows sum to minus the selected ones.
+    """
+    Xa = X[rows]
+    S, total = Xa.T @ Xa, Xa.sum(axis=0)
+    return _corr(S, total, len(rows)), _corr(XtX - S, -total, len(X) - len(rows))
+
+
+def _differences(R_a, R_b, task):
+    """Path coefficient differences (group A - group B) for stacks of matrices."""
+    s = task.structure
+    R = np.concatenate([R_a, R_b])
+    _, c, _, _, _ = pls._fit(R, s, task.scheme, task.tol, task.max_iter)
+    paths, _ = pls._paths(c, s)
+    return paths[:len(R_a)] - paths[len(R_a):]
+
+
+def _permutation_batch(task, seed, size):
+    rng = np.random.default_rng(seed)
+    n = len(task.X)
+    pairs = [_group_corr(task.X, task.XtX, rng.permutation(n)[:task.size_a]) for _ in range(size)]
+    R_a, R_b = (np.stack(group) for group in zip(*pairs))
+    return _differences(R_a, R_b, task)
+
+
+def _wilson(count, total, z=_STOP_Z):
+    p = count / total
+    centre = (p + z * z / (2 * total)) / (1 + z * z / total)
+    half = z * np.sqrt(p * (1 - p) / total + z * z / (4 * total * total)) / (1 + z * z / total)
+    return centre - half, centre + half
+
+
+def _split(data, spec, group_column, groups):
+    labels = data[group_column]
+    if groups is None:
+        groups = list(pd.unique(labels.dropna()))
+        if len(groups) != 2:
+            raise ValueError(f"'{group_column}' has {len(groups)} groups; choose the two groups to compare.")
+    a, b = groups
+    ordered = pd.concat([data[labels == a], data[labels == b]])
+    size_a = int((labels == a).sum())
+    if min(size_a, len(ordered) - size_a) < 2:
+        raise ValueError("Each group needs at least two cases.")
+    return ordered, size_a, (a, b)
+
+
+def permutation_mga(data, spec, group_column, groups=None, n_perm=1000, alpha=0.05, seed=0, scheme="path",
+                    n_jobs=None, batch_size=100, early_stopping=False, min_perm=200, progress=None,
+                    tol=1e-7, max_iter=300):
+    """Permutation test of path coefficient differences for all paths at once.
+
+    With ``early_stopping`` a path stops accumulating once the 99% Wilson
+    interval of its p value lies entirely above or below ``alpha`` (after
+    at least ``min_perm`` permutations); the test ends when every path is
+    decided. Batches are consumed in order, so results are reproducible.
+    """
+    ordered, size_a, (a, b) = _split(data, spec, group_column, groups)
+    X = ordered[spec.indicators].to_numpy(dtype=float)
+    task = _Task(X, spec, size_a, scheme, tol, max_iter)
+    observed = _differences(*(R[None] for R in _group_corr(task.X, task.XtX, np.arange(size_a))), task)[0]
+    group_a = pls.estimate(ordered.iloc[:size_a], spec, scheme, tol, max_iter)
+    group_b = pls.estimate(ordered.iloc[size_a:], spec, scheme, tol, max_iter)
+
+    sizes = [batch_size] * (n_perm // batch_size) + ([n_perm % batch_size] if n_perm % batch_size else [])
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    exceed = np.zeros(len(observed))
+    used = np.zeros(len(observed))
+    active = np.ones(len(observed), dtype=bool)
+    buffer, next_batch, done = {}, 0, 0
+    jobs = zip(seeds, sizes)
+    n_jobs = 1 if len(sizes) <= 1 else n_jobs
+    stream = _parallel.imap(_Task, (X, spec, size_a, scheme, tol, max_iter), _permutation_batch, jobs, n_jobs)
+    try:
+        for i, diffs in stream:
+            buffer[i] = diffs
+            while next_batch in buffer:
+                diffs = buffer.pop(next_batch)
+                next_batch += 1
+                exceed[active] += np.sum(np.abs(diffs[:, active]) >= np.abs(observed[active]), axis=0)
+                used[active] += len(diffs)
+                done += len(diffs)
+                if early_stopping and used.max() >= min_perm:
+                    lower, upper = _wilson(exceed, used)
+                    active &= ~((upper < alpha) | (lower > alpha))
+                if progress:
+                    progress(done, n_perm)
+            if not active.any():
+                break
+    finally:
+        stream.close()
+
+    return pd.DataFrame({
+        f"Path coefficient ({a})": group_a.path_coefficients.to_numpy()[task.structure.src, task.structure.dst],
+        f"Path coefficient ({b})": group_b.path_coefficients.to_numpy()[task.structure.src, task.structure.dst],
+        f"Difference ({a} - {b})": observed,
+        "Permutation p value": (exceed + 1) / (used + 1),
+        "Permutations": used.astype(int),
+    }, index=pd.Index([f"{x} -> {y}" for x, y in spec.paths], name="Path"))
+
+
+def henseler_mga(data, spec, group_column, groups=None, n_boot=5000, seed=0, scheme="path", n_jobs=None,
+                 progress=None, tol=1e-7, max_iter=300):
+    """Henseler's bootstrap-based MGA.
+
+    ``p (a > b)`` is the probability that the path is not larger in group
+    ``a`` than in group ``b``, counted over all B x B pairs of
+    bias-corrected draws in O(B log B) with a sorted search.
+    """
+    ordered, size_a, (a, b) = _split(data, spec, group_column, groups)
+    seeds = np.random.SeedSequence(seed).spawn(2)
+    boots = [
+        bootstrap(part, spec, n_boot, scheme, int(child.generate_state(1)[0]), n_jobs,
+                  progress=(lambda done, total, k=k: progress(done + k * total, 2 * total)) if progress else None,
+                  tol=tol, max_iter=max_iter)
+        for k, (part, child) in enumerate(zip((ordered.iloc[:size_a], ordered.iloc[size_a:]), seeds))
+    ]
+    draws_a, draws_b = (boot.draws["paths"] for boot in boots)
+    p_values = np.empty(draws_a.shape[1])
+    for m in range(draws_a.shape[1]):
+        left = np.sort(draws_a[:, m] - 2 * draws_a[:, m].mean())
+        right = draws_b[:, m] - 2 * draws_b[:, m].mean()
+        p_values[m] = np.searchsorted(left, right, side="left").sum() / (len(left) * len(right))
+    p_values = 1 - p_values
+    estimates_a, estimates_b = (boot.estimates["paths"] for boot in boots)
+    return pd.DataFrame({
+        f"Path coefficient ({a})": estimates_a,
+        f"Path coefficient ({b})": estimates_b,
+        f"Difference ({a} - {b})": estimates_a - estimates_b,
+        f"p value ({a} > {b})": p_values,
+        "Henseler p value (2-tailed)": 2 * np.minimum(p_values, 1 - p_values),
+    }, index=pd.Index([f"{x} -> {y}" for x, y in spec.paths], name="Path"))
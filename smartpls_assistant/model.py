@@ -0,0 +1,257 @@
+"""PLS path model specification.
+
+A model is a set of measurement blocks (construct -> indicators) plus the
+structural paths between constructs. It can be written in a small
+lavaan-style syntax::
+
+    # measurement model
+    IMAGE =~ img1 + img2 + img3      # reflective (Mode A)
+    QUAL  <~ q1 + q2 + q3            # formative (Mode B)
+    SAT   =~ sat1 + sat2
+    # structural model
+    SAT ~ IMAGE + QUAL
+
+A block made of constructs instead of indicators defines a higher-order
+construct (``VALUE =~ QUAL + SAT``). It is estimated with the repeated
+indicators approach: its block holds all indicators of its lower-order
+constructs, and the paths between them are implied (higher-order ->
+lower-order for ``=~``, lower-order -> higher-order for ``<~``).
+
+Besides the readable form, the spec exposes the index arrays the
+estimation works on: :meth:`ModelSpec.outer_edges` lists every
+(indicator, construct) pair and :meth:`ModelSpec.path_index` the
+structural paths, so nothing scales with indicators x constructs or
+constructs².
+"""
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+@dataclass
+class ModelSpec:
+    """Measurement blocks, structural paths and outer-weighting modes.
+
+    ``higher_order`` maps each higher-order construct to its lower-order
+    constructs. Its block is filled with their indicators and the implied
+    paths are added, so a spec can be rebuilt from ``blocks``, ``paths``,
+    ``modes`` and ``higher_order`` after editing the lower-order blocks.
+    """
+    blocks: dict
+    paths: list
+    modes: dict = field(default_factory=dict)
+    higher_order: dict = field(default_factory=dict)
+
+    def __post_init__(self):
+        self.blocks = {str(c): [str(i) for i in items] for c, items in self.blocks.items()}
+        self.higher_order = {str(c): [str(part) for part in lower] for c, lower in self.higher_order.items()}
+        self.modes = {c: self.modes.get(c, "A") for c in [*self.blocks, *self.higher_order]}
+        for construct in self.higher_order:
+            self.blocks[construct] = self._repeated(construct, ())
+        self.paths = list(dict.fromkeys([(str(a), str(b)) for a, b in self.paths] + self.higher_order_paths()))
+        self.validate()
+
+    def _repeated(self, construct, chain):
+        """Indicators of a higher-order construct, collected from its lower-order ones."""
+        if construct in chain:
+            raise ValueError(f"Higher-order construct '{construct}' contains itself.")
+        items = []
+        for lower in self.higher_order[construct]:
+            if lower in self.higher_order:
+                found = self._repeated(lower, chain + (construct,))
+            elif lower in self.blocks:
+                found = self.blocks[lower]
+            else:
+                raise ValueError(f"Higher-order construct '{construct}' uses undefined construct '{lower}'.")
+            items += [item for item in found if item not in items]
+        return items
+
+    @property
+    def constructs(self):
+        return list(self.blocks)
+
+    @property
+    def indicators(self):
+        """Distinct indicators in block order (repeated indicators once)."""
+        return list(dict.fromkeys(item for items in self.blocks.values() for item in items))
+
+    @property
+    def endogenous(self):
+        """Constructs with at least one incoming path, in model order."""
+        targets = {b for _, b in self.paths}
+        return [c for c in self.constructs if c in targets]
+
+    def higher_order_paths(self):
+        """Paths implied by the higher-order constructs, in definition order."""
+        paths = []
+        for construct, lower in self.higher_order.items():
+            for part in lower:
+                paths.append((part, construct) if self.modes[construct] == "B" else (construct, part))
+        return paths
+
+    def validate(self):
+        seen = {}
+        for construct, lower in self.higher_order.items():
+            if len(lower) < 2:
+                raise ValueError(f"Higher-order construct '{construct}' needs at least two lower-order constructs.")
+        related = {(c, part) for c, lower in self.higher_order.items() for part in lower}
+        for construct, items in self.blocks.items():
+            if not items:
+                raise ValueError(f"Construct '{construct}' has no indicators.")
+            for item in items:
+                if item in seen and not _nested(related, seen[item], construct):
+                    raise ValueError(f"Indicator '{item}' is assigned to both '{seen[item]}' and '{construct}'.")
+                seen.setdefault(item, construct)
+        for a, b in self.paths:
+            for c in (a, b):
+                if c not in self.blocks:
+                    raise ValueError(f"Path {a} -> {b} uses undefined construct '{c}'.")
+            if a == b:
+                raise ValueError(f"Path {a} -> {b} is a self-loop.")
+        if _has_cycle(self.blocks, self.paths):
+            raise ValueError("The structural model must be recursive (no feedback loops).")
+        connected = {c for path in self.paths for c in path}
+        isolated = [c for c in self.blocks if c not in connected]
+        if isolated:
+            raise ValueError(f"Constructs without structural paths: {', '.join(isolated)}.")
+        for construct, mode in self.modes.items():
+            if mode not in ("A", "B"):
+                raise ValueError(f"Construct '{construct}' has unknown mode '{mode}' (use 'A' or 'B').")
+
+    def outer_edges(self):
+        """Index arrays ``(indicator, construct)`` of every block entry, block by block.
+
+        Indices refer to :attr:`indicators` and :attr:`constructs`; an
+        indicator repeated in a higher-order block appears once per block.
+        """
+        position = {item: h for h, item in enumerate(self.indicators)}
+        items = [position[item] for items in self.blocks.values() for item in items]
+        block = np.repeat(np.arange(len(self.blocks)), [len(items) for items in self.blocks.values()])
+        return np.array(items, dtype=int), block
+
+    def path_index(self):
+        """Index arrays ``(source, target)`` of the structural paths, ordered like :attr:`paths`."""
+        index = {c: j for j, c in enumerate(self.constructs)}
+        return (np.array([index[a] for a, _ in self.paths], dtype=int),
+                np.array([index[b] for _, b in self.paths], dtype=int))
+
+    def membership(self, higher_order=True):
+        """Boolean (indicators x constructs) matrix of block membership.
+
+        Dense, for small models and population calculations; with
+        ``higher_order=False`` the repeated indicators of higher-order
+        constructs are left out, so each row marks only the block that
+        measures the indicator directly.
+        """
+        items, block = self.outer_edges()
+        member = np.zeros((len(self.indicators), len(self.blocks)), dtype=bool)
+        member[items, block] = True
+        if not higher_order:
+            member[:, [j for j, c in enumerate(self.constructs) if c in self.higher_order]] = False
+        return member
+
+    def adjacency(self):
+        """Boolean (constructs x constructs) matrix; ``[i, j]`` is the path i -> j."""
+        index = {c: j for j, c in enumerate(self.constructs)}
+        adj = np.zeros((len(self.blocks), len(self.blocks)), dtype=bool)
+        for a, b in self.paths:
+            adj[index[a], index[b]] = True
+        return adj
+
+    def indirect_paths(self):
+        """Every chain ``(IV, M1, ..., DV)`` of two or more structural paths.
+
+        Chains are listed by starting construct in model order, serial
+        mediators included; each one is a specific indirect effect.
+        """
+        successors = {c: [b for a, b in self.paths if a == c] for c in self.constructs}
+        chains = []
+
+        def extend(chain):
+            for nxt in successors[chain[-1]]:
+                longer = chain + (nxt,)
+                if len(longer) > 2:
+                    chains.append(longer)
+                extend(longer)
+
+        for construct in self.constructs:
+            extend((construct,))
+        return chains
+
+    @classmethod
+    def from_syntax(cls, text):
+        """Parse the lavaan-style model syntax shown in the module docstring.
+
+        A block whose terms are all constructs defines a higher-order
+        construct; mixing constructs and indicators in one block is an error.
+        """
+        blocks, paths, modes = {}, [], {}
+        for number, raw in enumerate(text.splitlines(), start=1):
+            line = raw.split("#", 1)[0].strip()
+            if not line:
+                continue
+            for op, mode in (("=~", "A"), ("<~", "B")):
+                if op in line:
+                    construct, items = line.split(op, 1)
+                    construct = construct.strip()
+                    blocks[construct] = _terms(items, number)
+                    modes[construct] = mode
+                    break
+            else:
+                if "~" not in line:
+                    raise ValueError(f"Line {number}: expected '=~', '<~' or '~' in {raw.strip()!r}.")
+                target, sources = line.split("~", 1)
+                paths.extend((source, target.strip()) for source in _terms(sources, number))
+        higher_order = {}
+        for construct, terms in blocks.items():
+            lower = [term for term in terms if term in blocks]
+            if lower and len(lower) < len(terms):
+                raise ValueError(f"The block of '{construct}' mixes constructs and indicators.")
+            if lower:
+                higher_order[construct] = lower
+        return cls(blocks, paths, modes, higher_order)
+
+    def to_syntax(self):
+        lines = []
+        for construct, items in self.blocks.items():
+            op = "<~" if self.modes[construct] == "B" else "=~"
+            lines.append(f"{construct} {op} {' + '.join(self.higher_order.get(construct, items))}")
+        implied = set(self.higher_order_paths())
+        for target in self.endogenous:
+            sources = [a for a, b in self.paths if b == target and (a, b) not in implied]
+            if sources:
+                lines.append(f"{target} ~ {' + '.join(sources)}")
+        return "\n".join(lines)
+
+
+def _has_cycle(nodes, edges):
+    """Kahn's algorithm: the graph is cyclic if not every node can be ordered."""
+    indegree = {n: 0 for n in nodes}
+    successors = {n: [] for n in nodes}
+    for a, b in edges:
+        successors[a].append(b)
+        indegree[b] += 1
+    ready = [n for n, d in indegree.items() if d == 0]
+    ordered = 0
+    while ready:
+        node = ready.pop()
+        ordered += 1
+        for nxt in successors[node]:
+            indegree[nxt] -= 1
+            if indegree[nxt] == 0:
+                ready.append(nxt)
+    return ordered < len(indegree)
+
+
+def _nested(related, a, b):
+    """Whether constructs ``a`` and ``b`` lie on one higher-order chain."""
+    def below(upper, lower):
+        return any(u == upper and (part == lower or below(part, lower)) for u, part in related)
+    return below(a, b) or below(b, a)
+
+
+def _terms(text, number):
+    terms = [t.strip() for t in text.split("+")]
+    if not all(terms):
+        raise ValueError(f"Line {number}: empty term in {text.strip()!r}.")
+    return terms
@@ -0,0 +1,449 @@
+"""Native PLS path algorithm (Lohmöller / Wold), as run by SmartPLS.
+
+The iterative estimation only needs the indicator correlation matrix ``R``:
+with standardized indicators ``X`` and outer weights ``w`` the latent scores
+are ``y_j = X_j w_j``, so every quantity the algorithm touches can be written
+in terms of ``R``::
+
+    latent correlations   C_jl = w_j' R_jl w_l
+    Mode A outer weights  w_j ∝ Σ_l e_jl R_jl w_l     (e = inner weights)
+    outer loadings        l_j = R_jj w_j              (for standardized scores)
+
+The model is held sparsely: outer weights and loadings are vectors over
+the (indicator, construct) edges of the outer model, and only the blocks
+``R_jl`` of constructs joined by a path (plus each block with itself and,
+for path weighting, co-predecessors of a construct) are ever read. Those
+entries are gathered from ``R`` once per fit, so each iteration costs
+O(Σ_jl q_j q_l) over the connected pairs instead of O(p² k), and no
+indicators x constructs or constructs x constructs matrix is formed. ``R``
+itself is computed once in O(n p²). All internal functions accept a leading
+batch dimension (``R`` of shape ``(..., p, p)``) so resampling procedures
+can estimate many correlation matrices in one vectorized call.
+"""
+import copy
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+SCHEMES = ("path", "factor", "centroid")
+
+RELIABILITY_COLUMNS = [
+    "Cronbach's alpha",
+    "Composite reliability (rho_c)",
+    "Average variance extracted (AVE)",
+]
+
+
+def standardize(X):
+    """Center and scale the columns of ``X`` to unit variance (ddof=0)."""
+    X = np.asarray(X, dtype=float)
+    if np.isnan(X).any():
+        raise ValueError("The data contain missing values. Handle them before estimating the model.")
+    std = X.std(axis=0)
+    if (std == 0).any():
+        raise ValueError("At least one indicator has zero variance.")
+    return (X - X.mean(axis=0)) / std
+
+
+def correlation(X):
+    """Indicator correlation matrix computed from one standardized copy of ``X``."""
+    Z = standardize(X)
+    return Z.T @ Z / len(Z)
+
+
+class _Structure:
+    """Index arrays derived from a :class:`ModelSpec`.
+
+    Outer edges are ordered block by block (``items``/``block``, with
+    ``spans[j]`` the edge indices of block ``j``); each path ``a -> b`` gives the
+    two directed links ``(a, b)`` and ``(b, a)``, sorted by their first
+    construct. ``entry_rows``/``entry_cols`` list the distinct entries of
+    ``R`` the algorithm reads; the ``*_entry`` arrays pick them in an order
+    grouped so that ``np.add.reduceat`` turns products with the weights
+    into per-edge, per-link or per-pair sums.
+    """
+
+    def __init__(self, spec):
+        self.spec = spec
+        constructs = spec.constructs
+        self.k = len(constructs)
+        self.items, self.block = spec.outer_edges()
+        self.m = len(self.items)
+        self.size = np.bincount(self.block, minlength=self.k)
+        self.starts = _starts(self.size)
+        self.spans = [np.arange(a, a + q) for a, q in zip(self.starts, self.size)]
+        self.rows = [self.items[span] for span in self.spans]
+        self.mode_b = [j for j, c in enumerate(constructs) if spec.modes[c] == "B"]
+        self.src, self.dst = spec.path_index()
+        self.into = [np.flatnonzero(self.dst == j) for j in range(self.k)]
+        self.preds = [self.src[into] for into in self.into]
+
+        # Directed links: (a, b) for successors, (b, a) for predecessors.
+        paths = np.arange(len(self.src))
+        first, second = np.r_[self.src, self.dst], np.r_[self.dst, self.src]
+        order = np.lexsort((second, first))
+        self.link_from, self.link_to = first[order], second[order]
+        self.link_succ = order < len(paths)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        self.path_link, pred_link = rank[:len(paths)], rank[len(paths):]
+        self.pred_links = [pred_link[into] for into in self.into]
+
+        # R_jl entries of every link, grouped by (row edge, link).
+        rows, cols, edges, group_size, group_link, group_edge = [], [], [], [], [], []
+        for a in range(self.k):
+            own = np.flatnonzero(self.link_from == a)
+            targets = np.concatenate([self.spans[b] for b in self.link_to[own]])
+            rows.append(np.repeat(self.rows[a], len(targets)))
+            cols.append(np.tile(self.items[targets], self.size[a]))
+            edges.append(np.tile(targets, self.size[a]))
+            group_size.append(np.tile(self.size[self.link_to[own]], self.size[a]))
+            group_link.append(np.tile(own, self.size[a]))
+            group_edge.append(np.repeat(self.spans[a], len(own)))
+        link_rows, link_cols, self.link_edge = map(np.concatenate, (rows, cols, edges))
+        group_size, self.group_link, self.group_edge = map(np.concatenate, (group_size, group_link, group_edge))
+        self.group_starts = _starts(group_size)
+        self.edge_starts = np.searchsorted(self.group_edge, np.arange(self.m))
+        self.group_order = np.argsort(self.group_link, kind="stable")
+        self.link_starts = np.searchsorted(self.group_link[self.group_order], np.arange(len(order)))
+
+        # R_jj entries of every block, grouped by row edge.
+        diag_rows = np.concatenate([np.repeat(block, len(block)) for block in self.rows])
+        diag_cols = np.concatenate([np.tile(block, len(block)) for block in self.rows])
+        self.diag_edge = np.concatenate([np.tile(span, len(span)) for span in self.spans])
+        self.diag_starts = _starts(self.size[self.block])
+        self.diag_block_starts = _starts(self.size ** 2)
+
+        # Co-predecessors not joined by a path, needed by the path scheme's regressions.
+        linked = {frozenset(pair) for pair in zip(self.src, self.dst)}
+        extra = list(dict.fromkeys(
+            (a, b) for P in self.preds for i, a in enumerate(P) for b in P[i + 1:] if frozenset((a, b)) not in linked
+        ))
+        extra_rows = np.concatenate([np.repeat(self.rows[a], self.size[b]) for a, b in extra] or [[]]).astype(int)
+        extra_cols = np.concatenate([np.tile(self.rows[b], self.size[a]) for a, b in extra] or [[]]).astype(int)
+        self.extra_left = np.concatenate([np.repeat(self.spans[a], self.size[b]) for a, b in extra] or [[]]).astype(int)
+        self.extra_right = np.concatenate([np.tile(self.spans[b], self.size[a]) for a, b in extra] or [[]]).astype(int)
+        self.extra_starts = _starts([self.size[a] * self.size[b] for a, b in extra])
+
+        # Distinct entries of R (upper triangle) read by a fit.
+        p = len(spec.indicators)
+        rows = np.concatenate([link_rows, diag_rows, extra_rows])
+        cols = np.concatenate([link_cols, diag_cols, extra_cols])
+        key, where = np.unique(np.minimum(rows, cols) * p + np.maximum(rows, cols), return_inverse=True)
+        self.entry_rows, self.entry_cols = np.divmod(key, p)
+        self.link_entry, self.diag_entry, self.extra_entry = np.split(where, np.cumsum([len(link_rows), len(diag_rows)]))
+
+        # Positions in the pair correlation vector c = [1, C of each path, C of each extra pair].
+        slot = {}
+        for i, (a, b) in enumerate(zip(self.src, self.dst)):
+            slot[a, b] = slot[b, a] = 1 + i
+        for x, (a, b) in enumerate(extra):
+            slot[a, b] = slot[b, a] = 1 + len(paths) + x
+        self.regressions = [
+            (j, np.array([[slot.get((a, b), 0) for b in P] for a in P]), 1 + self.into[j])
+            for j, P in enumerate(self.preds) if len(P)
+        ]
+
+    def without(self, h, spec):
+        """The structure of ``spec``, this model with indicator ``h`` deleted.
+
+        The edges of ``h`` (one per block it is in) and every element that
+        reads them are masked out of the index arrays, and the rest is
+        renumbered, in O(size of the arrays) instead of a rebuild. The
+        constructs and paths, and with them the link and regression
+        layout, are shared. Every block must keep an indicator.
+        """
+        gone = self.items == h
+        edge = np.cumsum(~gone) - 1
+        s = copy.copy(self)
+        s.spec = spec
+        s.items = self.items[~gone] - (self.items[~gone] > h)
+        s.block = self.block[~gone]
+        s.m = len(s.items)
+        s.size = np.bincount(s.block, minlength=self.k)
+        if not s.size.all():
+            raise ValueError("Every construct must keep an indicator.")
+        s.starts = _starts(s.size)
+        s.spans = [np.arange(a, a + q) for a, q in zip(s.starts, s.size)]
+        s.rows = [s.items[span] for span in s.spans]
+
+        # Link groups of deleted row edges go; the others lose the deleted target edges.
+        row_edge = np.repeat(self.group_edge, np.diff(np.r_[self.group_starts, len(self.link_edge)]))
+        keep_link = ~gone[row_edge] & ~gone[self.link_edge]
+        groups = ~gone[self.group_edge]
+        s.link_edge = edge[self.link_edge[keep_link]]
+        s.group_edge = edge[self.group_edge[groups]]
+        s.group_link = self.group_link[groups]
+        s.group_starts = _starts(_kept(keep_link, self.group_starts)[groups])
+        s.edge_starts = np.searchsorted(s.group_edge, np.arange(s.m))
+        s.group_order = np.argsort(s.group_link, kind="stable")
+        s.link_starts = np.searchsorted(s.group_link[s.group_order], np.arange(len(self.link_from)))
+
+        keep_diag = ~gone[np.repeat(np.arange(self.m), self.size[self.block])] & ~gone[self.diag_edge]
+        s.diag_edge = edge[self.diag_edge[keep_diag]]
+        s.diag_starts = _starts(s.size[s.block])
+        s.diag_block_starts = _starts(s.size ** 2)
+
+        keep_extra = ~gone[self.extra_left] & ~gone[self.extra_right]
+        s.extra_left, s.extra_right = edge[self.extra_left[keep_extra]], edge[self.extra_right[keep_extra]]
+        s.extra_starts = _starts(_kept(keep_extra, self.extra_starts))
+
+        # The entries still read keep their (row, column) order under the renumbering.
+        kept = self.link_entry[keep_link], self.diag_entry[keep_diag], self.extra_entry[keep_extra]
+        used = np.unique(np.concatenate(kept))
+        s.link_entry, s.diag_entry, s.extra_entry = (np.searchsorted(used, e) for e in kept)
+        rows, cols = self.entry_rows[used], self.entry_cols[used]
+        s.entry_rows, s.entry_cols = rows - (rows > h), cols - (cols > h)
+        return s
+
+
+def _kept(keep, starts):
+    """Number of kept elements in each group starting at ``starts``."""
+    return np.add.reduceat(keep.astype(int), starts) if len(starts) else np.zeros(0, dtype=int)
+
+
+def _starts(sizes):
+    """Start offsets of consecutive groups of the given sizes."""
+    return np.cumsum(np.r_[0, sizes], dtype=int)[:-1]
+
+
+def _swap(a):
+    return np.swapaxes(a, -1, -2)
+
+
+def _gather(R, s):
+    """The entries (..., T) of correlation matrices ``R`` (..., p, p) that a fit reads."""
+    return R[..., s.entry_rows, s.entry_cols]
+
+
+class _Entries:
+    """Correlation entries (..., T) laid out for the weight updates."""
+
+    def __init__(self, r, s):
+        self.s = s
+        self.link = r[..., s.link_entry]
+        self.diag = r[..., s.diag_entry]
+        self.extra = r[..., s.extra_entry]
+        self.mode_b = {}
+        for j in s.mode_b:
+            a, q = s.diag_block_starts[j], s.size[j]
+            self.mode_b[j] = self.diag[..., a:a + q * q].reshape(r.shape[:-1] + (q, q))
+
+    def loadings(self, w):
+        """``R_jj w_j`` for every edge: the loadings of unit-variance scores."""
+        return np.add.reduceat(self.diag * w[..., self.s.diag_edge], self.s.diag_starts, axis=-1)
+
+    def proxies(self, w):
+        """``R_jl w_l`` per (edge of j, link (j, l)) group."""
+        return np.add.reduceat(self.link * w[..., self.s.link_edge], self.s.group_starts, axis=-1)
+
+    def link_correlations(self, U, w):
+        """Latent correlations ``C_jl`` of every link from the proxies ``U``."""
+        s = self.s
+        return np.add.reduceat((U * w[..., s.group_edge])[..., s.group_order], s.link_starts, axis=-1)
+
+    def pairs(self, C, w):
+        """Pair correlation vector ``[1, C of each path, C of each extra pair]``."""
+        s = self.s
+        ones = np.ones(C.shape[:-1] + (1,))
+        if not len(s.extra_starts):
+            return np.concatenate([ones, C[..., s.path_link]], axis=-1)
+        products = self.extra * w[..., s.extra_left] * w[..., s.extra_right]
+        extra = np.add.reduceat(products, s.extra_starts, axis=-1)
+        return np.concatenate([ones, C[..., s.path_link], extra], axis=-1)
+
+
+def _normalize(w, L, s):
+    """Scale each block's weights so its latent score has unit variance."""
+    scale = 1.0 / np.sqrt(np.add.reduceat(w * L, s.starts, axis=-1))[..., s.block]
+    return w * scale, L * scale
+
+
+def _regression(c, pp, pj):
+    return np.linalg.solve(c[..., pp], c[..., pj][..., None])[..., 0]
+
+
+def _inner_weights(C, c, s, scheme):
+    if scheme == "centroid":
+        return np.sign(C)
+    if scheme == "factor":
+        return C
+    # Path weighting: successors get their correlation, predecessors the
+    # coefficients of a multiple regression of the construct on them.
+    E = np.where(s.link_succ, C, 0.0)
+    for j, pp, pj in s.regressions:
+        E[..., s.pred_links[j]] = _regression(c, pp, pj)
+    return E
+
+
+def _fit(R, s, scheme="path", tol=1e-7, max_iter=300, w0=None):
+    """Run the iterative algorithm on correlation matrices ``R`` (..., p, p).
+
+    Returns converged edge weights ``w`` (..., m), the pair correlation
+    vector ``c`` read by :func:`_paths`, the edge loadings, the number of
+    iterations and, for every problem in the batch, whether it converged
+    within ``tol``.
+    """
+    return _fit_entries(_gather(R, s), s, scheme, tol, max_iter, w0)
+
+
+def _fit_entries(r, s, scheme="path", tol=1e-7, max_iter=300, w0=None):
+    """:func:`_fit` on the gathered entries ``r`` (..., T) instead of full matrices."""
+    if scheme not in SCHEMES:
+        raise ValueError(f"Unknown weighting scheme '{scheme}'. Use one of {SCHEMES}.")
+    g = _Entries(r, s)
+    w = np.broadcast_to(np.ones(s.m) if w0 is None else w0, r.shape[:-1] + (s.m,)).copy()
+    w, L = _normalize(w, g.loadings(w), s)
+    for iteration in range(1, max_iter + 1):
+        U = g.proxies(w)
+        C = g.link_correlations(U, w)
+        E = _inner_weights(C, g.pairs(C, w) if scheme == "path" else None, s, scheme)
+        w_new = np.add.reduceat(U * E[..., s.group_link], s.edge_starts, axis=-1)
+        for j, Rjj in g.mode_b.items():
+            span = s.spans[j]
+            w_new[..., span] = np.linalg.solve(Rjj, w_new[..., span][..., None])[..., 0]
+        w_new, L_new = _normalize(w_new, g.loadings(w_new), s)
+        delta = np.max(np.abs(w_new - w), axis=-1)
+        w, L = w_new, L_new
+        if np.all(delta < tol):
+            break
+    return w, g.pairs(g.link_correlations(g.proxies(w), w), w), L, iteration, delta < tol
+
+
+def _paths(c, s):
+    """Path coefficients (..., paths), ordered like ``spec.paths``, and R² for every construct."""
+    B = np.zeros(c.shape[:-1] + (len(s.src),))
+    r2 = np.zeros(c.shape[:-1] + (s.k,))
+    for j, pp, pj in s.regressions:
+        beta = _regression(c, pp, pj)
+        B[..., s.into[j]] = beta
+        r2[..., j] = np.sum(beta * c[..., pj], axis=-1)
+    return B, r2
+
+
+def _f_squared(c, s, r2):
+    """Cohen's f² for every path, from R² with and without each predictor."""
+    f2 = np.full(c.shape[:-1] + (len(s.src),), np.nan)
+    for j, pp, pj in s.regressions:
+        for i, path in enumerate(s.into[j]):
+            rest = np.delete(np.arange(len(pj)), i)
+            r2_excl = 0.0
+            if len(rest):
+                beta = _regression(c, pp[rest[:, None], rest], pj[rest])
+                r2_excl = np.sum(beta * c[..., pj[rest]], axis=-1)
+            f2[..., path] = (r2[..., j] - r2_excl) / (1.0 - r2[..., j])
+    return f2
+
+
+def _reliability(R, L, s):
+    """Cronbach's alpha, rho_c and AVE per construct (vectorized over blocks)."""
+    q = s.size
+    sum_l = np.add.reduceat(L, s.starts, axis=-1)
+    sum_l2 = np.add.reduceat(L ** 2, s.starts, axis=-1)
+    rho_c = sum_l ** 2 / (sum_l ** 2 + q - sum_l2)
+    ave = sum_l2 / q
+    total = np.add.reduceat(_gather(R, s)[..., s.diag_entry], s.diag_block_starts, axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        alpha = np.where(q > 1, q / (q - 1) * (1 - q / total), 1.0)
+    return alpha, rho_c, ave
+
+
+def _topological(preds):
+    """Construct indices in an order where every predecessor comes first."""
+    order, placed = [], np.zeros(len(preds), dtype=bool)
+    while not placed.all():
+        ready = [j for j, P in enumerate(preds) if not placed[j] and placed[P].all()]
+        order += ready
+        placed[ready] = True
+    return order
+
+
+def _scores(Z, s, w):
+    """Latent scores (n, k) of standardized data ``Z`` from the edge weights."""
+    return np.column_stack([Z[:, rows] @ w[span] for rows, span in zip(s.rows, s.spans)])
+
+
+def _dense(values, s, fill=np.nan):
+    """Indicators x constructs matrix of per-edge ``values`` (for reporting only)."""
+    out = np.full((len(s.spec.indicators), s.k), fill)
+    out[s.items, s.block] = values
+    return out
+
+
+def _latent_correlations(R, s, w):
+    """Full constructs x constructs correlation matrix of the latent scores."""
+    RW = np.add.reduceat(R[:, s.items] * w, s.starts, axis=1)
+    return np.add.reduceat(RW[s.items] * w[:, None], s.starts, axis=0)
+
+
+@dataclass
+class PLSResult:
+    """Estimates of one PLS run, laid out like the SmartPLS report tables."""
+    spec: object
+    scheme: str
+    iterations: int
+    converged: bool
+    n: int
+    outer_weights: pd.DataFrame
+    outer_loadings: pd.DataFrame
+    path_coefficients: pd.DataFrame
+    r2: pd.Series
+    f2: pd.DataFrame
+    reliability: pd.DataFrame
+    latent_correlations: pd.DataFrame
+    scores: pd.DataFrame = None
+
+    @property
+    def paths(self):
+        """Long table of the structural paths (``IV -> DV`` rows)."""
+        B = self.path_coefficients
+        rows = [(f"{a} -> {b}", B.loc[a, b], self.f2.loc[a, b]) for a, b in self.spec.paths]
+        return pd.DataFrame(rows, columns=["Path", "Path coefficient", "f²"]).set_index("Path")
+
+
+def estimate_correlation(R, spec, scheme="path", tol=1e-7, max_iter=300, n=None):
+    """Estimate ``spec`` from an indicator correlation matrix ordered like ``spec.indicators``."""
+    s = _Structure(spec)
+    w, c, L, iterations, converged = _fit(R, s, scheme, tol, max_iter)
+    B, r2 = _paths(c, s)
+    alpha, rho_c, ave = _reliability(R, L, s)
+
+    items, constructs = spec.indicators, spec.constructs
+    square = lambda a: pd.DataFrame(a, index=constructs, columns=constructs)
+    paths = np.zeros((s.k, s.k))
+    paths[s.src, s.dst] = B
+    f2 = np.full((s.k, s.k), np.nan)
+    f2[s.src, s.dst] = _f_squared(c, s, r2)
+    return PLSResult(
+        spec=spec,
+        scheme=scheme,
+        iterations=iterations,
+        converged=bool(converged),
+        n=n,
+        outer_weights=pd.DataFrame(_dense(w, s), index=items, columns=constructs),
+        outer_loadings=pd.DataFrame(_dense(L, s), index=items, columns=constructs),
+        path_coefficients=square(paths),
+        r2=pd.Series(r2, index=constructs).loc[spec.endogenous],
+        f2=square(f2),
+        reliability=pd.DataFrame(np.column_stack([alpha, rho_c, ave]), index=constructs, columns=RELIABILITY_COLUMNS),
+        latent_correlations=square(_latent_correlations(np.asarray(R), s, w)),
+    )
+
+
+def estimate(data, spec, scheme="path", tol=1e-7, max_iter=300):
+    """Run the PLS algorithm on raw indicator ``data`` (a DataFrame).
+
+    ``scheme`` is the inner weighting scheme (``"path"``, ``"factor"`` or
+    ``"centroid"``); iteration stops once no outer weight changes by more
+    than ``tol`` (SmartPLS's stop criterion is 1e-7 with 300 iterations).
+    """
+    missing = [item for item in spec.indicators if item not in data.columns]
+    if missing:
+        raise ValueError(f"Indicators not found in the data: {', '.join(missing)}.")
+    Z = standardize(data[spec.indicators].to_numpy(dtype=float))
+    result = estimate_correlation(Z.T @ Z / len(Z), spec, scheme, tol, max_iter, n=len(Z))
+    s = _Structure(spec)
+    w = result.outer_weights.to_numpy()[s.items, s.block]
+    result.scores = pd.DataFrame(_scores(Z, s, w), index=data.index, columns=spec.constructs)
+    return result
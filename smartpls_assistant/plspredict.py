@@ -0,0 +1,123 @@
+"""PLSpredict: out-of-sample prediction with repeated k-fold cross-validation.
+
+Following Shmueli et al. (2016, 2019), the model is estimated on the
+training folds; hold-out cases get exogenous construct scores from the
+trained weights. Endogenous scores are predicted through the structural
+model, and indicators as ``loading * score``, rescaled with the training
+means and standard deviations. The naive training mean gives Q²predict, and
+a linear regression of each endogenous indicator on all exogenous
+indicators (LM) is the benchmark.
+
+Folds are index arrays derived from one permutation per repetition. The
+training moments are obtained by subtracting the hold-out rows' cross
+products from the full-sample ones, so only the hold-out rows are ever
+copied and memory stays flat in the number of folds and repetitions.
+"""
+import numpy as np
+import pandas as pd
+
+from . import _parallel, pls
+
+
+class _Task:
+    """Centered data, full cross products and index arrays shared by all folds."""
+
+    def __init__(self, X, spec, scheme, tol, max_iter, folds):
+        self.X = X - X.mean(axis=0)
+        self.XtX = self.X.T @ self.X
+        self.spec = spec
+        self.scheme = scheme
+        self.tol = tol
+        self.max_iter = max_iter
+        self.folds = folds
+        self.structure = pls._Structure(spec)
+        self.exo_items, self.endo_edges = _split_items(self.structure)
+        self.order = pls._topological(self.structure.preds)
+
+
+def _split_items(s):
+    """Indicators of the exogenous constructs and the outer edges to predict.
+
+    Each indicator of an endogenous construct is predicted once, through
+    the first block that measures it; indicators that also measure an
+    exogenous construct (repeated indicators) are predictors only.
+    """
+    exogenous = np.isin(s.block, [j for j, P in enumerate(s.preds) if not len(P)])
+    exo_items = np.unique(s.items[exogenous])
+    endogenous = np.flatnonzero(~exogenous & ~np.isin(s.items, exo_items))
+    _, first = np.unique(s.items[endogenous], return_index=True)
+    return exo_items, endogenous[np.sort(first)]
+
+
+def _fold(task, seed, fold):
+    """Hold-out errors of PLS and LM for one fold of one repetition."""
+    n = len(task.X)
+    test = np.array_split(np.random.default_rng(seed).permutation(n), task.folds)[fold]
+    Xt = task.X[test]
+    m = n - len(test)
+    mean = -Xt.sum(axis=0) / m
+    cov = (task.XtX - Xt.T @ Xt) / m - np.outer(mean, mean)
+    sd = np.sqrt(np.diag(cov))
+    R = cov / np.outer(sd, sd)
+
+    s = task.structure
+    w, c, L, _, _ = pls._fit(R, s, task.scheme, task.tol, task.max_iter)
+    B, _ = pls._paths(c, s)
+    scores = pls._scores((Xt - mean) / sd, s, w)
+    for j in task.order:
+        if len(s.preds[j]):
+            scores[:, j] = scores[:, s.preds[j]] @ B[s.into[j]]
+    edges = task.endo_edges
+    items = s.items[edges]
+    pls_pred = mean[items] + sd[items] * scores[:, s.block[edges]] * L[edges]
+
+    x, y = task.exo_items, items
+    beta = np.linalg.solve(cov[np.ix_(x, x)], cov[np.ix_(x, y)])
+    lm_pred = mean[y] + (Xt[:, x] - mean[x]) @ beta
+
+    actual = Xt[:, y]
+    return np.stack([
+        np.sum((actual - pls_pred) ** 2, axis=0),
+        np.sum(np.abs(actual - pls_pred), axis=0),
+        np.sum((actual - lm_pred) ** 2, axis=0),
+        np.sum(np.abs(actual - lm_pred), axis=0),
+        np.sum((actual - mean[y]) ** 2, axis=0),
+    ])
+
+
+def predictive_power(table):
+    """Shmueli et al. (2019) verdict from how often PLS beats LM on RMSE."""
+    better = int((table["PLS RMSE"] < table["LM RMSE"]).sum())
+    total = len(table)
+    if better == total:
+        return "high", better, total
+    if better > total / 2:
+        return "medium", better, total
+    if better > 0:
+        return "low", better, total
+    return "none", better, total
+
+
+def plspredict(data, spec, folds=10, repetitions=10, scheme="path", seed=0, n_jobs=None, progress=None,
+               tol=1e-7, max_iter=300):
+    """Q²predict, RMSE and MAE per endogenous indicator, PLS versus LM benchmark."""
+    X = data[spec.indicators].to_numpy(dtype=float)
+    if np.isnan(X).any():
+        raise ValueError("The data contain missing values. Handle them before running PLSpredict.")
+    if not 2 <= folds <= len(X) // 2:
+        raise ValueError("The number of folds must be at least 2 and leave at least two cases per fold.")
+    seeds = np.random.SeedSequence(seed).spawn(repetitions)
+    jobs = [(child, fold) for child in seeds for fold in range(folds)]
+    results = _parallel.run(_Task, (X, spec, scheme, tol, max_iter, folds), _fold, jobs, n_jobs=n_jobs, progress=progress)
+
+    sse_pls, sae_pls, sse_lm, sae_lm, sst = np.sum(results, axis=0)
+    count = len(X) * repetitions
+    s = pls._Structure(spec)
+    items = [spec.indicators[h] for h in s.items[_split_items(s)[1]]]
+    return pd.DataFrame({
+        "Q²predict": 1 - sse_pls / sst,
+        "PLS RMSE": np.sqrt(sse_pls / count),
+        "PLS MAE": sae_pls / count,
+        "LM RMSE": np.sqrt(sse_lm / count),
+        "LM MAE": sae_lm / count,
+    }, index=items)
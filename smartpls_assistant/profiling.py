@@ -0,0 +1,191 @@
+"""Timing spans, cache counters and optional profiles of one unit of work.
+
+A :class:`Run` (e.g. one rerun of the app) collects the :func:`span` blocks
+and :func:`count` calls made while it is active in the current thread or
+context; outside a run both are no-ops, so the engines and the cache can be
+instrumented unconditionally::
+
+    with profiling.Run("Step 1") as run:
+        with profiling.span("estimate", "computation"):
+            ...
+    profiling.log(run.as_dict())
+
+Memory per span (the peak of traced allocations above the span's start) is
+measured with :mod:`tracemalloc` only when a run asks for it: tracing slows
+Python down, and its counts include allocations of other threads running at
+the same time. ``profiler="cprofile"`` (or ``"pyinstrument"`` when that
+package is installed) profiles the run's own thread.
+
+:func:`log` writes one JSON object per record to the
+``smartpls_assistant.profiling`` logger, to be collected as a structured log.
+"""
+import cProfile
+import contextvars
+import io
+import json
+import logging
+import marshal
+import pstats
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+_CURRENT = contextvars.ContextVar("smartpls_profiling_run", default=None)
+_TRACING = {"users": 0, "started": False}
+_TRACING_LOCK = threading.Lock()
+
+try:
+    import pyinstrument
+except ImportError:  # optional
+    pyinstrument = None
+
+PROFILERS = ("cprofile",) + (("pyinstrument",) if pyinstrument else ())
+
+
+@dataclass
+class Span:
+    """One timed block: ``memory`` is its peak traced bytes (``None`` if not traced)."""
+    name: str
+    kind: str
+    depth: int
+    seconds: float = 0.0
+    memory: int = None
+
+
+class Run:
+    """Collects spans and counters while active (use as a context manager)."""
+
+    def __init__(self, label="", memory=False, profiler=None):
+        if profiler not in (None, *PROFILERS):
+            raise ValueError(f"Unknown profiler {profiler!r}; available: {', '.join(PROFILERS)}.")
+        self.label = label
+        self.memory = memory
+        self.profiler = profiler
+        self.spans = []
+        self.counters = Counter()
+        self.seconds = 0.0
+        self.profile = None
+        self._stack = []
+        self._profiler = None
+
+    def __enter__(self):
+        self._token = _CURRENT.set(self)
+        if self.memory:
+            _start_tracing()
+        if self.profiler == "cprofile":
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        elif self.profiler == "pyinstrument":
+            self._profiler = pyinstrument.Profiler()
+            self._profiler.start()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.seconds = time.perf_counter() - self._start
+        if self.profiler == "cprofile":
+            self._profiler.disable()
+            self.profile = self._profiler
+        elif self.profiler == "pyinstrument":
+            self._profiler.stop()
+            self.profile = self._profiler
+        self._profiler = None
+        if self.memory:
+            _stop_tracing()
+        _CURRENT.reset(self._token)
+        return False
+
+    def as_dict(self):
+        """JSON-ready summary: total and per-span milliseconds, memory and counters."""
+        return {
+            "label": self.label,
+            "ms": round(self.seconds * 1000, 2),
+            "spans": [{"name": s.name, "kind": s.kind, "depth": s.depth, "ms": round(s.seconds * 1000, 2),
+                       **({"bytes": s.memory} if s.memory is not None else {})} for s in self.spans],
+            "counters": dict(self.counters),
+        }
+
+    def profile_report(self):
+        """``(file name, bytes, MIME type)`` of the captured profile, or ``None``."""
+        if self.profile is None:
+            return None
+        if self.profiler == "pyinstrument":
+            return "profile.html", self.profile.output_html().encode(), "text/html"
+        out = io.StringIO()
+        pstats.Stats(self.profile, stream=out).sort_stats("cumulative").print_stats(60)
+        return "profile.txt", out.getvalue().encode(), "text/plain"
+
+    def profile_dump(self):
+        """Raw cProfile statistics (for snakeviz, ``pstats``), or ``None``."""
+        if self.profiler != "cprofile" or self.profile is None:
+            return None
+        self.profile.create_stats()
+        return marshal.dumps(self.profile.stats)
+
+
+def _start_tracing():
+    with _TRACING_LOCK:
+        _TRACING["users"] += 1
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _TRACING["started"] = True
+
+
+def _stop_tracing():
+    with _TRACING_LOCK:
+        _TRACING["users"] -= 1
+        if not _TRACING["users"] and _TRACING["started"]:
+            tracemalloc.stop()
+            _TRACING["started"] = False
+
+
+def current():
+    """The active :class:`Run`, or ``None``."""
+    return _CURRENT.get()
+
+
+@contextmanager
+def span(name, kind="section"):
+    """Time (and, if the run traces memory, measure) the enclosed block."""
+    run = _CURRENT.get()
+    if run is None:
+        yield None
+        return
+    record = Span(name, kind, len(run._stack))
+    run.spans.append(record)
+    traced = run.memory and tracemalloc.is_tracing()
+    if traced:
+        base, outer_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+    frame = {"peak": 0}
+    run._stack.append(frame)
+    start = time.perf_counter()
+    try:
+        yield record
+    finally:
+        record.seconds = time.perf_counter() - start
+        run._stack.pop()
+        if traced and tracemalloc.is_tracing():
+            peak = max(frame["peak"], tracemalloc.get_traced_memory()[1])
+            record.memory = max(peak - base, 0)
+            # reset_peak() above forgot the enclosing span's earlier peak: hand it up.
+            if run._stack:
+                run._stack[-1]["peak"] = max(run._stack[-1]["peak"], outer_peak, peak)
+
+
+def count(name, n=1):
+    """Add ``n`` to the active run's counter ``name``."""
+    run = _CURRENT.get()
+    if run is not None:
+        run.counters[name] += n
+
+
+def log(record, **fields):
+    """Write ``record`` (plus ``fields`` and a timestamp) as one JSON log line."""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(json.dumps({"time": round(time.time(), 3), **fields, **record}, default=str))
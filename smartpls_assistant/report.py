@@ -0,0 +1,675 @@
+"""Publication-style reports of a session's checks and PLS results.
+
+The pages record every verdict they show in a :class:`CheckLog`. A report
+combines that log with the estimated model (:class:`ReportInput`) into an
+outline of headings, APA-style text, tables and figures (:func:`outline`),
+which :func:`render` writes as HTML, DOCX or PDF. The interpretive text
+applies the thresholds of :mod:`.rules` (Hair et al., 2019).
+
+Figures are drawn with matplotlib's object-oriented API (no pyplot state)
+and rendered to bytes in worker processes through :mod:`._parallel`, so a
+report with dozens of figures is not rendered on the caller's thread or on
+one core. DOCX files are written directly as WordprocessingML and PDF pages
+are laid out with matplotlib, so neither format needs another dependency.
+"""
+import html
+import io
+import re
+import struct
+import textwrap
+import zipfile
+from dataclasses import dataclass, field
+from xml.sax.saxutils import escape
+
+import numpy as np
+import pandas as pd
+
+from . import _parallel
+from .rules import FAIL, PASS, RULES, WARN
+
+# Format -> (MIME type, file extension).
+FORMATS = {
+    "html": ("text/html", "html"),
+    "docx": ("application/vnd.openxmlformats-officedocument.wordprocessingml.document", "docx"),
+    "pdf": ("application/pdf", "pdf"),
+}
+# Metric -> report section of its checks.
+SECTIONS = {
+    "missing": "Data screening",
+    "loading": "Measurement model",
+    "reliability": "Measurement model",
+    "ave": "Measurement model",
+    "htmt": "Measurement model",
+    "vif": "Structural model",
+    "p_value": "Structural model",
+    "r2": "Structural model",
+    "f2": "Structural model",
+    "q2": "Structural model",
+    "plspredict": "Structural model",
+    "mediation": "Advanced analyses",
+    "moderation_p": "Advanced analyses",
+    "mga_p": "Advanced analyses",
+    "fsqca_consistency": "Advanced analyses",
+}
+VERDICTS = {PASS: "Pass", WARN: "Acceptable", FAIL: "Fail", "": ""}
+# f² effect size per band of the "f2" rule (Cohen, 1988).
+EFFECT_SIZES = ("negligible", "small", "medium", "large")
+# Checks kept per session (the oldest are dropped first).
+MAX_CHECKS = 500
+# Larger HTMT matrices are reported as their highest pairs, and drawn without cell labels.
+MATRIX_CONSTRUCTS = 10
+HTMT_PAIRS = 20
+# Bars per loadings figure, and the resolution of the figures in DOCX and PDF reports.
+BARS_PER_FIGURE = 30
+DPI = 150
+
+
+@dataclass(frozen=True)
+class Check:
+    """One verdict shown to the user."""
+    metric: str
+    label: str
+    value: str
+    status: str
+    explanation: str
+
+    @property
+    def section(self):
+        return SECTIONS.get(self.metric, "Other checks")
+
+
+class CheckLog:
+    """The latest verdict of every check of one session, in the order first shown.
+
+    A check is identified by its metric and label, so showing it again on a
+    rerun replaces it instead of adding a copy.
+    """
+
+    def __init__(self, limit=MAX_CHECKS):
+        self.limit = limit
+        self._checks = {}
+
+    def add(self, metric, label, value, status, explanation):
+        self._checks[metric, label] = Check(metric or "", str(label), str(value), status, str(explanation))
+        while len(self._checks) > self.limit:
+            del self._checks[next(iter(self._checks))]
+
+    def clear(self):
+        self._checks.clear()
+
+    def __len__(self):
+        return len(self._checks)
+
+    def __iter__(self):
+        return iter(list(self._checks.values()))
+
+    def table(self):
+        """One row per check, grouped by report section."""
+        rows = [(c.section, c.label, c.value, VERDICTS.get(c.status, c.status), c.explanation) for c in self]
+        table = pd.DataFrame(rows, columns=["Section", "Check", "Value", "Verdict", "Interpretation"])
+        order = {section: i for i, section in enumerate(dict.fromkeys([*SECTIONS.values(), "Other checks"]))}
+        return table.sort_values("Section", key=lambda s: s.map(order), kind="stable", ignore_index=True)
+
+
+@dataclass
+class ReportInput:
+    """Everything a report can show; parts that are missing are left out.
+
+    ``result`` is a :class:`.pls.PLSResult`, ``bootstrap`` a
+    :class:`.bootstrap.BootstrapResult` of the same model and ``htmt``
+    its construct x construct HTMT matrix.
+    """
+    checks: list = field(default_factory=list)
+    result: object = None
+    bootstrap: object = None
+    htmt: pd.DataFrame = None
+    title: str = "PLS-SEM Results"
+
+
+# --- APA formatting ---
+
+def _apa(value, digits=2, bounded=True):
+    """A number in APA style: no leading zero for statistics that cannot exceed 1."""
+    text = f"{value:.{digits}f}"
+    return re.sub(r"^(-?)0\.", r"\1.", text) if bounded else text
+
+
+def _apa_p(p):
+    return "p < .001" if p < 0.001 else f"p = {_apa(p, 3)}"
+
+
+def _span(values, digits=2):
+    low, high = min(values), max(values)
+    return _apa(low, digits) if low == high else f"{_apa(low, digits)} to {_apa(high, digits)}"
+
+
+def _listing(items):
+    items = list(items)
+    if len(items) < 3:
+        return " and ".join(items)
+    return f"{', '.join(items[:-1])}, and {items[-1]}"
+
+
+def _formatted(table, digits=3, bounded=()):
+    """The table as strings: numbers rounded, APA style in ``bounded`` columns, empty cells blank."""
+    out = pd.DataFrame(index=table.index)
+    for column in table.columns:
+        values = table[column]
+        if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+            keep = column in bounded
+            out[column] = [_apa(v, digits, keep) if pd.notna(v) else "" for v in values]
+        else:
+            out[column] = values.fillna("").astype(str)
+    return out.reset_index(drop=True)
+
+
+# --- Outline ---
+
+def _overview(inputs):
+    result = inputs.result
+    if result is None:
+        return "No PLS model was estimated in this session; the report lists the interactive checks only."
+    converged = (f"converged after {result.iterations} iterations" if result.converged
+                 else f"did not converge within {result.iterations} iterations, so its estimates need care")
+    return (f"The model was estimated with the PLS-SEM algorithm ({result.scheme} weighting scheme) on "
+            f"N = {result.n:,} observations and {converged}. Results are evaluated against the guidelines "
+            f"of Hair et al. (2019).")
+
+
+def _measurement(result, htmt):
+    spec = result.spec
+    reflective = [c for c in spec.constructs if spec.modes[c] == "A"]
+    formative = [c for c in spec.constructs if spec.modes[c] == "B"]
+    blocks = [("heading", "Measurement Model")]
+    if reflective:
+        fail_below, ideal = RULES["loading"].bins
+        rows = [(c, item, result.outer_loadings.loc[item, c]) for c in reflective for item in spec.blocks[c]]
+        loadings = pd.DataFrame(rows, columns=["Construct", "Indicator", "Loading"])
+        loadings["Verdict"] = [RULES["loading"].band(v).verdict for v in loadings["Loading"]]
+        weak = loadings[(loadings["Loading"] >= fail_below) & (loadings["Loading"] < ideal)]
+        poor = loadings[loadings["Loading"] < fail_below]
+        text = f"Indicator loadings of the reflective constructs ranged from {_span(loadings['Loading'], 3)}"
+        if weak.empty and poor.empty:
+            text += f"; all exceeded the recommended threshold of {_apa(ideal, 3)}."
+        else:
+            text += (f"; {len(loadings) - len(weak) - len(poor)} of {len(loadings)} exceeded the recommended "
+                     f"threshold of {_apa(ideal, 3)}.")
+            if not weak.empty:
+                text += (f" {_listing(weak['Indicator'])} loaded between {_apa(fail_below)} and {_apa(ideal, 3)} "
+                         f"and should only be kept if reliability and AVE remain adequate.")
+            if not poor.empty:
+                text += f" {_listing(poor['Indicator'])} loaded below {_apa(fail_below)} and should be removed."
+
+        _, reliable = RULES["reliability"].bins
+        reliability = result.reliability.loc[reflective]
+        alpha, rho, ave = (reliability[column] for column in reliability.columns)
+        unreliable = rho.index[rho < reliable]
+        text += (f" Composite reliability (ρc) ranged from {_span(rho)} and Cronbach's α from {_span(alpha)}; ")
+        text += (f"all constructs exceeded {_apa(reliable)}, establishing internal consistency reliability."
+                 if unreliable.empty else f"ρc fell below {_apa(reliable)} for {_listing(unreliable)}.")
+        (convergent,) = RULES["ave"].bins
+        low_ave = ave.index[ave < convergent]
+        text += (f" The average variance extracted (AVE) ranged from {_span(ave)}"
+                 + (f", above {_apa(convergent)} for every construct, establishing convergent validity."
+                    if low_ave.empty else f"; it fell below {_apa(convergent)} for {_listing(low_ave)}, "
+                                          f"so their convergent validity is not established."))
+        blocks += [("text", text),
+                   ("table", "Indicator Loadings", _formatted(loadings, bounded=("Loading",))),
+                   ("table", "Internal Consistency Reliability and Convergent Validity",
+                    _formatted(reliability.rename_axis("Construct").reset_index(), bounded=tuple(reliability.columns)))]
+        for start in range(0, len(loadings), BARS_PER_FIGURE):
+            part = loadings.iloc[start:start + BARS_PER_FIGURE]
+            blocks.append(("figure", "Indicator Loadings" + (f" ({start // BARS_PER_FIGURE + 1})" if len(loadings) > BARS_PER_FIGURE else ""),
+                           "bar", ([f"{c}: {i}" for c, i in zip(part["Construct"], part["Indicator"])], part["Loading"].to_numpy(),
+                                   "Loading", (ideal, fail_below), None)))
+    if formative:
+        rows = [(c, item, result.outer_weights.loc[item, c], result.outer_loadings.loc[item, c]) for c in formative for item in spec.blocks[c]]
+        weights = pd.DataFrame(rows, columns=["Construct", "Indicator", "Outer weight", "Outer loading"])
+        blocks += [("text", f"The formative constructs ({_listing(formative)}) are assessed by their indicators' "
+                            f"collinearity (VIF), outer weights and outer loadings rather than by reliability."),
+                   ("table", "Outer Weights of the Formative Constructs", _formatted(weights))]
+    if htmt is not None and len(htmt) > 1:
+        blocks += _discriminant(htmt)
+    return blocks
+
+
+def _discriminant(htmt):
+    warn_at, fail_at = RULES["htmt"].bins
+    lower = np.tril(np.ones(htmt.shape, dtype=bool), -1)
+    pairs = htmt.where(lower).stack()
+    high = pairs[pairs >= warn_at]
+    text = "Discriminant validity was assessed with the heterotrait-monotrait ratio (HTMT; Henseler et al., 2015). "
+    if high.empty:
+        (a, b), value = pairs.idxmax(), pairs.max()
+        text += (f"All HTMT values were below {_apa(warn_at)} (highest: {b} and {a}, {_apa(value)}), "
+                 f"establishing discriminant validity.")
+    else:
+        described = [f"{b} and {a} ({_apa(v)})" for (a, b), v in high.items()]
+        text += (f"HTMT exceeded {_apa(warn_at)} for {_listing(described)}; values above {_apa(fail_at)} indicate "
+                 f"a lack of discriminant validity even for conceptually similar constructs.")
+    if len(htmt) <= MATRIX_CONSTRUCTS:
+        table = ("Heterotrait-Monotrait Ratio (HTMT)", htmt.where(lower).iloc[1:, :-1].rename_axis("Construct").reset_index())
+    else:
+        top = pairs.sort_values(ascending=False).head(HTMT_PAIRS)
+        table = (f"The {len(top)} Highest Heterotrait-Monotrait Ratios (HTMT)",
+                 pd.DataFrame({"Constructs": [f"{b} and {a}" for a, b in top.index], "HTMT": top.to_numpy(),
+                               "Verdict": [RULES["htmt"].band(v).verdict for v in top]}))
+    return [("text", text),
+            ("table", table[0], _formatted(table[1])),
+            ("figure", "Heterotrait-Monotrait Ratio (HTMT)", "heatmap", (htmt.to_numpy(), list(htmt.index), (warn_at, fail_at)))]
+
+
+def _structural(result, boot):
+    blocks = [("heading", "Structural Model")]
+    r2 = result.r2
+    if not r2.empty:
+        described = [f"{c} (R² = {_apa(v)}, {RULES['r2'].band(v).verdict.rstrip('.').lower()})" for c, v in r2.items()]
+        blocks += [("text", f"The model explains {_listing(described)}."),
+                   ("table", "Coefficients of Determination", _formatted(r2.rename("R²").rename_axis("Construct").reset_index(), bounded=("R²",)))]
+
+    paths = result.paths
+    table = pd.DataFrame({"Path": paths.index, "β": paths["Path coefficient"].to_numpy()})
+    errors = None
+    if boot is not None:
+        summary = boot.summary("paths")
+        alpha = RULES["p_value"].bins[0]
+        t, p = summary["T statistics (|O/STDEV|)"].to_numpy(), summary["P values"].to_numpy()
+        low, high = summary.iloc[:, 5].to_numpy(), summary.iloc[:, 6].to_numpy()
+        table["t"], table["p"] = t, [_apa_p(v).removeprefix("p = ").removeprefix("p ") for v in p]
+        table["95% CI"] = [f"[{_apa(a)}, {_apa(b)}]" for a, b in zip(low, high)]
+        table["Verdict"] = ["Supported" if v < alpha else "Not supported" for v in p]
+        beta = table["β"].to_numpy()
+        errors = np.clip(np.vstack([beta - low, high - beta]), 0, None)
+        significant = [f"{path.replace(' -> ', ' on ')} (β = {_apa(b)}, t = {_apa(tv, 2, False)}, {_apa_p(pv)}, 95% CI [{_apa(a)}, {_apa(c)}])"
+                       for path, b, tv, pv, a, c in zip(table["Path"], beta, t, p, low, high) if pv < alpha]
+        other = [f"{path.replace(' -> ', ' → ')} (β = {_apa(b)}, {_apa_p(pv)})" for path, b, pv in zip(table["Path"], beta, p) if pv >= alpha]
+        text = f"Bootstrapping with {boot.n_boot:,} subsamples (two-tailed tests, α = {_apa(alpha)}"
+        if boot.non_converged:
+            text += f"; {boot.non_converged:,} subsamples did not converge and were left out"
+        text += ") "
+        text += f"showed significant effects of {_listing(significant)}." if significant else "showed no significant path."
+        if other:
+            text += f" {'The path' if len(other) == 1 else 'The paths'} {_listing(other)} {'was' if len(other) == 1 else 'were'} not significant."
+    else:
+        text = ("Path coefficients are reported without significance tests; run bootstrapping in the app to add "
+                "t statistics, p values and confidence intervals.")
+    table["f²"] = paths["f²"].to_numpy()
+    table["Effect size"] = [EFFECT_SIZES[i] for i in RULES["f2"].index(table["f²"].to_numpy())]
+    sizes = {}
+    for path, size in zip(table["Path"], table["Effect size"]):
+        sizes.setdefault(size, []).append(path.replace(" -> ", " → "))
+    text += " Effect sizes (f²) were " + _listing(f"{size} for {_listing(found)}" for size, found in sizes.items()) + "."
+    blocks += [("text", text),
+               ("table", "Structural Model Results", _formatted(table, bounded=("β", "p", "f²"))),
+               ("figure", "Path Coefficients" + (" With 95% Confidence Intervals" if errors is not None else ""),
+                "bar", (list(table["Path"]), table["β"].to_numpy(), "Path coefficient (β)", (), errors))]
+    if not r2.empty:
+        blocks.append(("figure", "Coefficients of Determination", "bar",
+                       (list(r2.index), r2.to_numpy(), "R²", RULES["r2"].bins, None)))
+    return blocks
+
+
+def _checks(checks):
+    log = CheckLog(limit=len(checks) or 1)
+    for c in checks:
+        log.add(c.metric, c.label, c.value, c.status, c.explanation)
+    table = log.table()
+    counts = table["Verdict"].value_counts()
+    summary = ", ".join(f"{counts[v]} {v.lower()}" for v in ("Pass", "Acceptable", "Fail") if v in counts)
+    return [("heading", "Interactive Checks"),
+            ("text", f"{len(table)} values were checked in the app" + (f" ({summary})." if summary else ".")),
+            ("table", "Checked Values and Their Interpretation", table)]
+
+
+def outline(inputs):
+    """Blocks of the report: ``("title" | "heading" | "text", text)``,
+    ``("table", caption, frame of strings)`` and ``("figure", caption, kind, args)``.
+
+    Tables and figures are numbered in order.
+    """
+    blocks = [("title", inputs.title), ("text", _overview(inputs))]
+    if inputs.result is not None:
+        blocks += _measurement(inputs.result, inputs.htmt)
+        blocks += _structural(inputs.result, inputs.bootstrap)
+    if inputs.checks:
+        blocks += _checks(inputs.checks)
+    numbers = {"table": 0, "figure": 0}
+    numbered = []
+    for block in blocks:
+        if block[0] in numbers:
+            numbers[block[0]] += 1
+            block = (block[0], f"{block[0].capitalize()} {numbers[block[0]]}. {block[1]}", *block[2:])
+        numbered.append(block)
+    return numbered
+
+
+# --- Figures (drawn in worker processes) ---
+
+def _bar_figure(labels, values, xlabel, lines, errors):
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(6.5, 0.9 + 0.28 * len(labels)), layout="constrained")
+    ax = fig.add_subplot()
+    y = np.arange(len(labels))[::-1]
+    ax.barh(y, values, xerr=errors, color="#4c72b0", ecolor="#333333", capsize=3, height=0.6)
+    ax.set_yticks(y, labels, fontsize=8)
+    for x in lines:
+        ax.axvline(x, color="#c44e52", linestyle="--", linewidth=0.8)
+    ax.axvline(0, color="black", linewidth=0.8)
+    ax.set_xlabel(xlabel)
+    ax.spines[["top", "right"]].set_visible(False)
+    return fig
+
+
+def _heatmap_figure(values, labels, limits):
+    from matplotlib.figure import Figure
+
+    k = len(labels)
+    cell = min(0.55, 5.0 / k)
+    fig = Figure(figsize=(1.6 + cell * k, 1.2 + cell * k), layout="constrained")
+    ax = fig.add_subplot()
+    shown = np.where(np.tril(np.ones((k, k), dtype=bool), -1), values, np.nan)
+    image = ax.imshow(shown, cmap="RdYlGn_r", vmin=0, vmax=max(1.0, np.nanmax(shown)))
+    for i, j in zip(*np.nonzero(~np.isnan(shown))) if k <= MATRIX_CONSTRUCTS else ():
+        ax.text(j, i, _apa(shown[i, j]), ha="center", va="center", fontsize=7,
+                color="white" if shown[i, j] >= limits[1] else "black")
+    size = min(8.0, cell * 72 * 0.8)
+    ax.set_xticks(range(k), labels, rotation=45, ha="right", fontsize=size)
+    ax.set_yticks(range(k), labels, fontsize=size)
+    fig.colorbar(image, ax=ax, shrink=0.8, label="HTMT")
+    return fig
+
+
+_FIGURES = {"bar": _bar_figure, "heatmap": _heatmap_figure}
+
+
+class _Task:
+    """Figure specifications shared by the workers."""
+
+    def __init__(self, figures):
+        self.figures = figures
+
+
+def _draw(task, i, fmt):
+    kind, args = task.figures[i]
+    out = io.BytesIO()
+    _FIGURES[kind](*args).savefig(out, format=fmt, dpi=DPI)
+    return out.getvalue()
+
+
+# --- Writers ---
+
+_CSS = """
+body { font-family: "Times New Roman", Times, serif; max-width: 48em; margin: 2em auto; padding: 0 1em; line-height: 1.5; color: #111; }
+h1 { font-size: 1.6em; text-align: center; } h2 { font-size: 1.25em; margin-top: 1.6em; }
+table { border-collapse: collapse; margin: 0.4em 0 1.6em; font-size: 0.9em; }
+caption { caption-side: top; text-align: left; font-style: italic; padding-bottom: 0.3em; }
+th { border-top: 2px solid #000; border-bottom: 1px solid #000; padding: 0.2em 0.7em; font-weight: normal; }
+td { padding: 0.2em 0.7em; text-align: center; } td:first-child { text-align: left; }
+tbody tr:last-child td { border-bottom: 2px solid #000; }
+figure { margin: 0.4em 0 1.6em; } figcaption { font-style: italic; } svg { max-width: 100%; height: auto; }
+"""
+
+
+def _html(title, blocks):
+    parts = [f"<!DOCTYPE html>\n<html lang=\"en\"><head><meta charset=\"utf-8\"><title>{html.escape(title)}</title>"
+             f"<style>{_CSS}</style></head><body>"]
+    for block in blocks:
+        kind = block[0]
+        if kind == "title":
+            parts.append(f"<h1>{html.escape(block[1])}</h1>")
+        elif kind == "heading":
+            parts.append(f"<h2>{html.escape(block[1])}</h2>")
+        elif kind == "text":
+            parts.append(f"<p>{html.escape(block[1])}</p>")
+        elif kind == "table":
+            frame = block[2]
+            head = "".join(f"<th>{html.escape(str(c))}</th>" for c in frame.columns)
+            body = "".join("<tr>" + "".join(f"<td>{html.escape(v)}</td>" for v in row) + "</tr>" for row in frame.itertuples(index=False))
+            parts.append(f"<table><caption>{html.escape(block[1])}</caption><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>")
+        else:
+            svg = block[2].decode()
+            parts.append(f"<figure><figcaption>{html.escape(block[1])}</figcaption>{svg[svg.index('<svg'):]}</figure>")
+    parts.append("</body></html>\n")
+    return "\n".join(parts).encode()
+
+
+_W = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+_R = 'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+_WP = 'xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"'
+_XML = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+_CONTENT_TYPES = (_XML + '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                  '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                  '<Default Extension="xml" ContentType="application/xml"/><Default Extension="png" ContentType="image/png"/>'
+                  '<Override PartName="/word/document.xml" '
+                  'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/></Types>')
+_RELATIONSHIPS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PACKAGE_RELS = (_XML + '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                 f'<Relationship Id="rId1" Type="{_RELATIONSHIPS}/officeDocument" Target="word/document.xml"/></Relationships>')
+# A4 with one-inch margins, in twentieths of a point; EMU per inch for images.
+_PAGE = ('<w:sectPr><w:pgSz w:w="11906" w:h="16838"/><w:pgMar w:top="1440" w:right="1440" w:bottom="1440" '
+         'w:left="1440" w:header="708" w:footer="708" w:gutter="0"/></w:sectPr>')
+_TEXT_WIDTH_IN = (11906 - 2 * 1440) / 1440
+_EMU = 914400
+
+
+def _run(text, bold=False, italic=False, size=24):
+    props = '<w:rFonts w:ascii="Times New Roman" w:hAnsi="Times New Roman" w:cs="Times New Roman"/>'
+    props += ("<w:b/>" if bold else "") + ("<w:i/>" if italic else "") + f'<w:sz w:val="{size}"/>'
+    return f'<w:r><w:rPr>{props}</w:rPr><w:t xml:space="preserve">{escape(text)}</w:t></w:r>'
+
+
+def _paragraph(runs, align=None, after=160, keep=False):
+    props = ("<w:keepNext/>" if keep else "") + f'<w:spacing w:before="0" w:after="{after}"/>'
+    props += f'<w:jc w:val="{align}"/>' if align else ""
+    return f"<w:p><w:pPr>{props}</w:pPr>{runs}</w:p>"
+
+
+def _png_size(png):
+    width, height = struct.unpack(">II", png[16:24])
+    return width / DPI, height / DPI
+
+
+def _docx_table(frame):
+    columns = len(frame.columns)
+    grid = "".join(f'<w:gridCol w:w="{int(_TEXT_WIDTH_IN * 1440 / columns)}"/>' for _ in range(columns))
+
+    def cell(text, border):
+        borders = f"<w:tcBorders>{border}</w:tcBorders>" if border else ""
+        return f"<w:tc><w:tcPr>{borders}</w:tcPr>{_paragraph(_run(text, size=18), after=0)}</w:tc>"
+
+    top, rule = '<w:top w:val="single" w:sz="12" w:space="0" w:color="000000"/>', '<w:bottom w:val="single" w:sz="6" w:space="0" w:color="000000"/>'
+    rows = ["<w:tr>" + "".join(cell(str(c), top + rule) for c in frame.columns) + "</w:tr>"]
+    last = len(frame) - 1
+    for i, row in enumerate(frame.itertuples(index=False)):
+        bottom = '<w:bottom w:val="single" w:sz="12" w:space="0" w:color="000000"/>' if i == last else ""
+        rows.append("<w:tr>" + "".join(cell(v, bottom) for v in row) + "</w:tr>")
+    return (f'<w:tbl><w:tblPr><w:tblW w:w="0" w:type="auto"/></w:tblPr><w:tblGrid>{grid}</w:tblGrid>'
+            + "".join(rows) + "</w:tbl>" + _paragraph("", after=160))
+
+
+def _docx_image(n, png):
+    width, height = _png_size(png)
+    scale = min(1.0, _TEXT_WIDTH_IN / width)
+    cx, cy = int(width * scale * _EMU), int(height * scale * _EMU)
+    return ('<w:p><w:pPr><w:spacing w:after="240"/></w:pPr><w:r><w:drawing>'
+            f'<wp:inline distT="0" distB="0" distL="0" distR="0"><wp:extent cx="{cx}" cy="{cy}"/><wp:docPr id="{n}" name="Figure {n}"/>'
+            '<a:graphic xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
+            '<a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/picture">'
+            '<pic:pic xmlns:pic="http://schemas.openxmlformats.org/drawingml/2006/picture">'
+            f'<pic:nvPicPr><pic:cNvPr id="{n}" name="figure{n}.png"/><pic:cNvPicPr/></pic:nvPicPr>'
+            f'<pic:blipFill><a:blip r:embed="rIdFigure{n}"/><a:stretch><a:fillRect/></a:stretch></pic:blipFill>'
+            f'<pic:spPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm><a:prstGeom prst="rect"><a:avLst/></a:prstGeom></pic:spPr>'
+            '</pic:pic></a:graphicData></a:graphic></wp:inline></w:drawing></w:r></w:p>')
+
+
+def _docx(title, blocks):
+    body, images = [], []
+    for block in blocks:
+        kind = block[0]
+        if kind == "title":
+            body.append(_paragraph(_run(block[1], bold=True, size=32), align="center", after=240))
+        elif kind == "heading":
+            body.append(_paragraph(_run(block[1], bold=True, size=28), after=120, keep=True))
+        elif kind == "text":
+            body.append(_paragraph(_run(block[1]), align="both"))
+        elif kind == "table":
+            body.append(_paragraph(_run(block[1], italic=True), after=60, keep=True))
+            body.append(_docx_table(block[2]))
+        else:
+            images.append(block[2])
+            body.append(_paragraph(_run(block[1], italic=True), after=60, keep=True))
+            body.append(_docx_image(len(images), block[2]))
+    document = (_XML + f"<w:document {_W} {_R} {_WP}><w:body>" + "".join(body) + _PAGE + "</w:body></w:document>")
+    rels = (_XML + '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            + "".join(f'<Relationship Id="rIdFigure{n}" Type="{_RELATIONSHIPS}/image" Target="media/figure{n}.png"/>'
+                      for n in range(1, len(images) + 1))
+            + "</Relationships>")
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as docx:
+        docx.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        docx.writestr("_rels/.rels", _PACKAGE_RELS)
+        docx.writestr("word/document.xml", document)
+        docx.writestr("word/_rels/document.xml.rels", rels)
+        for n, png in enumerate(images, start=1):
+            docx.writestr(f"word/media/figure{n}.png", png, zipfile.ZIP_STORED)
+    return out.getvalue()
+
+
+class _Pages:
+    """Top-to-bottom layout of text, tables and images on A4 pages (inches)."""
+    WIDTH, HEIGHT, MARGIN = 8.27, 11.69, 0.9
+
+    def __init__(self, pdf):
+        self.pdf = pdf
+        self.page = None
+        self.y = 0.0
+
+    @property
+    def text_width(self):
+        return self.WIDTH - 2 * self.MARGIN
+
+    def need(self, height):
+        """Start a new page unless ``height`` inches still fit on this one."""
+        if self.page is None or self.y - height < self.MARGIN:
+            self.flush()
+            from matplotlib.figure import Figure
+            self.page = Figure(figsize=(self.WIDTH, self.HEIGHT))
+            self.y = self.HEIGHT - self.MARGIN
+
+    def flush(self):
+        if self.page is not None:
+            self.pdf.savefig(self.page)
+            self.page = None
+
+    def text(self, text, size=10, weight="normal", style="normal", align="left", after=0.12):
+        line = size * 1.45 / 72
+        chars = int(self.text_width / (size * 0.5 / 72))
+        for wrapped in textwrap.wrap(text, chars) or [""]:
+            self.need(line)
+            x = self.WIDTH / 2 if align == "center" else self.MARGIN
+            self.page.text(x / self.WIDTH, self.y / self.HEIGHT, wrapped, fontsize=size, weight=weight, style=style,
+                           ha=align, va="top", family="serif")
+            self.y -= line
+        self.y -= after
+
+    def rule(self, width):
+        from matplotlib.lines import Line2D
+        self.page.add_artist(Line2D([self.MARGIN / self.WIDTH, (self.MARGIN + self.text_width) / self.WIDTH],
+                                    [self.y / self.HEIGHT] * 2, color="black", linewidth=width))
+
+    def table(self, frame, size=7.5):
+        widths = np.array([max([len(str(c))] + [len(v) for v in frame[c]]) for c in frame.columns], dtype=float)
+        widths = np.minimum(widths, 60)
+        widths = widths / widths.sum() * self.text_width
+        chars = np.maximum((widths / (size * 0.5 / 72)).astype(int), 4)
+        line = size * 1.4 / 72
+
+        def row_lines(values):
+            return [textwrap.wrap(str(v), n) or [""] for v, n in zip(values, chars)]
+
+        def draw(cells):
+            height = max(len(c) for c in cells) * line + 0.04
+            x = self.MARGIN
+            for lines, width in zip(cells, widths):
+                for k, text in enumerate(lines):
+                    self.page.text((x + 0.03) / self.WIDTH, (self.y - 0.02 - k * line) / self.HEIGHT, text,
+                                   fontsize=size, va="top", family="serif")
+                x += width
+            self.y -= height
+
+        header = row_lines(frame.columns)
+        header_height = max(len(c) for c in header) * line + 0.04
+        rows = [row_lines(row) for row in frame.itertuples(index=False)]
+        start = True
+        for i, cells in enumerate(rows):
+            height = max(len(c) for c in cells) * line + 0.04
+            if start or self.y - height < self.MARGIN:
+                if not start:
+                    self.rule(1.0)
+                self.need(header_height + height)
+                self.rule(1.0)
+                draw(header)
+                self.rule(0.5)
+                start = False
+            draw(cells)
+        self.rule(1.0)
+        self.y -= 0.25
+
+    def image(self, png):
+        from matplotlib.image import imread
+        width, height = _png_size(png)
+        scale = min(1.0, self.text_width / width, (self.HEIGHT - 2 * self.MARGIN - 0.4) / height)
+        width, height = width * scale, height * scale
+        self.need(height)
+        ax = self.page.add_axes([self.MARGIN / self.WIDTH, (self.y - height) / self.HEIGHT, width / self.WIDTH, height / self.HEIGHT])
+        ax.imshow(imread(io.BytesIO(png), format="png"), interpolation="none")
+        ax.set_axis_off()
+        self.y -= height + 0.25
+
+
+def _pdf(title, blocks):
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    out = io.BytesIO()
+    with PdfPages(out, metadata={"Title": title}) as pdf:
+        pages = _Pages(pdf)
+        for block in blocks:
+            kind = block[0]
+            if kind == "title":
+                pages.text(block[1], size=16, weight="bold", align="center", after=0.2)
+            elif kind == "heading":
+                pages.need(1.2)
+                pages.text(block[1], size=13, weight="bold", after=0.08)
+            elif kind == "text":
+                pages.text(block[1])
+            elif kind == "table":
+                pages.need(0.8)
+                pages.text(block[1], style="italic", after=0.04)
+                pages.table(block[2])
+            else:
+                pages.need(min(_png_size(block[2])[1], 4.0) + 0.3)
+                pages.text(block[1], style="italic", after=0.04)
+                pages.image(block[2])
+        pages.flush()
+    return out.getvalue()
+
+
+_WRITERS = {"html": _html, "docx": _docx, "pdf": _pdf}
+
+
+def render(inputs, fmt="html", n_jobs=None, progress=None):
+    """Write the report of ``inputs`` as ``fmt`` (a key of :data:`FORMATS`) and return its bytes.
+
+    Figures are drawn in up to ``n_jobs`` worker processes (SVG for HTML,
+    PNG otherwise); ``progress(done, total)`` counts figures and may raise
+    to cancel the report.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown report format '{fmt}'. Use one of {tuple(FORMATS)}.")
+    blocks = outline(inputs)
+    figures = [(block[2], block[3]) for block in blocks if block[0] == "figure"]
+    images = iter(_parallel.run(_Task, (figures,), _draw, [(i, "svg" if fmt == "html" else "png") for i in range(len(figures))],
+                                n_jobs=n_jobs, progress=progress))
+    blocks = [(block[0], block[1], next(images)) if block[0] == "figure" else block for block in blocks]
+    return _WRITERS[fmt](inputs.title, blocks)
@@ -0,0 +1,153 @@
+"""Declarative pass/warn/fail rules shared by every checker.
+
+Each metric maps to a :class:`Rule`: ascending cut points plus one
+:class:`Band` (status, verdict, explanation) per interval between them.
+Rules evaluate a scalar or a whole NumPy array in one ``np.digitize`` call,
+so the interactive checkers, the bulk report checker and any headless batch
+job all share the same thresholds (Hair et al., 2019).
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+PASS, WARN, FAIL = "pass", "warn", "fail"
+
+
+@dataclass(frozen=True)
+class Band:
+    """Outcome for values falling in one interval of a rule."""
+    status: str
+    verdict: str
+    explanation: str
+
+    def explain(self, value, **context):
+        """Fill the explanation template with the checked value and context."""
+        return self.explanation.format(value=value, **context)
+
+
+@dataclass(frozen=True)
+class Rule:
+    """Ordered thresholds for one metric.
+
+    ``bins`` are ascending cut points and ``bands`` has one more entry than
+    ``bins``: ``bands[0]`` covers values below ``bins[0]`` and ``bands[-1]``
+    values above ``bins[-1]``. With ``right=False`` a value equal to a cut
+    point belongs to the band above it (``>=``), with ``right=True`` to the
+    band below it (``>``).
+    """
+    label: str
+    bins: tuple
+    bands: tuple
+    right: bool = False
+
+    def __post_init__(self):
+        if len(self.bands) != len(self.bins) + 1:
+            raise ValueError(f"{self.label}: expected {len(self.bins) + 1} bands, got {len(self.bands)}")
+
+    def index(self, values):
+        """Band index for each value (vectorized)."""
+        return np.digitize(values, self.bins, right=self.right)
+
+    def band(self, value):
+        """Band for a single scalar value."""
+        return self.bands[int(self.index(float(value)))]
+
+    def evaluate(self, values):
+        """Status (``"pass"``/``"warn"``/``"fail"``) for every value of an array.
+
+        Missing values (NaN) get an empty string.
+        """
+        values = np.asarray(values, dtype=float)
+        statuses = np.array([band.status for band in self.bands], dtype=object)[self.index(values)]
+        statuses[np.isnan(values)] = ""
+        return statuses
+
+
+RULES = {
+    "loading": Rule("Outer Loading", (0.4, 0.708), (
+        Band(FAIL, "FAIL", "Loading is too low. You must delete this item."),
+        Band(WARN, "ACCEPTABLE", "Weak loading. Only keep if reliability (rho_c, AVE) is high."),
+        Band(PASS, "PASS", "This loading is ideal. Keep it."),
+    )),
+    "reliability": Rule("Internal Consistency Reliability", (0.6, 0.7), (
+        Band(FAIL, "FAIL", "Construct is not reliable. You must fix this (e.g., delete low-loading items)."),
+        Band(WARN, "ACCEPTABLE", "Only acceptable for exploratory research. Try to improve it."),
+        Band(PASS, "PASS", "This construct is reliable."),
+    )),
+    "ave": Rule("Average Variance Extracted (AVE)", (0.5,), (
+        Band(FAIL, "FAIL", "Lacks convergent validity. You must fix this by deleting items with low loadings."),
+        Band(PASS, "PASS", "This construct has convergent validity."),
+    )),
+    "htmt": Rule("HTMT", (0.85, 0.9), (
+        Band(PASS, "PASS", "This construct has discriminant validity."),
+        Band(WARN, "ACCEPTABLE", "This is acceptable, but only if constructs are very similar."),
+        Band(FAIL, "FAIL", "Lacks discriminant validity. Your constructs are not distinct."),
+    )),
+    "vif": Rule("VIF", (3.0, 5.0), (
+        Band(PASS, "PASS", "No multicollinearity issue detected."),
+        Band(WARN, "ACCEPTABLE", "No major collinearity issue, but not ideal."),
+        Band(FAIL, "FAIL", "Multicollinearity is a problem. Consider merging or deleting a predictor."),
+    ), right=True),
+    "p_value": Rule("Path P-Value", (0.05,), (
+        Band(PASS, "SUPPORTED", "SUPPORTED. The relationship is significant and {direction}. (β = {beta:.3f})"),
+        Band(FAIL, "NOT SUPPORTED", "NOT SUPPORTED. The relationship is not significant."),
+    )),
+    "r2": Rule("R²", (0.25, 0.5, 0.75), (
+        Band(FAIL, "Very weak explanatory power.", "The model explains {value:.0%} of the variance."),
+        Band(WARN, "Weak explanatory power.", "The model explains {value:.0%} of the variance."),
+        Band(PASS, "Moderate explanatory power.", "The model explains {value:.0%} of the variance."),
+        Band(PASS, "Substantial explanatory power.", "The model explains {value:.0%} of the variance."),
+    )),
+    "f2": Rule("f²", (0.02, 0.15, 0.35), (
+        Band(FAIL, "No effect size (or negligible).", "This predictor has no (or a negligible) effect."),
+        Band(WARN, "Small effect size.", "This predictor has a small effect size."),
+        Band(PASS, "Medium effect size.", "This predictor has a medium effect size."),
+        Band(PASS, "Large effect size.", "This predictor has a large effect size."),
+    )),
+    "q2": Rule("Q²", (0.0,), (
+        Band(FAIL, "FAIL", "The model lacks predictive relevance."),
+        Band(PASS, "PASS", "The model has predictive relevance."),
+    ), right=True),
+    "moderation_p": Rule("Interaction Term P-Value", (0.05,), (
+        Band(PASS, "SUPPORTED", "You have a significant moderation effect. Run a 'Simple Slope Analysis' to interpret it."),
+        Band(FAIL, "NOT SUPPORTED", "There is no significant moderation effect."),
+    )),
+    "mga_p": Rule("MGA P-Value (Permutation)", (0.05,), (
+        Band(PASS, "DIFFERENCE FOUND", "The effect of '{path}' is significantly different between your groups."),
+        Band(FAIL, "NO DIFFERENCE", "There is no significant difference for '{path}' between your groups."),
+    )),
+    "missing": Rule("Missing Values (%)", (5.0, 15.0), (
+        Band(PASS, "PASS", "Few missing values. Mean replacement is fine."),
+        Band(WARN, "ACCEPTABLE", "Noticeable missingness. Prefer EM imputation or casewise deletion to mean replacement."),
+        Band(FAIL, "FAIL", "Too many missing values. Consider removing this indicator or respondent."),
+    ), right=True),
+    "fsqca_consistency": Rule("fsQCA Consistency", (0.8,), (
+        Band(FAIL, "NOT VALID", "This 'recipe' is not a reliable path to the outcome."),
+        Band(PASS, "VALID RECIPE", "This 'recipe' is a valid path to the outcome, explaining {coverage:.0%} of it."),
+    ), right=True),
+}
+
+MEDIATION = {
+    "partial": Band(PASS, "PARTIAL MEDIATION", "Both direct and indirect effects are significant."),
+    "full": Band(PASS, "FULL MEDIATION", "The indirect effect is significant, but the direct effect is not."),
+    "none": Band(FAIL, "NO MEDIATION", "The indirect effect is not significant."),
+}
+
+
+def evaluate(metric, values):
+    """Evaluate ``values`` against the rule for ``metric``.
+
+    A scalar returns its :class:`Band`; an array returns an array of statuses.
+    """
+    rule = RULES[metric]
+    if np.ndim(values) == 0:
+        return rule.band(values)
+    return rule.evaluate(values)
+
+
+def mediation_type(indirect_p, direct_p, alpha=0.05):
+    """Classify mediation as ``"partial"``, ``"full"`` or ``"none"`` (vectorized)."""
+    indirect_sig = np.asarray(indirect_p) < alpha
+    direct_sig = np.asarray(direct_p) < alpha
+    kinds = np.select([indirect_sig & direct_sig, indirect_sig], ["partial", "full"], default="none")
+    return kinds.item() if kinds.ndim == 0 else kinds
@@ -0,0 +1,271 @@
+"""Data screening and missing-value treatment before estimation.
+
+Screening works on the indicator matrix as a whole, with the missing cells
+as a boolean mask: missingness per indicator, straight-lining (respondents
+whose answers have zero variance), codes outside the response scale (which
+then count as missing), univariate outliers (|z| > 3) and multivariate
+outliers (Mahalanobis distance over a respondent's answered indicators).
+
+Missing values are replaced by the indicator mean (SmartPLS's default),
+removed casewise, or imputed by EM under a multivariate normal model. The
+E-step fills the missing cells of a row with their conditional mean given
+its observed cells, ``x_m = mu_m - (Λ_mm)^-1 Λ_mo (x_o - mu_o)`` with the
+precision matrix Λ. Rows are batched by their number of missing cells, so
+an iteration is a few stacked solves rather than a loop over indicators or
+respondents.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from ._stats import chi2_ppf
+
+METHODS = ("mean", "casewise", "em")
+OUTLIER_Z = 3.0
+MAHALANOBIS_ALPHA = 0.001
+
+# Bound on the stacked (rows x q x q) blocks of one E-step batch.
+_BATCH_BYTES = 16 * 2 ** 20
+
+
+def _matrix(data, indicators, scale):
+    """Indicator columns, their values as float64, the missing cells and the invalid codes."""
+    columns = list(indicators) if indicators is not None else list(data.select_dtypes("number").columns)
+    if not columns:
+        raise ValueError("The data have no numeric indicator columns to screen.")
+    X = data[columns].to_numpy(dtype=float)
+    missing = np.isnan(X)
+    if scale is None:
+        invalid = np.zeros_like(missing)
+    else:
+        low, high = scale
+        with np.errstate(invalid="ignore"):
+            invalid = ~missing & ((X < low) | (X > high) | (X != np.round(X)))
+    return columns, X, missing, invalid
+
+
+def _moments(X, mask):
+    """Count, mean and standard deviation (n - 1) of each column over its unmasked cells."""
+    count = (~mask).sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(mask, 0.0, X).sum(axis=0) / count
+        dev = np.where(mask, 0.0, X - mean)
+        sd = np.sqrt(np.einsum("ij,ij->j", dev, dev) / (count - 1))
+    return count, mean, sd
+
+
+def _standardize(X, mask):
+    """z-scores over the unmasked cells (0 in masked cells and constant columns), plus mean and scale."""
+    _, mean, sd = _moments(X, mask)
+    scale = np.where(sd > 0, sd, 1.0)
+    return np.where(mask, 0.0, (X - mean) / scale), mean, scale
+
+
+def _precision(S):
+    """Inverse of a covariance matrix, which must be positive definite."""
+    try:
+        np.linalg.cholesky(S)
+    except np.linalg.LinAlgError:
+        raise ValueError("The indicator covariance matrix is singular; remove constant or duplicated "
+                         "indicators, or collect more responses than indicators.") from None
+    return np.linalg.inv(S)
+
+
+def _conditional(D, mask, precision):
+    """Condition each row's missing cells on its observed ones.
+
+    ``D`` holds deviations from the mean with zeros in the missing cells.
+    Returns ``D`` with the missing cells filled by their conditional means,
+    the summed conditional covariance of the missing cells (p x p) and each
+    row's squared Mahalanobis distance over its observed cells.
+    """
+    G = D @ precision
+    filled = D.copy()
+    # d' S_oo^-1 d = d' Λ_oo d - g' (Λ_mm)^-1 g with g = Λ_mo d.
+    distance = np.einsum("ij,ij->i", D, G)
+    spread = np.zeros_like(precision)
+    counts = mask.sum(axis=1)
+    for q in np.unique(counts[counts > 0]):
+        rows = np.flatnonzero(counts == q)
+        step = max(1, _BATCH_BYTES // (8 * q * q))
+        for start in range(0, len(rows), step):
+            r = rows[start:start + step]
+            cols = np.nonzero(mask[r])[1].reshape(len(r), q)
+            inverse = np.linalg.inv(precision[cols[:, :, None], cols[:, None, :]])
+            g = G[r[:, None], cols]
+            z = -np.einsum("rij,rj->ri", inverse, g)
+            filled[r[:, None], cols] = z
+            distance[r] += np.einsum("ri,ri->r", g, z)
+            np.add.at(spread, (cols[:, :, None], cols[:, None, :]), inverse)
+    return filled, spread, distance
+
+
+def _mahalanobis(Z, mask):
+    """Squared Mahalanobis distance of every row over its observed cells (NaN if S is singular).
+
+    ``Z`` are z-scores with zeros in the masked cells; the covariance is
+    that of the mean-replaced data.
+    """
+    S = Z.T @ Z / (len(Z) - 1)
+    try:
+        precision = _precision(S)
+    except ValueError:
+        return np.full(len(Z), np.nan)
+    return _conditional(Z, mask, precision)[2]
+
+
+def _straight_lining(X, mask, min_items):
+    """Rows answering at least ``min_items`` unmasked indicators all with the same value."""
+    answered = (~mask).sum(axis=1)
+    high = np.where(mask, -np.inf, X).max(axis=1)
+    low = np.where(mask, np.inf, X).min(axis=1)
+    return (answered >= min_items) & (high == low)
+
+
+def _multivariate_outliers(distance, mask, alpha=MAHALANOBIS_ALPHA):
+    """Rows whose distance exceeds the chi-square critical value for their number of answers."""
+    df = (~mask).sum(axis=1)
+    critical = chi2_ppf(1 - alpha, np.maximum(df, 1))
+    return (df > 0) & (distance > critical)
+
+
+@dataclass
+class ScreeningReport:
+    """Data-quality statistics per indicator and per respondent."""
+    indicators: pd.DataFrame
+    respondents: pd.DataFrame
+    scale: tuple = None
+
+    @property
+    def flagged(self):
+        """Respondents with missing values, invalid codes, straight-lining or outliers."""
+        r = self.respondents
+        return r[(r["Missing"] > 0) | (r["Out of range"] > 0) | r["Straight-lining"]
+                 | (r["Outlying values"] > 0) | r["Multivariate outlier"]]
+
+    def summary(self):
+        """Headline counts for the whole data set."""
+        r = self.respondents
+        cells = len(r) * len(self.indicators)
+        return pd.Series({
+            "Respondents": len(r),
+            "Indicators": len(self.indicators),
+            "Missing cells (%)": 100 * r["Missing"].sum() / cells if cells else 0.0,
+            "Complete cases": int(((r["Missing"] == 0) & (r["Out of range"] == 0)).sum()),
+            "Straight-lining": int(r["Straight-lining"].sum()),
+            "Multivariate outliers": int(r["Multivariate outlier"].sum()),
+        })
+
+
+def screen(data, indicators=None, scale=None, min_items=3):
+    """Screen the indicator columns of ``data`` (all numeric columns by default).
+
+    ``scale=(low, high)`` declares the response scale (e.g. ``(1, 7)``):
+    values outside it or not whole numbers are reported as out of range
+    and otherwise treated like missing values. Straight-lining needs at
+    least ``min_items`` answered indicators.
+    """
+    columns, X, missing, invalid = _matrix(data, indicators, scale)
+    mask = missing | invalid
+    count, mean, sd = _moments(X, mask)
+    Z, _, _ = _standardize(X, mask)
+    outlying = np.abs(Z) > OUTLIER_Z
+    distance = _mahalanobis(Z, mask)
+    n = len(X)
+
+    indicators = pd.DataFrame({
+        "Missing": missing.sum(axis=0),
+        "Missing (%)": 100 * missing.sum(axis=0) / n if n else 0.0,
+        "Out of range": invalid.sum(axis=0),
+        "Mean": mean,
+        "SD": sd,
+        "Min": np.where(count > 0, np.where(mask, np.inf, X).min(axis=0, initial=np.inf), np.nan),
+        "Max": np.where(count > 0, np.where(mask, -np.inf, X).max(axis=0, initial=-np.inf), np.nan),
+        f"Outliers (|z| > {OUTLIER_Z:g})": outlying.sum(axis=0),
+    }, index=pd.Index(columns, name="Indicator"))
+    respondents = pd.DataFrame({
+        "Missing": missing.sum(axis=1),
+        "Out of range": invalid.sum(axis=1),
+        "Straight-lining": _straight_lining(X, mask, min_items),
+        "Outlying values": outlying.sum(axis=1),
+        "Mahalanobis D²": distance,
+        "Multivariate outlier": _multivariate_outliers(distance, mask),
+    }, index=data.index)
+    return ScreeningReport(indicators=indicators, respondents=respondents, scale=scale)
+
+
+def _em(Z, mask, tol, max_iter):
+    """EM estimates of the mean and covariance of z-scored data, and the data with its conditional means filled in."""
+    n = len(Z)
+    mu = np.zeros(Z.shape[1])
+    S = Z.T @ Z / n
+    for iteration in range(1, max_iter + 1):
+        filled, spread, _ = _conditional(np.where(mask, 0.0, Z - mu), mask, _precision(S))
+        X = mu + filled
+        new_mu = X.mean(axis=0)
+        dev = X - new_mu
+        new_S = (dev.T @ dev + spread) / n
+        change = max(np.abs(new_mu - mu).max(), np.abs(new_S - S).max())
+        mu, S = new_mu, new_S
+        if change < tol:
+            return X, mu, S, iteration, True
+    return X, mu, S, max_iter, False
+
+
+@dataclass
+class CleanedData:
+    """Data ready for estimation and a record of what was done to them."""
+    data: pd.DataFrame
+    method: str
+    removed: pd.Index
+    imputed: int
+    iterations: int = 0
+    converged: bool = True
+
+
+def clean(data, method="mean", indicators=None, scale=None, drop_straight_lining=False, drop_outliers=False,
+          min_items=3, tol=1e-5, max_iter=500):
+    """Treat missing values (and optionally drop flagged respondents) in the indicator columns.
+
+    ``method`` is ``"mean"`` (mean replacement), ``"casewise"`` (drop every
+    respondent with a missing value) or ``"em"`` (EM imputation). With
+    ``scale`` out-of-range codes count as missing. Respondents flagged by
+    :func:`screen` for straight-lining or as multivariate outliers are
+    dropped first on request. Other columns are kept unchanged.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown method '{method}'. Use one of {METHODS}.")
+    columns, X, missing, invalid = _matrix(data, indicators, scale)
+    mask = missing | invalid
+    keep = np.ones(len(X), dtype=bool)
+    if drop_straight_lining:
+        keep &= ~_straight_lining(X, mask, min_items)
+    if drop_outliers:
+        Z, _, _ = _standardize(X, mask)
+        keep &= ~_multivariate_outliers(_mahalanobis(Z, mask), mask)
+    if method == "casewise":
+        keep &= ~mask.any(axis=1)
+    X, mask = X[keep], mask[keep]
+    if len(X) < 2:
+        raise ValueError("Fewer than two respondents are left after cleaning.")
+    empty = [c for c, n in zip(columns, (~mask).sum(axis=0)) if n == 0]
+    if empty:
+        raise ValueError(f"Indicators without valid values: {', '.join(empty)}.")
+
+    iterations, converged = 0, True
+    if method == "mean":
+        _, mean, _ = _moments(X, mask)
+        X = np.where(mask, mean, X)
+    elif method == "em" and mask.any():
+        Z, mean, sd = _standardize(X, mask)
+        Z, _, _, iterations, converged = _em(Z, mask, tol, max_iter)
+        X = np.where(mask, mean + sd * Z, X)
+
+    dtype = np.result_type(*data[columns].dtypes)
+    values = pd.DataFrame(X.astype(dtype if np.issubdtype(dtype, np.floating) else float, copy=False),
+                          index=data.index[keep], columns=columns)
+    rest = [c for c in data.columns if c not in values.columns]
+    cleaned = pd.concat([data.loc[keep, rest], values], axis=1)[list(data.columns)] if rest else values
+    return CleanedData(data=cleaned, method=method, removed=data.index[~keep], imputed=int(mask.sum()) if method != "casewise" else 0,
+                       iterations=iterations, converged=converged)
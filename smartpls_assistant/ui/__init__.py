@@ -0,0 +1,33 @@
+"""Streamlit pages of the SmartPLS Research Assistant.
+
+Unlike the rest of the package this subpackage imports Streamlit. Each page
+is its own module with a ``render()`` function, imported only when it is
+first shown: the home page never loads pandas, the estimation engines or
+Plotly. Modules stay imported, so a rerun only calls ``render()`` again.
+"""
+import importlib
+import sys
+
+from smartpls_assistant import profiling
+
+# Sidebar label -> page module.
+PAGES = {
+    "🏠 Home: Introduction": "home",
+    "🎯 Sample Size & Power Planner": "planner",
+    "🧹 Data Screening": "screening",
+    "🧪 Step 1: Measurement Model": "measurement",
+    "📈 Step 2: Structural Model": "structural",
+    "🧬 Step 3: Advanced Analyses": "advanced",
+    "📋 Bulk Report Checker": "bulk_checker",
+    "📄 Full Report": "export",
+}
+
+
+def render(page):
+    """Import the module of ``page`` (a key of :data:`PAGES`) and render it."""
+    name = f"{__name__}.{PAGES[page]}"
+    if name not in sys.modules:
+        with profiling.span(f"import {PAGES[page]}", "import"):
+            importlib.import_module(name)
+    with profiling.span(page, "page"):
+        sys.modules[name].render()
@@ -0,0 +1,330 @@
+"""Step 3: advanced analyses (mediation, moderation, MGA, IPMA, fsQCA)."""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from smartpls_assistant import fsqca, ipma, moderation, rules
+from . import instrument
+from .background import job_result, start_job
+from .compute import cached_mga, cached_moderation
+from .widgets import check_metric, display_metric, style_column, style_statuses
+
+
+def render():
+    st.title("🧬 Step 3: Advanced Analyses")
+    st.markdown("Explore complex relationships once your main model is validated.")
+    
+    tabs = instrument.tabs([
+        "🤝 Mediation", 
+        "⚖️ Moderation", 
+        "👨‍👩‍👧‍👦 Multigroup Analysis (MGA)", 
+        "🎯 IPMA",
+        "🧩 fsQCA"
+    ])
+    
+    # --- Tab 1: Mediation ---
+    with tabs[0]:
+        st.header("Mediation Analysis")
+        col1, col2 = st.columns([1, 1])
+        with col1:
+            st.subheader("What to Check")
+            st.markdown("""
+            - **What it is:** Tests if an IV affects a DV *through* a Mediator variable (IV -> MED -> DV).
+            - **Where to find it:** "Specific Indirect Effects" table (from **Bootstrapping** report).
+            - **Threshold:**
+                - **P-Value < 0.05:** You have a significant mediation effect.
+            - **Types:**
+                - **Full Mediation:** Indirect effect is significant, but *direct* effect (IV -> DV) is not.
+                - **Partial Mediation:** *Both* indirect and direct effects are significant.
+            """)
+        with col2:
+            st.subheader("Interactive Checker")
+            with st.form("med_checker"):
+                st.markdown("**Indirect Effect (IV -> MED -> DV)**")
+                indirect_p = st.number_input("Enter P-Value for Indirect Effect", min_value=0.0, max_value=1.0, value=0.05, step=0.001, format="%.3f")
+                st.markdown("**Direct Effect (IV -> DV)**")
+                direct_p = st.number_input("Enter P-Value for Direct Effect", min_value=0.0, max_value=1.0, value=0.05, step=0.001, format="%.3f")
+                med_submitted = st.form_submit_button("Check Mediation")
+            
+            if med_submitted:
+                band = rules.MEDIATION[rules.mediation_type(indirect_p, direct_p)]
+                display_metric(f"p = {indirect_p:.3f}", band.verdict, band.explanation, band.status, "mediation")
+
+        st.markdown("---")
+        st.subheader("All Specific Indirect Effects (From Your Bootstrapping)")
+        boot_result = job_result("bootstrap", show=False)
+        if boot_result is None:
+            st.info("Run the built-in Bootstrapping (Step 2, Hypothesis Testing tab) to test every specific indirect effect here.")
+        elif not boot_result.labels["indirect"]:
+            st.info("Your structural model has no indirect paths (IV -> MED -> DV).")
+        else:
+            mediation = boot_result.mediation()
+            bands = mediation["Mediation"].map(rules.MEDIATION)
+            mediation["Mediation"] = bands.map(lambda band: band.verdict)
+            statuses = pd.DataFrame("", index=mediation.index, columns=mediation.columns)
+            statuses["Mediation"] = bands.map(lambda band: band.status)
+            st.caption(f"{boot_result.n_boot:,} subsamples. Indirect effects are products of the bootstrapped path coefficients; "
+                       "without a direct path, a significant indirect effect counts as full mediation.")
+            st.dataframe(style_statuses(mediation, statuses))
+
+    # --- Tab 2: Moderation ---
+    with tabs[1]:
+        st.header("Moderation Analysis")
+        col1, col2 = st.columns([1, 1])
+        with col1:
+            st.subheader("What to Check")
+            st.markdown("""
+            - **What it is:** Tests if a *third variable* (Moderator) changes the strength of a relationship.
+            - **How to run:** Add a "Moderating Effect" in SmartPLS and run **Bootstrapping**.
+            - **Where to find it:** "Path Coefficients" table. Look for the **interaction term** (e.g., `Moderator * IV -> DV`).
+            - **Threshold:**
+                - **P-Value < 0.05:** You have a significant moderation effect.
+            """)
+        with col2:
+            st.subheader("Interactive Checker")
+            with st.form("mod_checker"):
+                p_val = st.number_input("Enter P-Value for the Interaction Term", min_value=0.0, max_value=1.0, value=0.05, step=0.001, format="%.3f")
+                mod_submitted = st.form_submit_button("Check Moderation")
+            
+            if mod_submitted:
+                check_metric("moderation_p", p_val, f"p = {p_val:.3f}")
+
+        st.markdown("---")
+        st.subheader("Simple Slopes & Johnson-Neyman")
+        source = st.radio("Estimates from", ["My SmartPLS output", "Built-in two-stage bootstrapping"], horizontal=True)
+        interaction = None
+        if source == "My SmartPLS output":
+            st.caption("Enter the standardized path coefficients and the bootstrap standard errors from SmartPLS.")
+            e1, e2, e3 = st.columns(3)
+            b1 = e1.number_input("IV -> DV (b1)", value=0.30, step=0.01, format="%.3f")
+            b2 = e2.number_input("Moderator -> DV (b2)", value=0.20, step=0.01, format="%.3f")
+            b3 = e3.number_input("Interaction term -> DV (b3)", value=0.15, step=0.01, format="%.3f")
+            s1, s2, s3 = st.columns(3)
+            se1 = s1.number_input("STDEV of b1", min_value=0.0001, value=0.05, step=0.005, format="%.4f")
+            se3 = s2.number_input("STDEV of b3", min_value=0.0001, value=0.05, step=0.005, format="%.4f")
+            cov13 = s3.number_input("Covariance of b1 and b3 (0 if unknown)", value=0.0, step=0.0001, format="%.5f")
+            estimates, cov = np.array([b1, b2, b3]), moderation.covariance(se1, se3, cov13)
+            names = ("IV", "Moderator", "DV")
+            moderator_range = (-3.0, 3.0)
+        elif "pls_result" not in st.session_state:
+            st.info("Run the PLS Algorithm on your raw data (Step 1, tab 5) to estimate the interaction term here.")
+        else:
+            fitted = st.session_state["pls_result"]
+            with st.form("moderation_runner"):
+                m1, m2, m3, m4 = st.columns(4)
+                mod_path = m1.selectbox("Path to moderate", [f"{a} -> {b}" for a, b in fitted.spec.paths])
+                mod_name = m2.selectbox("Moderator", fitted.spec.constructs)
+                mod_boot = m3.selectbox("Subsamples", [1000, 5000], index=0)
+                m4.write("")
+                mod_run = m4.form_submit_button("Estimate Interaction")
+            if mod_run:
+                st.session_state["moderation_settings"] = (*mod_path.split(" -> "), mod_name, mod_boot)
+            if "moderation_settings" in st.session_state:
+                iv, dv, mod_name, mod_boot = st.session_state["moderation_settings"]
+                try:
+                    interaction = cached_moderation(st.session_state["data_key"], st.session_state["model_syntax"], fitted.scheme,
+                                                    iv, mod_name, dv, mod_boot, fitted, st.session_state["pls_data"])
+                except ValueError as exc:
+                    st.error(str(exc))
+            if interaction is not None:
+                st.dataframe(style_column(interaction.paths, "p_value", 4))
+                estimates, cov = interaction.estimates, interaction.covariance
+                names = (interaction.iv, interaction.moderator, interaction.dv)
+                moderator_range = interaction.moderator_range
+
+        if source == "My SmartPLS output" or interaction is not None:
+            effects = moderation.conditional_effects(estimates[0], estimates[2], cov, np.linspace(*moderator_range, 2000))
+            boundaries = moderation.johnson_neyman(estimates[0], estimates[2], cov)
+            c1, c2 = st.columns(2)
+            from . import charts  # Plotly is only needed once a chart is shown
+            c1.plotly_chart(charts.slope_chart(*estimates, *names))
+            c2.plotly_chart(charts.jn_chart(effects, boundaries, names[0], names[1]))
+            st.dataframe(style_column(moderation.simple_slopes(estimates[0], estimates[2], cov), "p_value", 3))
+            inside = [f"{b:.2f}" for b in boundaries if moderator_range[0] <= b <= moderator_range[1]]
+            st.caption("Johnson-Neyman: the effect of the IV changes significance at moderator = "
+                       + (", ".join(inside) + " SD." if inside else "no value in the observed range."))
+
+    # --- Tab 3: MGA ---
+    with tabs[2]:
+        st.header("Multigroup Analysis (MGA)")
+        col1, col2 = st.columns([1, 1])
+        with col1:
+            st.subheader("What to Check")
+            st.markdown("""
+            - **What it is:** Compares path coefficients between two groups (e.g., Men vs. Women).
+            - **How to run:** Run the **"MGA"** algorithm.
+            - **Where to find it:** "MGA" report. Look at the `p-value (Permutation)`.
+            - **Threshold:**
+                - **P-Value < 0.05:** There is a **significant difference** between the groups.
+            """)
+        with col2:
+            st.subheader("Interactive Checker")
+            with st.form("mga_checker"):
+                path = st.text_input("Path to Compare (e.g., 'IV -> DV')", "IV -> DV")
+                p_val = st.number_input("Enter P-Value (Permutation)", min_value=0.0, max_value=1.0, value=0.05, step=0.001, format="%.3f")
+                mga_submitted = st.form_submit_button("Check MGA")
+            
+            if mga_submitted:
+                check_metric("mga_p", p_val, f"p = {p_val:.3f}", path=path)
+
+        st.markdown("---")
+        st.subheader("Built-in MGA")
+        if "pls_result" not in st.session_state:
+            st.info("Run the PLS Algorithm on your raw data (Step 1, tab 5) to compare groups here.")
+        else:
+            fitted, data = st.session_state["pls_result"], st.session_state["pls_data"]
+            candidates = [c for c in data.columns if c not in fitted.spec.indicators]
+            if not candidates:
+                st.info("Your data has no grouping column. Add a column (e.g., gender) that is not used as an indicator.")
+            else:
+                group_column = st.selectbox("Grouping variable", candidates)
+                levels = list(pd.unique(data[group_column].dropna()))
+                with st.form("mga_runner"):
+                    g1, g2 = st.columns(2)
+                    group_a = g1.selectbox("Group A", levels, index=0)
+                    group_b = g2.selectbox("Group B", levels, index=min(1, len(levels) - 1))
+                    method = st.radio("Method", ["Permutation", "Henseler's MGA (bootstrap)"], horizontal=True)
+                    m1, m2 = st.columns(2)
+                    n_draws = m1.selectbox("Permutations / subsamples", [1000, 5000, 10000], index=0)
+                    early = m2.checkbox("Stop early once every p value is clearly above or below 0.05", value=True,
+                                        help="Permutation test only.")
+                    mga_run = st.form_submit_button("Run MGA")
+
+                if mga_run:
+                    if group_a == group_b:
+                        st.error("Choose two different groups.")
+                    else:
+                        st.session_state["mga_method"] = method
+                        start_job("mga", f"MGA, {method} ({n_draws:,})", cached_mga, st.session_state["data_key"], st.session_state["model_syntax"],
+                                  fitted.scheme, group_column, (group_a, group_b), method, n_draws, early, data)
+
+                table = job_result("mga")
+                if table is not None:
+                    method = st.session_state["mga_method"]
+                    p_column = "Permutation p value" if method == "Permutation" else "Henseler p value (2-tailed)"
+                    st.caption(f"{method}. P values are two-tailed; p < 0.05 means the path differs between the groups.")
+                    st.dataframe(style_column(table, "mga_p", table.columns.get_loc(p_column)))
+
+    # --- Tab 4: IPMA ---
+    with tabs[3]:
+        st.header("Importance-Performance Map Analysis (IPMA)")
+        st.subheader("Visual Interpretation Guide")
+        st.markdown("The IPMA is a visual chart, not a single 'pass/fail' number. It's for making managerial recommendations. Run the **'IPMA'** algorithm and find the chart.")
+        st.markdown("Here is how to interpret the four quadrants:")
+
+        # Create a 2x2 grid to represent the IPMA chart
+        col1, col2 = st.columns(2)
+        with col1:
+            st.info("#### Q2: Low Importance / High Performance")
+            st.markdown("""- **Action:** Low Priority
+- **Meaning:** You are doing great, but it doesn't matter much to your DV.""")
+        
+        with col2:
+            st.success("#### Q1: High Importance / High Performance")
+            st.markdown("""- **Action:** Keep Up the Good Work
+- **Meaning:** These are your star drivers. They are critical and you perform well in them.""")
+
+        col3, col4 = st.columns(2)
+        with col3:
+            st.warning("#### Q3: Low Importance / Low Performance")
+            st.markdown("""- **Action:** Lowest Priority
+- **Meaning:** Don't waste resources here. It doesn't matter and you aren't good at it.""")
+        
+        with col4:
+            st.error("#### Q4: High Importance / Low Performance")
+            st.markdown("""- **Action:** **HIGH PRIORITY TO FIX**
+- **Meaning:** These are your key weaknesses. They are critical for your DV, but you are performing poorly.""")
+
+        st.markdown("---")
+        st.subheader("Built-in IPMA")
+        if "pls_result" not in st.session_state:
+            st.info("Run the PLS Algorithm on your raw data (Step 1, tab 5) to draw the importance-performance map here.")
+        else:
+            fitted = st.session_state["pls_result"]
+            i1, i2, i3, i4 = st.columns(4)
+            ipma_target = i1.selectbox("Target construct", fitted.spec.endogenous, index=len(fitted.spec.endogenous) - 1)
+            ipma_level = i2.radio("Level", ["Constructs", "Indicators"])
+            observed = i3.checkbox("Use the observed range as scale", value=True)
+            scale_min = i3.number_input("Scale minimum", value=1.0, disabled=observed)
+            scale_max = i4.number_input("Scale maximum", value=7.0, disabled=observed)
+            try:
+                ipma_constructs, ipma_indicators = ipma.ipma(fitted, st.session_state["pls_data"], ipma_target,
+                                                             None if observed else (scale_min, scale_max))
+            except ValueError as exc:
+                st.error(str(exc))
+            else:
+                shown = ipma_constructs if ipma_level == "Constructs" else ipma_indicators
+                if (ipma_indicators["Rescaled weight"] < 0).any():
+                    st.warning("Some outer weights are negative. IPMA assumes positive weights; check these indicators first.")
+                from . import charts
+                st.plotly_chart(charts.ipma_chart(shown, ipma_target))
+                st.dataframe(shown.style.format(precision=3))
+
+
+    # --- Tab 5: fsQCA ---
+    with tabs[4]:
+        st.header("Fuzzy-Set Qualitative Comparative Analysis (fsQCA)")
+        col1, col2 = st.columns([1, 1])
+        with col1:
+            st.subheader("What to Check")
+            st.markdown("""
+            - **What it is:** A completely different method from SEM. It finds *recipes* (configurations) of factors that lead to an outcome.
+            - **Where to find it:** "fsQCA" report.
+            - **Thresholds:**
+                - **Consistency:** The "rule" for the recipe. Must be **> 0.80**.
+                - **Coverage:** How much of the outcome is *explained* by this one recipe.
+            """)
+        with col2:
+            st.subheader("Interactive Checker")
+            with st.form("fsqca_checker"):
+                consistency = st.number_input("Enter Consistency Value", min_value=0.0, max_value=1.0, value=0.8, step=0.01)
+                coverage = st.number_input("Enter Coverage Value", min_value=0.0, max_value=1.0, value=0.5, step=0.01)
+                fsqca_submitted = st.form_submit_button("Check fsQCA Recipe")
+            
+            if fsqca_submitted:
+                check_metric("fsqca_consistency", consistency, f"Consistency: {consistency:.3f}", coverage=coverage)
+
+        st.markdown("---")
+        st.subheader("Built-in fsQCA (Construct Scores)")
+        if "pls_result" not in st.session_state:
+            st.info("Run the PLS Algorithm on your raw data (Step 1, tab 5) to run fsQCA on the construct scores.")
+        else:
+            fitted = st.session_state["pls_result"]
+            scores = fitted.scores
+            outcome_name = st.selectbox("Outcome", fitted.spec.endogenous, index=len(fitted.spec.endogenous) - 1)
+            others = [c for c in fitted.spec.constructs if c != outcome_name]
+            with st.form("fsqca_runner"):
+                condition_names = st.multiselect("Conditions", others, default=others)
+                st.markdown("**Direct calibration (percentiles of each score)**")
+                a1, a2, a3 = st.columns(3)
+                q_out = a1.number_input("Full non-membership", min_value=0, max_value=49, value=5)
+                q_cross = a2.number_input("Crossover", min_value=1, max_value=99, value=50)
+                q_in = a3.number_input("Full membership", min_value=51, max_value=100, value=95)
+                t1, t2, t3 = st.columns(3)
+                frequency = t1.number_input("Frequency threshold", min_value=1, value=1 if fitted.n < 150 else 3)
+                cutoff = t2.number_input("Consistency threshold", min_value=0.5, max_value=1.0, value=0.8, step=0.01)
+                pri_cutoff = t3.number_input("PRI threshold", min_value=0.0, max_value=1.0, value=0.7, step=0.01)
+                fsqca_run = st.form_submit_button("Run fsQCA")
+
+            if fsqca_run:
+                try:
+                    if not q_out < q_cross < q_in:
+                        raise ValueError("The crossover percentile must lie between the two full-membership percentiles.")
+                    q = (q_out, q_cross, q_in)
+                    calibrated = pd.DataFrame({c: fsqca.calibrate(scores[c], *fsqca.percentile_anchors(scores[c], q)) for c in condition_names})
+                    outcome = fsqca.calibrate(scores[outcome_name], *fsqca.percentile_anchors(scores[outcome_name], q))
+                    st.session_state["fsqca_result"] = fsqca.fsqca(calibrated, outcome, int(frequency), cutoff, pri_cutoff)
+                except ValueError as exc:
+                    st.error(str(exc))
+
+            if "fsqca_result" in st.session_state:
+                result = st.session_state["fsqca_result"]
+                with st.expander("Truth table (configurations with cases)"):
+                    st.dataframe(result.observed.style.format(precision=3, na_rep="remainder"))
+                if not len(result.solutions["complex"].terms):
+                    st.warning("No configuration reaches the consistency thresholds, so there is no solution to report.")
+                for kind, solution in result.solutions.items():
+                    if len(solution.terms):
+                        st.markdown(f"**{kind.capitalize()} solution:** `{solution.formula}`")
+                        st.caption(f"Solution consistency {solution.consistency:.3f}, solution coverage {solution.coverage:.3f}.")
+                        st.dataframe(style_column(solution.terms, "fsqca_consistency"))
@@ -0,0 +1,63 @@
+"""Background jobs: submit, poll and cancel long computations from the pages."""
+import os
+import uuid
+
+import streamlit as st
+
+from smartpls_assistant import jobs
+
+# Heavy resampling runs on one scheduler per server process: SMARTPLS_WORKERS bounds the
+# worker processes, sessions are served round-robin, and pages only poll the job state,
+# so users can keep navigating (and cancel) while their jobs run.
+@st.cache_resource
+def job_scheduler():
+    return jobs.JobScheduler(int(os.environ.get("SMARTPLS_WORKERS", 0)) or None)
+
+def session_id():
+    return st.session_state.setdefault("session_id", uuid.uuid4().hex)
+
+# Queues func(*args, job) as this session's job `name`, replacing (and cancelling) the previous one
+def start_job(name, label, func, *args):
+    session_jobs = st.session_state.setdefault("jobs", {})
+    if name in session_jobs:
+        job_scheduler().cancel(session_jobs[name])
+    session_jobs[name] = job_scheduler().submit(session_id(), label, func, *args)
+
+def cancel_jobs():
+    for job in st.session_state.pop("jobs", {}).values():
+        job_scheduler().cancel(job)
+
+# Result of this session's job `name` once it is done; while it runs, shows live progress (show=True)
+def job_result(name, show=True):
+    job = st.session_state.get("jobs", {}).get(name)
+    if job is None or job.status == jobs.DONE:
+        return None if job is None else job.result
+    if show and job.status == jobs.FAILED:
+        st.error(job.error)
+    elif show and job.status == jobs.CANCELLED:
+        st.info(f"{job.label} was cancelled.")
+    elif show:
+        job_progress(job)
+    return None
+
+@st.fragment(run_every=1.0)
+def job_progress(job):
+    if job.finished:
+        st.rerun()
+    waiting = f" ({job_scheduler().queued()} job(s) queued on the server)" if job.status == jobs.QUEUED else ""
+    st.progress(job.fraction, text=f"{job.label}: {job.message}{waiting}")
+    if job.partial is not None:
+        st.caption("Provisional results from the subsamples finished so far:")
+        st.dataframe(job.partial.style.format(precision=3))
+    if st.button("Cancel", key=f"cancel_job_{job.id}"):
+        job_scheduler().cancel(job)
+        st.rerun()
+
+@st.fragment(run_every=2.0)
+def jobs_sidebar():
+    recent = job_scheduler().jobs(session_id())[:5]
+    if recent:
+        st.markdown("**Background jobs**")
+        for job in recent:
+            icon = {jobs.QUEUED: "⏳", jobs.RUNNING: "🔄", jobs.DONE: "✅", jobs.FAILED: "❌", jobs.CANCELLED: "⛔"}[job.status]
+            st.caption(f"{icon} {job.label}: {job.message}")
@@ -0,0 +1,55 @@
+"""Bulk report checker: classify every value of an uploaded SmartPLS export."""
+import time
+
+import streamlit as st
+
+from smartpls_assistant import bulk, loader
+from .widgets import style_statuses
+
+
+def render():
+    st.title("📋 Bulk Report Checker")
+    st.markdown("Upload a table exported from SmartPLS and check **every value at once**, using the same thresholds as the interactive checkers.")
+
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        st.subheader("Upload Your Export")
+        report = st.selectbox("Which SmartPLS table is this?", list(bulk.REPORTS))
+        uploaded = st.file_uploader("SmartPLS export (CSV or XLSX)", type=["csv", "txt", "xlsx", "xls"])
+        st.markdown("""
+        - **Outer Loadings / HTMT / VIF:** every estimate is checked; in **Bootstrapping** reports only `Original sample (O)`, not the mean, STDEV, T, p or confidence interval columns.
+        - **Construct Reliability:** Cronbach's α, rho and AVE columns are checked.
+        - **Path Coefficients:** the `P values` column of the **Bootstrapping** report is checked.
+        """)
+
+    with col2:
+        st.subheader("Results")
+        if uploaded is None:
+            st.info("Upload a file to see the colour-coded results table.")
+        else:
+            try:
+                sections = loader.sections(uploaded)
+                if len(sections) > 1:
+                    section = st.selectbox("This export holds several tables. Which one?", sections,
+                                           format_func=lambda s: f"{s.sheet}: {s.title}" if s.sheet and s.sheet != s.title else s.title)
+                else:
+                    section = sections[0] if sections else None
+                table = bulk.read_report(uploaded, section=section)
+            except Exception as exc:
+                st.error(f"Could not read this file: {exc}")
+            else:
+                start = time.perf_counter()
+                statuses = bulk.classify_report(table, report)
+                elapsed = time.perf_counter() - start
+                counts = bulk.summarize(statuses)
+                checked = sum(counts.values())
+
+                if checked == 0:
+                    st.warning("No values with a threshold were found. Did you pick the right table type?")
+                else:
+                    m1, m2, m3 = st.columns(3)
+                    m1.metric("✅ Pass", counts["pass"])
+                    m2.metric("⚠️ Acceptable", counts["warn"])
+                    m3.metric("❌ Fail", counts["fail"])
+                    st.caption(f"Checked {checked:,} values in {elapsed * 1000:.1f} ms.")
+                st.dataframe(style_statuses(table, statuses))
@@ -0,0 +1,76 @@
+"""Plotly charts of the advanced analyses (imported only when a chart is shown)."""
+import numpy as np
+import plotly.graph_objects as go
+
+from smartpls_assistant import moderation
+
+
+# Simple-slope lines of the IV at -1 SD, the mean and +1 SD of the moderator
+def slope_chart(b1, b2, b3, iv="IV", moderator="Moderator", dv="DV"):
+    x = np.array([-1.0, 1.0])
+    fig = go.Figure()
+    for w, color in zip(moderation.LEVELS, ("#d62728", "#1f77b4", "#2ca02c")):
+        name = f"{moderator} at {w:+g} SD" if w else f"{moderator} at mean"
+        fig.add_trace(go.Scatter(x=x, y=b1 * x + b2 * w + b3 * x * w, mode="lines", name=name, line=dict(color=color)))
+    fig.update_layout(title="Simple Slope Analysis", xaxis_title=f"{iv} (SD)", yaxis_title=dv, height=380)
+    return fig
+
+
+# Conditional effect over the moderator with its confidence band and the Johnson-Neyman region
+def jn_chart(effects, boundaries, iv="IV", moderator="Moderator"):
+    w = effects["Moderator"]
+    fig = go.Figure([
+        go.Scatter(x=w, y=effects["Upper"], mode="lines", line=dict(width=0), showlegend=False, hoverinfo="skip"),
+        go.Scatter(x=w, y=effects["Lower"], mode="lines", line=dict(width=0), fill="tonexty",
+                   fillcolor="rgba(31, 119, 180, 0.2)", name="95% CI"),
+        go.Scatter(x=w, y=effects["Conditional effect"], mode="lines", name=f"Effect of {iv}", line=dict(color="#1f77b4")),
+    ])
+    significant = effects["Significant"].to_numpy()
+    edges = np.flatnonzero(np.diff(np.r_[0, significant.astype(int), 0]))
+    for start, stop in zip(edges[::2], edges[1::2]):
+        fig.add_vrect(x0=w.iloc[start], x1=w.iloc[stop - 1], fillcolor="#2ca02c", opacity=0.08, line_width=0)
+    for boundary in boundaries:
+        if w.iloc[0] <= boundary <= w.iloc[-1]:
+            fig.add_vline(x=boundary, line_dash="dash", annotation_text=f"{boundary:.2f}")
+    fig.add_hline(y=0, line_color="gray")
+    fig.update_layout(title="Johnson-Neyman Plot (shaded: significant)", xaxis_title=f"{moderator} (SD)",
+                      yaxis_title=f"Conditional effect of {iv}", height=380)
+    return fig
+
+
+# Importance-performance map with the four quadrants split at the means (WebGL, so thousands of points stay fast)
+QUADRANT_COLORS = {
+    "Q1: Keep up the good work": "#28a745",
+    "Q2: Low priority": "#17a2b8",
+    "Q3: Lowest priority": "#ffc107",
+    "Q4: High priority to fix": "#dc3545",
+}
+
+def ipma_chart(table, target):
+    fig = go.Figure()
+    labels = len(table) <= 60
+    for quadrant, color in QUADRANT_COLORS.items():
+        part = table[table["Quadrant"] == quadrant]
+        fig.add_trace(go.Scattergl(
+            x=part["Importance"], y=part["Performance"], name=quadrant, text=part.index,
+            mode="markers+text" if labels else "markers", textposition="top center",
+            marker=dict(size=10 if labels else 6, color=color),
+            hovertemplate="%{text}<br>Importance %{x:.3f}<br>Performance %{y:.1f}<extra></extra>",
+        ))
+    fig.add_vline(x=table["Importance"].mean(), line_dash="dot", line_color="gray")
+    fig.add_hline(y=table["Performance"].mean(), line_dash="dot", line_color="gray")
+    for quadrant, (x, y) in zip(QUADRANT_COLORS, [(1, 1), (0, 1), (0, 0), (1, 0)]):
+        fig.add_annotation(text=quadrant, xref="paper", yref="paper", x=x, y=y, xanchor="right" if x else "left",
+                           yanchor="top" if y else "bottom", showarrow=False, font=dict(color=QUADRANT_COLORS[quadrant]))
+    fig.update_layout(title=f"Importance-Performance Map: {target}", xaxis_title="Importance (total effect)",
+                      yaxis_title="Performance (0-100)", height=500)
+    return fig
+
+
+# Power of every path over the simulated sample sizes, with the target power as a reference line
+def power_chart(power, target=0.8):
+    fig = go.Figure([go.Scatter(x=power.index, y=power[path], mode="lines+markers", name=path) for path in power.columns])
+    fig.add_hline(y=target, line_dash="dash", line_color="gray", annotation_text=f"{target:.0%} power")
+    fig.update_layout(title="Monte Carlo Power Curves", xaxis_title="Sample size", yaxis_title="Power",
+                      yaxis_range=[0, 1.02], height=420)
+    return fig
@@ -0,0 +1,118 @@
+"""Cached computations: one content-addressed result cache per server process."""
+import os
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from smartpls_assistant import blindfolding, bootstrap, cache, higher_order, htmt, mga, moderation, pls, plspredict, power, profiling, screening, whatif
+from smartpls_assistant.data import read_data
+from smartpls_assistant.model import ModelSpec
+
+# One result cache per server process, shared by all sessions: keyed by the uploaded
+# file's content hash, the model syntax and the settings (the data itself is passed as
+# an unhashed "_" argument). SMARTPLS_CACHE_MB sets the memory budget (LRU eviction) and
+# SMARTPLS_CACHE_DIR an optional spill directory that survives server restarts.
+# Cached results are shared objects: never modify them in place.
+@st.cache_resource
+def result_cache():
+    return cache.ResultCache(int(os.environ.get("SMARTPLS_CACHE_MB", 512)) * 2 ** 20, os.environ.get("SMARTPLS_CACHE_DIR") or None)
+
+def spinner(text):
+    return lambda: st.spinner(text)
+
+# Jobs pass themselves last: a duplicate job waits for the first one and stays cancellable.
+def wait_for_job(*args):
+    args[-1].wait()
+
+@cache.memoize(result_cache, spinner("Reading the data..."))
+def cached_read(file_key, name, _file):
+    return read_data(_file, name)
+
+def load_data(file_key, file):
+    # With a spill directory the upload is converted to .npy once and memory-mapped
+    # (no in-memory copy per server process); otherwise it is held in the result cache.
+    spill_dir = result_cache().spill_dir
+    if spill_dir:
+        with st.spinner("Reading the data..."), profiling.span("read", "computation"):
+            return read_data(file, file.name, cache_dir=spill_dir, key=file_key)
+    return cached_read(file_key, file.name, file)
+
+@cache.memoize(result_cache, spinner("Screening the data..."))
+def cached_screening(data_key, indicators, scale, min_items, _data):
+    return screening.screen(_data, list(indicators), scale, min_items)
+
+@cache.memoize(result_cache, spinner("Treating missing values..."))
+def cached_clean(data_key, indicators, scale, min_items, method, drop_straight_lining, drop_outliers, _data):
+    return screening.clean(_data, method, list(indicators), scale, drop_straight_lining, drop_outliers, min_items)
+
+@cache.memoize(result_cache)
+def cached_csv(data_key, _data):
+    return _data.to_csv(index=False).encode()
+
+@cache.memoize(result_cache, spinner("Estimating the model..."))
+def cached_estimate(data_key, syntax, scheme, _data):
+    return pls.estimate(_data, ModelSpec.from_syntax(syntax), scheme)
+
+@cache.memoize(result_cache, spinner("Estimating both stages..."))
+def cached_two_stage(data_key, syntax, scheme, approach, _data):
+    return higher_order.two_stage(_data, ModelSpec.from_syntax(syntax), approach, scheme)
+
+@cache.memoize(result_cache, waiting=wait_for_job)
+def cached_bootstrap(data_key, syntax, scheme, n_boot, seed, _data, _job):
+    spec = ModelSpec.from_syntax(syntax)
+    chunks = []
+
+    def partial(draws):
+        chunks.append(draws)
+        stacked = np.concatenate(chunks)
+        _job.partial = pd.DataFrame({"Sample mean (M)": stacked.mean(axis=0), "Standard deviation (STDEV)": stacked.std(axis=0, ddof=1)},
+                                    index=[f"{a} -> {b}" for a, b in spec.paths])
+
+    return bootstrap.bootstrap(_data, spec, n_boot, scheme, seed, n_jobs=_job.n_jobs, progress=_job.progress, partial=partial)
+
+@cache.memoize(result_cache)
+def cached_correlation(data_key, indicators, _data):
+    return pls.correlation(_data[list(indicators)].to_numpy(dtype=float))
+
+@cache.memoize(result_cache)
+def cached_htmt(data_key, syntax, _data):
+    spec = ModelSpec.from_syntax(syntax)
+    return htmt.htmt_matrix(cached_correlation(data_key, tuple(spec.indicators), _data), spec)
+
+@cache.memoize(result_cache, spinner("Bootstrapping HTMT..."))
+def cached_htmt_bootstrap(data_key, syntax, n_boot, seed, _data):
+    return htmt.htmt_bootstrap(_data, ModelSpec.from_syntax(syntax), n_boot, seed)
+
+@cache.memoize(result_cache, spinner("Screening weak items..."))
+def cached_deletions(data_key, syntax, scheme, greedy, _data, _weights):
+    spec = ModelSpec.from_syntax(syntax)
+    R = cached_correlation(data_key, tuple(spec.indicators), _data)
+    screen = whatif.greedy_deletions if greedy else whatif.single_deletions
+    return screen(R, spec, _weights, scheme)
+
+@cache.memoize(result_cache, waiting=wait_for_job)
+def cached_blindfolding(data_key, syntax, scheme, D, _data, _job):
+    return blindfolding.blindfolding(_data, ModelSpec.from_syntax(syntax), D, scheme, n_jobs=_job.n_jobs, progress=_job.progress)
+
+@cache.memoize(result_cache, spinner("Bootstrapping the interaction term..."))
+def cached_moderation(data_key, syntax, scheme, iv, moderator, dv, n_boot, _result, _data):
+    return moderation.two_stage(_result, _data, iv, moderator, dv, n_boot)
+
+@cache.memoize(result_cache, waiting=wait_for_job)
+def cached_plspredict(data_key, syntax, scheme, folds, repetitions, _data, _job):
+    return plspredict.plspredict(_data, ModelSpec.from_syntax(syntax), folds, repetitions, scheme,
+                                 n_jobs=_job.n_jobs, progress=_job.progress)
+
+@cache.memoize(result_cache, waiting=wait_for_job)
+def cached_mga(data_key, syntax, scheme, group_column, groups, method, n_draws, early, _data, _job):
+    spec = ModelSpec.from_syntax(syntax)
+    if method == "Permutation":
+        return mga.permutation_mga(_data, spec, group_column, groups, n_draws, scheme=scheme, n_jobs=_job.n_jobs,
+                                   early_stopping=early, progress=_job.progress)
+    return mga.henseler_mga(_data, spec, group_column, groups, n_draws, scheme=scheme, n_jobs=_job.n_jobs, progress=_job.progress)
+
+@cache.memoize(result_cache, waiting=wait_for_job)
+def cached_power(syntax, betas, loading, exogenous_correlation, sizes, replications, alpha, tails, seed, _job):
+    return power.simulate(ModelSpec.from_syntax(syntax), dict(betas), loading, sizes, replications, alpha, tails,
+                          exogenous_correlation, seed=seed, n_jobs=_job.n_jobs, progress=_job.progress)
@@ -0,0 +1,64 @@
+"""Full report: the session's checks and estimated model as an HTML, Word or PDF document."""
+import streamlit as st
+
+from smartpls_assistant import report
+from .background import job_result, start_job
+from .compute import cached_htmt
+from .widgets import check_log
+
+FORMATS = {"html": "HTML", "docx": "Word (DOCX)", "pdf": "PDF"}
+
+
+# Runs as a background job: figures are drawn in the job's worker processes
+def build_report(inputs, fmt, job):
+    return report.render(inputs, fmt, n_jobs=job.n_jobs, progress=job.progress)
+
+
+def render():
+    st.title("📄 Full Report")
+    st.markdown("Every value you check in the app is collected here. Together with the model you estimated in Step 1, "
+                "it becomes a **publication-style report**: measurement and structural model tables, the HTMT matrix, "
+                "figures and APA-formatted interpretation following Hair et al. (2019).")
+
+    checks = check_log()
+    fitted = st.session_state.get("pls_result")
+    boot = job_result("bootstrap", show=False)
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        st.subheader("Contents")
+        st.markdown(f"""
+        - **Estimated model:** {"✅ " + f"n = {fitted.n:,}, {len(fitted.spec.constructs)} constructs" if fitted is not None else "— run the PLS Algorithm (Step 1, tab 5)"}
+        - **Bootstrapping:** {"✅ " + f"{boot.n_boot:,} subsamples" if boot is not None else "— run it in Step 2 for p values and confidence intervals"}
+        - **Checked values:** {len(checks):,}
+        """)
+        with st.form("report_settings"):
+            title = st.text_input("Title", "PLS-SEM Results")
+            fmt = st.radio("Format", list(FORMATS), format_func=FORMATS.get, horizontal=True)
+            submitted = st.form_submit_button("Generate Report")
+
+        if submitted:
+            if fitted is None and not len(checks):
+                st.error("Nothing to report yet: check some values or run the PLS Algorithm first.")
+            else:
+                matrix = None
+                if fitted is not None:
+                    matrix = cached_htmt(st.session_state["data_key"], st.session_state["model_syntax"], st.session_state["pls_data"])
+                inputs = report.ReportInput(list(checks), fitted, boot, matrix, title.strip() or "PLS-SEM Results")
+                st.session_state["report_format"] = fmt
+                start_job("report", f"Report ({FORMATS[fmt]})", build_report, inputs, fmt)
+
+        document = job_result("report")
+        if document is not None:
+            fmt = st.session_state["report_format"]
+            mime, extension = report.FORMATS[fmt]
+            st.download_button(f"Download the report ({FORMATS[fmt]})", document, file_name=f"pls_sem_report.{extension}", mime=mime)
+
+    with col2:
+        st.subheader("Checked Values")
+        if not len(checks):
+            st.info("Values you check on the other pages (loadings, reliability, HTMT, p values, ...) appear here.")
+        else:
+            st.dataframe(checks.table(), hide_index=True)
+            if st.button("Clear Checked Values"):
+                checks.clear()
+                st.rerun()
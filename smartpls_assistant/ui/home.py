@@ -0,0 +1,50 @@
+"""Home page: introduction to the guided workflow."""
+import streamlit as st
+
+
+def render():
+    st.title("📊 SmartPLS Research Assistant")
+    st.markdown(
+        """
+        <div style="text-align:center; background-color:#f8f9fa; border-radius:10px; padding:20px; margin-bottom:20px;">
+            <h2 style="color:#004e92;">Interactive Guide for PLS-SEM Analysis and Reporting</h2>
+            <p style="font-size:16px; color:#1C2833;">
+                Developed by <b>Mahbub Hassan</b><br>
+                Department of Civil Engineering, Faculty of Engineering, Chulalongkorn University<br>
+                Founder, 
+                <a href="https://www.bdeshi-lab.org/" target="_blank" style="color:#004e92; font-weight:600;">
+                B'Deshi Emerging Research Lab
+                </a>
+            </p>
+            <p style="font-size:15px; color:#424949; margin-top:10px;">
+                Email: <a href="mailto:mahbub.hassan@ieee.org" style="color:#004e92; text-decoration:none;">mahbub.hassan@ieee.org</a>
+            </p>
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+
+    st.markdown("### Your Step-by-Step Guide to PLS-SEM Analysis")
+    st.markdown("""
+    This app provides a structured and educational workflow to help researchers interpret and report 
+    **Partial Least Squares Structural Equation Modeling (PLS-SEM)** results obtained from **SmartPLS**. 
+
+    **Follow the steps in the sidebar:**
+    0. **Before Step 1:** Work out how many responses you need with the **Sample Size & Power Planner**, then check the collected data for missing values, straight-lining and outliers with **Data Screening**.
+    1. **Measurement Model:** Validate your constructs and assess reliability and validity.
+    2. **Structural Model:** Test hypotheses and evaluate model explanatory power.
+    3. **Advanced Analyses:** Explore mediation, moderation, multigroup analysis (MGA), and fsQCA.
+    4. **Full Report:** Export every value you checked, with your estimated model, as an HTML, Word or PDF report.
+
+    Use the navigation menu on the left to begin your analytical workflow.
+    """)
+
+    st.info("""
+    💡 **Tip:** Each section includes interactive value checkers and interpretive feedback, following methodological standards 
+    outlined by Hair et al. (2019) for PLS-SEM research.
+    """)
+
+    st.warning("""
+    **Disclaimer:** This tool serves as an educational resource to support learning in quantitative research methods. 
+    Always validate your findings against theoretical grounding, journal requirements, and expert supervision.
+    """)
@@ -0,0 +1,100 @@
+"""Developer instrumentation: per-rerun timings, cache and job statistics, profiles.
+
+Every rerun is timed (page, tabs, cached computations) and written to the
+structured log; SMARTPLS_PROFILE_LOG names a JSON-lines file receiving one
+record per rerun and per finished background job. The sidebar panel is
+opt-in: set SMARTPLS_DEV_TOOLS=1 or open the app with ``?dev=1``.
+"""
+import logging
+import os
+from contextlib import contextmanager
+
+import streamlit as st
+
+from smartpls_assistant import profiling
+
+from .background import job_scheduler, session_id
+
+
+def enabled():
+    return os.environ.get("SMARTPLS_DEV_TOOLS") == "1" or st.query_params.get("dev") == "1"
+
+
+@st.cache_resource
+def log_file():
+    path = os.environ.get("SMARTPLS_PROFILE_LOG")
+    if path:
+        handler = logging.FileHandler(path, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        profiling.logger.addHandler(handler)
+        profiling.logger.setLevel(logging.INFO)
+        profiling.logger.propagate = False
+    return path
+
+
+@contextmanager
+def rerun():
+    """Time the enclosed script run; the panel's settings choose memory tracing and profiling."""
+    log_file()
+    dev = enabled()
+    profiler = st.session_state.get("profiler", "cprofile") if dev and st.session_state.get("profile_rerun") else None
+    run = profiling.Run(memory=dev and st.session_state.get("trace_memory", False), profiler=profiler)
+    try:
+        with run:
+            yield run
+    finally:
+        profiling.log(run.as_dict(), event="rerun", session=session_id())
+        if run.profile is not None:
+            st.session_state["last_profile"] = (run.profile_report(), run.profile_dump())
+
+
+@contextmanager
+def _timed(container, name):
+    with container, profiling.span(name):
+        yield container
+
+
+def tabs(labels):
+    """``st.tabs`` whose blocks are timed as sections of the rerun."""
+    return [_timed(tab, label) for tab, label in zip(st.tabs(labels), labels)]
+
+
+def panel(run):
+    if not enabled():
+        return
+    from .compute import result_cache
+
+    with st.sidebar.expander("⏱️ Performance", expanded=True):
+        hits, misses = run.counters["cache hits"], run.counters["cache misses"]
+        c1, c2 = st.columns(2)
+        c1.metric("Script time", f"{run.seconds * 1000:,.0f} ms")
+        c2.metric("Cache hits", f"{hits} / {hits + misses}")
+        if run.spans:
+            st.dataframe([{
+                "Block": " " * s.depth + s.name,
+                "Kind": s.kind,
+                "ms": round(s.seconds * 1000, 1),
+                **({"MB": round(s.memory / 2 ** 20, 2)} if s.memory is not None else {}),
+            } for s in run.spans], hide_index=True)
+
+        stats = result_cache().stats()
+        st.caption(f"Result cache (server): {stats['entries']} entries, {stats['bytes'] / 2 ** 20:,.0f} of "
+                   f"{stats['max_bytes'] / 2 ** 20:,.0f} MB; {stats['hits']} hits, {stats['disk_hits']} disk hits, "
+                   f"{stats['misses']} misses, {stats['evictions']} evictions.")
+        scheduler = job_scheduler()
+        st.caption(f"Jobs (server): {scheduler.running()} running, {scheduler.queued()} queued, "
+                   f"{scheduler.workers_per_job} worker process(es) each.")
+        timed = [job for job in scheduler.jobs(session_id()) if job.finished and job.started]
+        if timed:
+            st.dataframe([{"Job": job.label, "Status": job.status, "Queued s": round(job.started - job.submitted, 2),
+                           "Run s": round(job.finished_at - job.started, 2)} for job in timed], hide_index=True)
+
+        st.checkbox("Trace memory per block (slower)", key="trace_memory")
+        st.selectbox("Profiler", profiling.PROFILERS, key="profiler")
+        st.button("Profile a rerun", key="profile_rerun", help="Reruns the page under the profiler.")
+        if "last_profile" in st.session_state:
+            (name, data, mime), dump = st.session_state["last_profile"]
+            st.download_button("Download the profile", data, file_name=name, mime=mime)
+            if dump is not None:
+                st.download_button("Download raw cProfile stats", dump, file_name="profile.prof",
+                                   mime="application/octet-stream")
@@ -0,0 +1,263 @@
+"""Step 1: measurement model (reliability, convergent and discriminant validity)."""
+import streamlit as st
+
+from smartpls_assistant import bulk, cache, htmt, pls
+from . import instrument
+from .background import cancel_jobs
+from .compute import cached_deletions, cached_estimate, cached_htmt, cached_htmt_bootstrap, cached_two_stage, load_data
+from .widgets import check_metric, style_column, style_rule, style_statuses
+
+
+EXAMPLE_MODEL = """# Measurement model (=~ reflective, <~ formative)
+IV =~ iv1 + iv2 + iv3
+MED =~ med1 + med2 + med3
+DV =~ dv1 + dv2 + dv3
+# Structural model (target ~ predictors)
+MED ~ IV
+DV ~ IV + MED"""
+
+HIGHER_ORDER = {
+    "repeated": "Repeated indicators",
+    "embedded": "Two-stage (embedded)",
+    "disjoint": "Two-stage (disjoint)",
+}
+
+
+def render():
+    st.title("🧪 Step 1: Measurement Model Assessment")
+    st.markdown("First, you must prove that your constructs are valid and reliable. **Run the 'PLS Algorithm' in SmartPLS.**")
+
+    tabs = instrument.tabs([
+        "✅ 1. Indicator Reliability (Outer Loadings)",
+        "✅ 2. Internal Consistency Reliability",
+        "✅ 3. Convergent Validity (AVE)",
+        "✅ 4. Discriminant Validity",
+        "⚙️ 5. Run PLS Algorithm (Raw Data)"
+    ])
+
+    # --- Tab 1: Outer Loadings ---
+    with tabs[0]:
+        col1, col2 = st.columns([1, 1])
+        with col1:
+            st.subheader("What to Check")
+            st.markdown("""
+            - **What it is:** Checks if each *item* (question) is a good measure of its *construct* (variable).
+            - **Where to find it:** "Outer Loadings" table.
+            - **Thresholds:**
+                - **> 0.708:** Ideal.
+                - **0.4 - 0.7:** Acceptable, *if* deleting it doesn't improve Composite Reliability or AVE.
+                - **< 0.4:** Must be deleted.
+            """)
+        
+        with col2:
+            st.subheader("Interactive Checker")
+            with st.form("ol_checker"):
+                ol_val = st.number_input("Enter your Outer Loading Value", min_value=0.0, max_value=1.0, value=0.7, step=0.01)
+                ol_submitted = st.form_submit_button("Check Loading")
+
+            if ol_submitted:
+                check_metric("loading", ol_val, f"Loading: {ol_val:.3f}")
+
+        if "pls_result" in st.session_state:
+            st.markdown("---")
+            st.subheader("What-if: Item Deletion")
+            st.markdown("Tests every item loading between **0.4 and 0.708**: would deleting it raise **rho_c** or **AVE**? "
+                        "Each deletion is re-estimated from your model's converged weights.")
+            with st.form("deletion_checker"):
+                greedy = st.checkbox("Greedy multi-item sequence (delete the best item, then re-screen)")
+                if st.form_submit_button("Screen Weak Items"):
+                    st.session_state["deletion_greedy"] = greedy
+
+            if "deletion_greedy" in st.session_state:
+                fitted = st.session_state["pls_result"]
+                screened = cached_deletions(
+                    st.session_state["data_key"], st.session_state["model_syntax"], fitted.scheme,
+                    st.session_state["deletion_greedy"], st.session_state["pls_data"],
+                    fitted.outer_weights.fillna(0.0).to_numpy(),
+                )
+                if screened.empty:
+                    st.success("No item would improve its construct's reliability by being deleted.")
+                else:
+                    st.dataframe(screened.style.format(precision=3))
+    
+    # --- Tab 2: Internal Consistency ---
+    with tabs[1]:
+        col1, col2 = st.columns([1, 1])
+        with col1:
+            st.subheader("What to Check")
+            st.markdown("""
+            - **What it is:** Checks if all items for a construct are measuring the same thing.
+            - **Where to find it:** "Construct Reliability" table.
+            - **Thresholds:**
+                - **Composite Reliability (rho_c):** **> 0.70** (This is the modern standard).
+                - **Cronbach's Alpha (α):** **> 0.70** (Traditional standard).
+            """)
+        
+        with col2:
+            st.subheader("Interactive Checker")
+            with st.form("cr_checker"):
+                cr_val = st.number_input("Enter your Composite Reliability (rho_c)", min_value=0.0, max_value=1.0, value=0.7, step=0.01)
+                cr_submitted = st.form_submit_button("Check Reliability")
+
+            if cr_submitted:
+                check_metric("reliability", cr_val, f"rho_c: {cr_val:.3f}")
+
+    # --- Tab 3: Convergent Validity (AVE) ---
+    with tabs[2]:
+        col1, col2 = st.columns([1, 1])
+        with col1:
+            st.subheader("What to Check")
+            st.markdown("""
+            - **What it is:** Checks if your construct explains a significant amount of variance in its items.
+            - **Where to find it:** "Construct Reliability" table.
+            - **Threshold:**
+                - **Average Variance Extracted (AVE):** Must be **> 0.50**.
+            """)
+        
+        with col2:
+            st.subheader("Interactive Checker")
+            with st.form("ave_checker"):
+                ave_val = st.number_input("Enter your AVE Value", min_value=0.0, max_value=1.0, value=0.5, step=0.01)
+                ave_submitted = st.form_submit_button("Check AVE")
+
+            if ave_submitted:
+                check_metric("ave", ave_val, f"AVE: {ave_val:.3f}")
+
+    # --- Tab 4: Discriminant Validity ---
+    with tabs[3]:
+        st.subheader("What to Check")
+        st.markdown("Checks that your constructs are truly distinct from each other. The **HTMT** is the modern 'gold standard'.")
+        
+        dv_tabs = st.tabs(["HTMT (Modern Method)", "Fornell-Larcker (Traditional Method)"])
+        
+        with dv_tabs[0]:
+            col1, col2 = st.columns([1, 1])
+            with col1:
+                st.markdown("""
+                - **What it is:** Heterotrait-Monotrait Ratio.
+                - **Where to find it:** "Discriminant Validity" -> "HTMT" table.
+                - **Thresholds:**
+                    - **< 0.85:** Ideal (for conceptually distinct constructs).
+                    - **< 0.90:** Acceptable (for conceptually similar constructs).
+                    - **> 0.90:** Fail.
+                """)
+            with col2:
+                st.subheader("Interactive Checker")
+                with st.form("htmt_checker"):
+                    htmt_val = st.number_input("Enter your HTMT Value", min_value=0.0, max_value=1.2, value=0.8, step=0.01)
+                    htmt_submitted = st.form_submit_button("Check HTMT")
+                
+                if htmt_submitted:
+                    check_metric("htmt", htmt_val, f"HTMT: {htmt_val:.3f}")
+
+            if "pls_result" in st.session_state:
+                st.markdown("---")
+                st.subheader("HTMT Matrix of Your Model")
+                data_key, syntax, data = st.session_state["data_key"], st.session_state["model_syntax"], st.session_state["pls_data"]
+                st.dataframe(style_rule(cached_htmt(data_key, syntax, data), "htmt"))
+
+                with st.form("htmt_boot"):
+                    h1, h2 = st.columns(2)
+                    htmt_n_boot = h1.selectbox("Bootstrap subsamples", [1000, 5000, 10000], index=1)
+                    htmt_seed = h2.number_input("Random seed", min_value=0, value=0, step=1, key="htmt_seed")
+                    if st.form_submit_button("Compute Confidence Intervals"):
+                        st.session_state["htmt_boot_settings"] = (htmt_n_boot, int(htmt_seed))
+
+                if "htmt_boot_settings" in st.session_state:
+                    htmt_n_boot, htmt_seed = st.session_state["htmt_boot_settings"]
+                    intervals = cached_htmt_bootstrap(data_key, syntax, htmt_n_boot, htmt_seed, data)
+                    st.caption(f"One-sided upper bounds from {htmt_n_boot:,} subsamples. Discriminant validity holds when the upper bound is below the threshold.")
+                    st.dataframe(style_column(intervals, "htmt"))
+        
+        with dv_tabs[1]:
+            st.info("The Fornell-Larcker criterion is a traditional method. Most reviewers now prefer HTMT.")
+            st.markdown("""
+            - **Where to find it:** "Discriminant Validity" -> "Fornell-Larcker" table.
+            - **Threshold:** The value at the top of each column (the **square root of the AVE**, in bold) must be **larger** than all the values *below it* in that column.
+            """)
+
+            if "pls_result" in st.session_state:
+                table, met = htmt.fornell_larcker(st.session_state["pls_result"])
+                st.subheader("Fornell-Larcker Table of Your Model")
+                st.dataframe(table.style.format(precision=3, na_rep=""))
+                if met.all():
+                    st.success("The square root of the AVE exceeds all latent variable correlations for every construct.")
+                else:
+                    st.error(f"Criterion not met for: {', '.join(met.index[~met])}.")
+
+    # --- Tab 5: Native PLS Algorithm ---
+    with tabs[4]:
+        col1, col2 = st.columns([1, 2])
+        with col1:
+            st.subheader("Your Data and Model")
+            st.markdown("Skip the round trip through SmartPLS: upload the raw indicator data and describe your model.")
+            st.caption("Higher-order constructs: list lower-order constructs instead of indicators, e.g. `VALUE =~ QUAL + PRICE` "
+                       "(reflective) or `VALUE <~ QUAL + PRICE` (formative), and connect VALUE, not its parts, in the structural model.")
+            data_file = st.file_uploader("Raw data (CSV or XLSX, one column per indicator)", type=["csv", "txt", "xlsx", "xls"], key="pls_data_file")
+            with st.form("pls_runner"):
+                syntax = st.text_area("Model specification", st.session_state.get("pls_syntax", EXAMPLE_MODEL), height=220)
+                scheme = st.selectbox("Weighting scheme", pls.SCHEMES, format_func=str.capitalize)
+                approach = st.radio("Higher-order constructs", list(HIGHER_ORDER), format_func=HIGHER_ORDER.get, horizontal=True,
+                                    help="Repeated indicators estimates one model. The two-stage approaches use the lower-order "
+                                         "construct scores as the higher-order construct's indicators; prefer them for formative "
+                                         "higher-order constructs. Later steps then analyse the stage-two model.")
+                use_screened = "screened_data" in st.session_state and st.checkbox(
+                    "Use the screened data", value=True, help="The data as treated on the Data Screening page (missing values "
+                                                              "replaced or removed, flagged respondents dropped).")
+                pls_submitted = st.form_submit_button("Run PLS Algorithm")
+
+            if pls_submitted:
+                if data_file is None and not use_screened:
+                    st.error("Please upload your raw data first.")
+                else:
+                    try:
+                        if use_screened:
+                            data_key, data = st.session_state["screened_key"], st.session_state["screened_data"]
+                        else:
+                            data_key = cache.file_hash(data_file)
+                            data = load_data(data_key, data_file)
+                        if approach == "repeated":
+                            result, model = cached_estimate(data_key, syntax, scheme, data), syntax
+                            st.session_state.pop("stage_one_result", None)
+                        else:
+                            staged = cached_two_stage(data_key, syntax, scheme, approach, data)
+                            result, data, model = staged.stage_two, staged.data, staged.stage_two.spec.to_syntax()
+                            # Stage-two data are derived from the upload, the model and the settings.
+                            data_key = cache.key(data_key, syntax, scheme, approach)
+                            st.session_state["stage_one_result"] = staged.stage_one
+                        st.session_state["pls_result"] = result
+                        st.session_state["pls_data"] = data
+                        st.session_state["data_key"] = data_key
+                        st.session_state.pop("htmt_boot_settings", None)
+                        st.session_state.pop("deletion_greedy", None)
+                        cancel_jobs()
+                        st.session_state.pop("fsqca_result", None)
+                        st.session_state.pop("moderation_settings", None)
+                        st.session_state["model_syntax"] = model
+                        st.session_state["pls_syntax"] = syntax
+                    except ValueError as exc:
+                        st.error(str(exc))
+
+        with col2:
+            result = st.session_state.get("pls_result")
+            if result is None:
+                st.info("Results appear here after you run the PLS Algorithm.")
+            else:
+                if result.converged:
+                    st.success(f"Converged after {result.iterations} iterations ({result.scheme} weighting, n = {result.n:,}).")
+                else:
+                    st.warning(f"Did not converge within {result.iterations} iterations. Interpret with care.")
+                stage_one = st.session_state.get("stage_one_result")
+                if stage_one is not None:
+                    st.info("Stage two of the two-stage approach: each higher-order construct is measured by its lower-order construct scores.")
+                    with st.expander("Stage one: lower-order constructs"):
+                        st.dataframe(style_rule(stage_one.outer_loadings, "loading"))
+                        st.dataframe(style_statuses(stage_one.reliability, bulk.classify_report(stage_one.reliability, "Construct Reliability")))
+                st.markdown("**Outer Loadings**")
+                st.dataframe(style_rule(result.outer_loadings, "loading"))
+                st.markdown("**Construct Reliability and Validity**")
+                st.dataframe(style_statuses(result.reliability, bulk.classify_report(result.reliability, "Construct Reliability")))
+                st.markdown("**R-squared**")
+                st.dataframe(style_rule(result.r2.to_frame("R²"), "r2"))
+
+    st.success("**Proceed to the Structural Model ONLY IF your Measurement Model is valid!**")
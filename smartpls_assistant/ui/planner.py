@@ -0,0 +1,109 @@
+"""Sample size planner: minimum sample size and Monte Carlo power before data collection."""
+import pandas as pd
+import streamlit as st
+
+from smartpls_assistant import cache, power
+from smartpls_assistant.model import ModelSpec
+from . import instrument
+from .background import job_result, start_job
+from .compute import cached_power
+from .measurement import EXAMPLE_MODEL
+
+SIZES = [30, 50, 75, 100, 150, 200, 250, 300, 400, 500, 600, 800, 1000, 1500, 2000]
+
+
+def render():
+    st.title("🎯 Sample Size & Power Planner")
+    st.markdown("Decide **how many responses you need** before you collect data and run SmartPLS.")
+
+    tabs = instrument.tabs([
+        "✅ 1. Minimum Sample Size",
+        "✅ 2. Monte Carlo Power Simulation",
+    ])
+
+    # --- Tab 1: Inverse square root and gamma-exponential methods ---
+    with tabs[0]:
+        col1, col2 = st.columns([1, 1])
+        with col1:
+            st.subheader("What to Check")
+            st.markdown("""
+            - **What it is:** The **inverse square root method** (Kock & Hadaya, 2018) gives the minimum sample size from the *smallest* path coefficient you expect to be significant.
+            - **Formula:** n_min = ((z₁₋α + z_power) / |β_min|)², i.e. **(2.486 / |β_min|)²** for a one-tailed 5% test with 80% power.
+            - **Gamma-exponential:** lets the standard error shrink for larger paths, n_min = ((z₁₋α + z_power) · e^(−β_min²) / |β_min|)², which asks for fewer responses than the inverse square root method.
+            - **How to use it:** Take β_min from prior studies or a pilot. It is a conservative rule of thumb; run the Monte Carlo simulation (tab 2) for your exact model.
+            """)
+        with col2:
+            st.subheader("Interactive Calculator")
+            with st.form("isr_calculator"):
+                beta_min = st.number_input("Smallest expected path coefficient |β_min|", min_value=0.01, max_value=0.99, value=0.2, step=0.01)
+                c1, c2, c3 = st.columns(3)
+                target = c1.selectbox("Power", [0.8, 0.9, 0.95], format_func="{:.0%}".format, key="isr_power")
+                alpha = c2.selectbox("Significance level", [0.05, 0.01, 0.1], key="isr_alpha")
+                tails = c3.radio("Test", [1, 2], format_func=lambda t: "One-tailed" if t == 1 else "Two-tailed", key="isr_tails")
+                isr_submitted = st.form_submit_button("Calculate")
+
+            if isr_submitted:
+                m1, m2 = st.columns(2)
+                m1.metric("Inverse square root", f"{power.inverse_square_root(beta_min, alpha, target, tails):,}")
+                m2.metric("Gamma-exponential", f"{power.gamma_exponential(beta_min, alpha, target, tails):,}")
+                st.caption(f"To detect β = {beta_min:.2f} with {target:.0%} power at α = {alpha} ({'one' if tails == 1 else 'two'}-tailed).")
+
+    # --- Tab 2: Monte Carlo power ---
+    with tabs[1]:
+        st.subheader("Monte Carlo Power Simulation")
+        st.markdown("""
+        Data are generated from your model with the **path coefficients you expect**, the model is re-estimated
+        thousands of times per sample size, and the share of significant estimates is the **power** of each path.
+        Aim for at least **80%** power on every hypothesized path.
+        """)
+        syntax = st.text_area("Model specification", st.session_state.get("pls_syntax", EXAMPLE_MODEL), height=200, key="power_syntax")
+        try:
+            spec = ModelSpec.from_syntax(syntax)
+        except ValueError as exc:
+            st.error(f"Invalid model: {exc}")
+            return
+
+        with st.form("power_runner"):
+            st.markdown("**Expected standardized path coefficients**")
+            paths = pd.DataFrame({"Source": [a for a, _ in spec.paths], "Target": [b for _, b in spec.paths], "Expected β": 0.3})
+            edited = st.data_editor(paths, disabled=["Source", "Target"], hide_index=True,
+                                    key=f"power_paths_{cache.key(syntax)}")
+            p1, p2, p3 = st.columns(3)
+            loading = p1.number_input("Loading of every indicator", min_value=0.4, max_value=0.95, value=0.8, step=0.05)
+            exogenous_correlation = p2.number_input("Correlation among exogenous constructs", min_value=-0.5, max_value=0.9, value=0.0, step=0.05)
+            replications = p3.selectbox("Replications per sample size", [500, 1000, 2000, 5000], index=1)
+            sizes = st.multiselect("Sample sizes", SIZES, default=[50, 100, 150, 200, 300, 500, 800])
+            q1, q2, q3, q4 = st.columns(4)
+            target = q1.selectbox("Target power", [0.8, 0.9, 0.95], format_func="{:.0%}".format, key="mc_power")
+            alpha = q2.selectbox("Significance level", [0.05, 0.01, 0.1], key="mc_alpha")
+            tails = q3.radio("Test", [2, 1], format_func=lambda t: "Two-tailed" if t == 2 else "One-tailed", key="mc_tails")
+            seed = q4.number_input("Random seed", min_value=0, value=0, step=1)
+            power_submitted = st.form_submit_button("Run Simulation")
+
+        if power_submitted:
+            if not sizes:
+                st.error("Choose at least one sample size.")
+            else:
+                betas = tuple(((a, b), float(beta)) for a, b, beta in edited[["Source", "Target", "Expected β"]].itertuples(index=False))
+                try:
+                    power.implied_correlation(spec, dict(betas), loading, exogenous_correlation)
+                except ValueError as exc:
+                    st.error(str(exc))
+                else:
+                    st.session_state["power_target"] = target
+                    start_job("power", f"Power simulation ({replications:,} × {len(sizes)} sample sizes)", cached_power, syntax,
+                              betas, loading, exogenous_correlation, tuple(sorted(sizes)), replications, alpha, tails, int(seed))
+
+        result = job_result("power")
+        if result is not None:
+            from . import charts
+
+            target = st.session_state.get("power_target", 0.8)
+            st.plotly_chart(charts.power_chart(result.power, target))
+            st.dataframe(result.summary(target).style.format(precision=3, na_rep=f"> {result.power.index[-1]:,}"))
+            st.caption(f"{result.replications:,} replications per sample size, α = {result.alpha} "
+                       f"({'one' if result.tails == 1 else 'two'}-tailed), seed {result.seed}. A path with β = 0 shows the false-positive rate. "
+                       "The standard error is the SD of the estimates across replications, a proxy for one study's "
+                       "bootstrap standard error, so power at small sample sizes is slightly optimistic.")
+            with st.expander("Power per sample size"):
+                st.dataframe(result.power.style.format("{:.1%}"))
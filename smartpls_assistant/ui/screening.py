@@ -0,0 +1,107 @@
+"""Data screening: missing values, straight-lining, out-of-range codes and outliers before Step 1."""
+import streamlit as st
+
+from smartpls_assistant import cache
+from .compute import cached_clean, cached_csv, cached_screening, load_data
+from .widgets import check_metric, style_column
+
+METHODS = {
+    "mean": "Mean replacement",
+    "casewise": "Casewise deletion",
+    "em": "EM imputation",
+}
+
+
+def render():
+    st.title("🧹 Data Screening")
+    st.markdown("Clean your raw survey data **before** you estimate anything: missing values, straight-lining, "
+                "out-of-range codes and outliers all bias PLS-SEM results.")
+
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        st.subheader("Your Data")
+        data_file = st.file_uploader("Raw data (CSV or XLSX, one column per indicator)", type=["csv", "txt", "xlsx", "xls"], key="screen_data_file")
+        if data_file is None:
+            col2.info("The screening report appears here after you upload your raw data.")
+            return
+        try:
+            file_key = cache.file_hash(data_file)
+            data = load_data(file_key, data_file)
+        except ValueError as exc:
+            st.error(str(exc))
+            return
+        numeric = list(data.select_dtypes("number").columns)
+        with st.form("screening_form"):
+            indicators = st.multiselect("Indicators", numeric, default=numeric,
+                                        help="Leave out respondent IDs, group labels and other non-indicator columns.")
+            check_scale = st.checkbox("Check the response scale")
+            c1, c2 = st.columns(2)
+            low = c1.number_input("Lowest code", value=1, step=1)
+            high = c2.number_input("Highest code", value=7, step=1)
+            min_items = st.number_input("Straight-lining: minimum answered indicators", min_value=2, value=3, step=1)
+            st.form_submit_button("Screen Data")
+
+    if not indicators:
+        col2.info("Select the indicator columns to screen.")
+        return
+    if check_scale and low >= high:
+        col2.error("The lowest code must be below the highest code.")
+        return
+    settings = (tuple(indicators), (low, high) if check_scale else None, int(min_items))
+    try:
+        report = cached_screening(file_key, *settings, data)
+    except ValueError as exc:
+        col2.error(str(exc))
+        return
+
+    with col2:
+        st.subheader("Screening Report")
+        summary = report.summary()
+        m1, m2, m3 = st.columns(3)
+        m1.metric("Respondents", f"{summary['Respondents']:,}")
+        m2.metric("Complete cases", f"{summary['Complete cases']:,}")
+        m3.metric("Indicators", f"{summary['Indicators']:,}")
+        check_metric("missing", summary["Missing cells (%)"], "Missing cells (whole data set)", f"{summary['Missing cells (%)']:.1f}%")
+        st.markdown("**Indicators**")
+        st.dataframe(style_column(report.indicators, "missing", 1))
+        flagged = report.flagged
+        st.markdown(f"**Flagged respondents** ({len(flagged):,}: {summary['Straight-lining']:,} straight-lining, "
+                    f"{summary['Multivariate outliers']:,} multivariate outliers)")
+        if flagged.empty:
+            st.success("No respondent has missing values, invalid codes, straight-lining or outliers.")
+        else:
+            st.dataframe(flagged.style.format(precision=2))
+        st.caption("Straight-lining: the same answer to every indicator. Outlying values: |z| > 3. Multivariate outliers: "
+                   "Mahalanobis D² above the χ² critical value at p < 0.001. Out-of-range codes count as missing values.")
+
+    st.markdown("---")
+    st.subheader("Treatment")
+    st.markdown("""
+    - **Mean replacement** (SmartPLS's default) is fine when fewer than **5%** of an indicator's values are missing.
+    - **Casewise deletion** removes every respondent with a missing value; check that enough responses remain.
+    - **EM imputation** replaces missing values by their expected values given each respondent's other answers; prefer it when missingness is higher.
+    """)
+    with st.form("treatment_form"):
+        method = st.radio("Missing values", list(METHODS), format_func=METHODS.get, horizontal=True)
+        drop_straight_lining = st.checkbox("Remove straight-lining respondents")
+        drop_outliers = st.checkbox("Remove multivariate outliers")
+        if st.form_submit_button("Apply Treatment"):
+            st.session_state["screening_treatment"] = (file_key, *settings, method, drop_straight_lining, drop_outliers)
+
+    treatment = st.session_state.get("screening_treatment")
+    if treatment is None or treatment[:4] != (file_key, *settings):
+        return
+    try:
+        cleaned = cached_clean(*treatment, data)
+    except ValueError as exc:
+        st.error(str(exc))
+        return
+    # Cleaned data are derived from the upload and every screening setting.
+    st.session_state["screened_key"] = cache.key(*treatment)
+    st.session_state["screened_data"] = cleaned.data
+    message = f"{METHODS[cleaned.method]}: {len(cleaned.data):,} respondents kept, {len(cleaned.removed):,} removed, {cleaned.imputed:,} values replaced"
+    if cleaned.method == "em" and cleaned.iterations:
+        message += f" (EM {'converged after' if cleaned.converged else 'stopped at'} {cleaned.iterations} iterations)"
+    st.success(message + ". Tick **Use the screened data** in Step 1 to estimate your model with them.")
+    st.download_button("Download the cleaned data (CSV)", cached_csv(st.session_state["screened_key"], cleaned.data),
+                       file_name="screened_data.csv", mime="text/csv")
@@ -0,0 +1,223 @@
+"""Step 2: structural model (collinearity, path coefficients, R², f², Q²)."""
+import streamlit as st
+
+from smartpls_assistant import bulk, plspredict, vif
+from . import instrument
+from .background import job_result, start_job
+from .compute import cached_blindfolding, cached_bootstrap, cached_correlation, cached_plspredict
+from .widgets import check_metric, display_metric, style_column, style_rule, style_statuses
+
+
+def render():
+    st.title("📈 Step 2: Structural Model Assessment")
+    st.markdown("Now you test your hypotheses. **Run 'Bootstrapping' (e.g., 5,000 subsamples) in SmartPLS.**")
+
+    tabs = instrument.tabs([
+        "✅ 1. Collinearity (VIF)",
+        "✅ 2. Hypothesis Testing (Paths)",
+        "✅ 3. Explanatory Power (R²)",
+        "✅ 4. Effect Size (f²)",
+        "✅ 5. Predictive Relevance (Q²)"
+    ])
+
+    # --- Tab 1: VIF ---
+    with tabs[0]:
+        col1, col2 = st.columns([1, 1])
+        with col1:
+            st.subheader("What to Check")
+            st.markdown("""
+            - **What it is:** Checks if your *predictor* constructs (IVs) are too similar to each other.
+            - **Where to find it:** "Collinearity Statistics (VIF)" table (from **PLS Algorithm** report). Look at the *inner model* values.
+            - **Thresholds:**
+                - **< 3.0:** Ideal.
+                - **< 5.0:** Acceptable.
+                - **> 5.0:** Fail (High collinearity).
+            """)
+        with col2:
+            st.subheader("Interactive Checker")
+            with st.form("vif_checker"):
+                vif_val = st.number_input("Enter your VIF Value", min_value=0.0, max_value=20.0, value=2.5, step=0.1)
+                vif_submitted = st.form_submit_button("Check VIF")
+            
+            if vif_submitted:
+                check_metric("vif", vif_val, f"VIF: {vif_val:.2f}")
+
+        if "pls_result" in st.session_state:
+            st.markdown("---")
+            fitted = st.session_state["pls_result"]
+            inner, inner_singular = vif.inner_vif(fitted.latent_correlations, fitted.spec)
+            R = cached_correlation(st.session_state["data_key"], tuple(fitted.spec.indicators), st.session_state["pls_data"])
+            outer, outer_singular = vif.outer_vif(R, fitted.spec)
+            v1, v2 = st.columns([1, 1])
+            with v1:
+                st.subheader("Inner Model VIF of Your Model")
+                st.dataframe(style_rule(inner, "vif"))
+            with v2:
+                st.subheader("Outer Model VIF")
+                st.dataframe(style_rule(outer.to_frame(), "vif"))
+            for kind, blocks in (("predictors of", inner_singular), ("indicators of", outer_singular)):
+                if blocks:
+                    st.error(f"Near-singular (perfectly collinear) {kind}: {', '.join(blocks)}. Remove redundant variables.")
+
+    # --- Tab 2: Hypothesis Testing ---
+    with tabs[1]:
+        col1, col2 = st.columns([1, 1])
+        with col1:
+            st.subheader("What to Check")
+            st.markdown("""
+            - **What it is:** Tests your hypotheses (e.g., "H1: IV -> DV is supported").
+            - **Where to find it:** "Path Coefficients" table (from **Bootstrapping** report).
+            - **Thresholds:**
+                - **P-Value:** **< 0.05** = Hypothesis is **supported** (significant).
+                - **Original Sample (β):** Shows the *direction* (positive or negative) and *strength* of the effect.
+            """)
+        with col2:
+            st.subheader("Interactive Checker")
+            with st.form("hyp_checker"):
+                path = st.text_input("Path (e.g., 'IV -> DV')", "IV -> DV")
+                beta_val = st.number_input("Enter Original Sample (β) Value", value=0.0, step=0.01)
+                p_val = st.number_input("Enter P-Value", min_value=0.0, max_value=1.0, value=0.05, step=0.001, format="%.3f")
+                hyp_submitted = st.form_submit_button("Check Hypothesis")
+
+            if hyp_submitted:
+                direction = "positive" if beta_val > 0 else "negative"
+                check_metric("p_value", p_val, f"{path}", f"p = {p_val:.3f}", direction=direction, beta=beta_val)
+
+        st.markdown("---")
+        st.subheader("Built-in Bootstrapping")
+        if "pls_result" not in st.session_state:
+            st.info("Run the PLS Algorithm on your raw data (Step 1, tab 5) to bootstrap all paths here.")
+        else:
+            with st.form("boot_runner"):
+                b1, b2 = st.columns(2)
+                n_boot = b1.selectbox("Subsamples", [1000, 5000, 10000], index=1)
+                boot_seed = b2.number_input("Random seed", min_value=0, value=0, step=1)
+                boot_submitted = st.form_submit_button("Run Bootstrapping")
+
+            if boot_submitted:
+                start_job("bootstrap", f"Bootstrapping ({n_boot:,} subsamples)", cached_bootstrap, st.session_state["data_key"],
+                          st.session_state["model_syntax"], st.session_state["pls_result"].scheme, n_boot, int(boot_seed), st.session_state["pls_data"])
+
+            boot_result = job_result("bootstrap")
+            if boot_result is not None:
+                summary = boot_result.summary("paths")
+                st.caption(f"{boot_result.n_boot:,} subsamples, seed {boot_result.seed}. P values are two-tailed.")
+                if boot_result.non_converged:
+                    st.warning(f"{boot_result.non_converged:,} subsamples did not converge and were left out.")
+                st.dataframe(style_statuses(summary, bulk.classify_report(summary, "Path Coefficients (Bootstrapping)")))
+
+    # --- Tab 3: R-squared ---
+    with tabs[2]:
+        col1, col2 = st.columns([1, 1])
+        with col1:
+            st.subheader("What to Check")
+            st.markdown("""
+            - **What it is:** Explanatory power. How much of the variance in your DV is explained by your IV(s).
+            - **Where to find it:** "R-squared" table (from **PLS Algorithm** report).
+            - **Thresholds (Rules of Thumb):**
+                - **≈ 0.75:** Substantial
+                - **≈ 0.50:** Moderate
+                - **≈ 0.25:** Weak
+            """)
+        with col2:
+            st.subheader("Interactive Checker")
+            with st.form("r2_checker"):
+                r2_val = st.number_input("Enter your R² Value", min_value=0.0, max_value=1.0, value=0.5, step=0.01)
+                r2_submitted = st.form_submit_button("Check R²")
+
+            if r2_submitted:
+                check_metric("r2", r2_val, f"R² = {r2_val:.2f}")
+
+            if "pls_result" in st.session_state:
+                st.markdown("**From your estimated model (Step 1, tab 5):**")
+                st.dataframe(style_rule(st.session_state["pls_result"].r2.to_frame("R²"), "r2"))
+
+    # --- Tab 4: f-squared ---
+    with tabs[3]:
+        col1, col2 = st.columns([1, 1])
+        with col1:
+            st.subheader("What to Check")
+            st.markdown("""
+            - **What it is:** Effect size. The individual contribution of an IV in explaining a DV.
+            - **Where to find it:** "f-squared" table (from **PLS Algorithm** report).
+            - **Thresholds:**
+                - **≥ 0.35:** Large effect
+                - **≥ 0.15:** Medium effect
+                - **≥ 0.02:** Small effect
+            """)
+        with col2:
+            st.subheader("Interactive Checker")
+            with st.form("f2_checker"):
+                f2_val = st.number_input("Enter your f² Value", min_value=0.0, max_value=2.0, value=0.15, step=0.01)
+                f2_submitted = st.form_submit_button("Check f²")
+
+            if f2_submitted:
+                check_metric("f2", f2_val, f"f² = {f2_val:.3f}")
+
+            if "pls_result" in st.session_state:
+                st.markdown("**From your estimated model (Step 1, tab 5):**")
+                st.dataframe(style_rule(st.session_state["pls_result"].paths[["f²"]], "f2"))
+
+    # --- Tab 5: Q-squared ---
+    with tabs[4]:
+        col1, col2 = st.columns([1, 1])
+        with col1:
+            st.subheader("What to Check")
+            st.markdown("""
+            - **What it is:** Predictive Relevance. Checks if your model has predictive power.
+            - **How to get it:** Run the **'Blindfolding'** algorithm.
+            - **Where to find it:** 'Construct Cross-validated Redundancy' report.
+            - **Threshold:**
+                - **Q² > 0:** The model HAS predictive relevance.
+                - **Q² < 0:** The model LACKS predictive relevance.
+            """)
+        with col2:
+            st.subheader("Interactive Checker")
+            with st.form("q2_checker"):
+                q2_val = st.number_input("Enter your Q² Value (for a DV)", value=0.3, step=0.01)
+                q2_submitted = st.form_submit_button("Check Q²")
+
+            if q2_submitted:
+                check_metric("q2", q2_val, f"Q² = {q2_val:.3f}")
+
+        if "pls_result" in st.session_state:
+            st.markdown("---")
+            st.subheader("Built-in Blindfolding")
+            with st.form("blindfolding_runner"):
+                omission = st.number_input("Omission distance (D)", min_value=5, max_value=12, value=7, step=1)
+                blindfolding_submitted = st.form_submit_button("Run Blindfolding")
+
+            if blindfolding_submitted:
+                fitted, D = st.session_state["pls_result"], int(omission)
+                if fitted.n % D == 0:
+                    st.warning(f"The number of cases ({fitted.n}) is a multiple of D = {D}. Choose another D.")
+                else:
+                    st.session_state["blindfolding_D"] = D
+                    start_job("blindfolding", f"Blindfolding (D = {D})", cached_blindfolding, st.session_state["data_key"],
+                              st.session_state["model_syntax"], fitted.scheme, D, st.session_state["pls_data"])
+
+            q2_table = job_result("blindfolding")
+            if q2_table is not None:
+                st.caption(f"Construct cross-validated redundancy, D = {st.session_state['blindfolding_D']}.")
+                st.dataframe(style_column(q2_table, "q2"))
+
+            st.subheader("PLSpredict (Out-of-Sample Prediction)")
+            st.markdown("""
+            - **Q²predict > 0:** the PLS prediction beats the naive training-sample mean.
+            - **PLS vs. LM RMSE:** predictive power is **high** if PLS has the lower RMSE for *all* endogenous indicators,
+              **medium** for the majority, **low** for a minority and **lacking** for none (Shmueli et al., 2019).
+            """)
+            with st.form("plspredict_runner"):
+                p1, p2 = st.columns(2)
+                n_folds = p1.number_input("Folds (k)", min_value=2, max_value=20, value=10, step=1)
+                n_reps = p2.number_input("Repetitions", min_value=1, max_value=20, value=10, step=1)
+                if st.form_submit_button("Run PLSpredict"):
+                    start_job("plspredict", f"PLSpredict ({int(n_folds)} folds x {int(n_reps)})", cached_plspredict, st.session_state["data_key"],
+                              st.session_state["model_syntax"], st.session_state["pls_result"].scheme, int(n_folds), int(n_reps), st.session_state["pls_data"])
+
+            predicted = job_result("plspredict")
+            if predicted is not None:
+                power, better, total = plspredict.predictive_power(predicted)
+                status = {"high": "pass", "medium": "pass", "low": "warn", "none": "fail"}[power]
+                display_metric("Predictive Power", power.upper(), f"PLS beats the LM benchmark (RMSE) for {better} of {total} indicators.", status, "plspredict")
+                st.dataframe(style_column(predicted, "q2", 0))
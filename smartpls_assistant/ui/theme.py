@@ -0,0 +1,118 @@
+"""App-wide styling: the custom CSS for the "good looking" design.
+
+The stylesheet is minified once per server process. Streamlit drops every
+element a rerun does not render again, so it is re-sent on each rerun, but
+only as one small, unchanged ``<style>`` element.
+"""
+import re
+
+import streamlit as st
+
+CUSTOM_CSS = """
+<style>
+    /* --- Main App Colors --- */
+    :root {
+        --primary-color: #004e92;       /* Deep Blue for headers */
+        --secondary-color: #f4f7f6;     /* Light Gray background */
+        --accent-color: #00c1d4;        /* Bright Teal for buttons/accents */
+        --pass-color: #28a745;          /* Green for Pass */
+        --warn-color: #ffc107;          /* Yellow for Warning */
+        --fail-color: #dc3545;          /* Red for Fail */
+    }
+
+    /* --- General App Background --- */
+    .stApp {
+        background-color: var(--secondary-color);
+    }
+
+    /* --- Sidebar --- */
+    [data-testid="stSidebar"] {
+        background-color: var(--primary-color);
+        color: white;
+    }
+    [data-testid="stSidebar"] .stRadio > label {
+        color: white; /* Make radio labels white */
+        font-size: 1.1em;
+    }
+    [data-testid="stSidebar"] h1 {
+        color: white;
+        font-weight: 700;
+    }
+
+    /* --- Main Content --- */
+    h1 {
+        color: var(--primary-color);
+        font-weight: 700;
+    }
+    h2, h3 {
+        color: var(--primary-color);
+    }
+
+    /* --- Buttons --- */
+    .stButton > button {
+        background-color: var(--accent-color);
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 10px 20px;
+        font-weight: 600;
+    }
+    .stButton > button:hover {
+        background-color: #00a1b3; /* Darker teal on hover */
+        color: white;
+    }
+
+    /* --- Tabs --- */
+    .stTabs [data-baseweb="tab-list"] {
+        background-color: #e0e0e0;
+        border-radius: 5px;
+    }
+    .stTabs [data-baseweb="tab"] {
+        font-weight: 600;
+    }
+    .stTabs [data-baseweb="tab"][aria-selected="true"] {
+        background-color: var(--primary-color);
+        color: white;
+    }
+
+    /* --- Result Text Classes --- */
+    .pass-text {
+        color: var(--pass-color);
+        font-weight: bold;
+    }
+    .warn-text {
+        color: var(--warn-color);
+        font-weight: bold;
+    }
+    .fail-text {
+        color: var(--fail-color);
+        font-weight: bold;
+    }
+    
+    /* --- Metric Styling --- */
+    [data-testid="stMetric"] {
+        background-color: #FFFFFF;
+        border: 1px solid #E0E0E0;
+        border-radius: 10px;
+        padding: 15px;
+    }
+    [data-testid="stMetric"] > div[data-testid="stMetricLabel"] {
+        font-size: 1.1em;
+        font-weight: 600;
+    }
+
+</style>
+"""
+
+
+def _minify(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{}:;,>])\s*", r"\1", css).strip()
+
+
+STYLE = _minify(CUSTOM_CSS.replace("<style>", "").replace("</style>", ""))
+
+
+def inject():
+    st.html(f"<style>{STYLE}</style>")
@@ -0,0 +1,55 @@
+"""Verdict boxes and colour-coded tables shared by the pages."""
+import pandas as pd
+import streamlit as st
+
+from smartpls_assistant import report, rules
+
+
+# Every verdict shown in this session, for the full report (see smartpls_assistant.report)
+def check_log():
+    return st.session_state.setdefault("check_log", report.CheckLog())
+
+
+# This reusable function creates the nice "PASS/FAIL" metric boxes (and records the verdict)
+def display_metric(label, value, explanation, status, metric=None):
+    check_log().add(metric, label, value, status, explanation)
+    if status == "pass":
+        st.metric(label=label, value=value, delta="PASS")
+        st.markdown(f"<p class='pass-text'>✅ {explanation}</p>", unsafe_allow_html=True)
+    elif status == "warn":
+        st.metric(label=label, value=value, delta="ACCEPTABLE", delta_color="off")
+        st.markdown(f"<p class='warn-text'>⚠️ {explanation}</p>", unsafe_allow_html=True)
+    elif status == "fail":
+        st.metric(label=label, value=value, delta="FAIL", delta_color="inverse")
+        st.markdown(f"<p class='fail-text'>❌ {explanation}</p>", unsafe_allow_html=True)
+    else:
+        st.metric(label=label, value=value)
+        st.info(explanation)
+
+
+# Looks up the shared threshold rule for a metric and renders its verdict
+def check_metric(metric, value, label, shown_value=None, **context):
+    band = rules.evaluate(metric, value)
+    display_metric(label, shown_value or band.verdict, band.explain(value, **context), band.status, metric)
+
+
+# Colour-codes a whole results table using the same pass/warn/fail palette
+STATUS_COLORS = {
+    "pass": "background-color: #d4edda; color: #155724;",
+    "warn": "background-color: #fff3cd; color: #856404;",
+    "fail": "background-color: #f8d7da; color: #721c24;",
+    "": "",
+}
+
+def style_statuses(table, statuses):
+    css = statuses.replace(STATUS_COLORS)
+    return table.style.apply(lambda _: css, axis=None).format(precision=3, na_rep="")
+
+def style_rule(table, metric):
+    statuses = pd.DataFrame(rules.RULES[metric].evaluate(table.to_numpy(dtype=float)), index=table.index, columns=table.columns)
+    return style_statuses(table, statuses)
+
+def style_column(table, metric, column=-1):
+    statuses = pd.DataFrame("", index=table.index, columns=table.columns)
+    statuses.iloc[:, column] = rules.RULES[metric].evaluate(table.iloc[:, column].to_numpy(dtype=float))
+    return style_statuses(table, statuses)
@@ -0,0 +1,78 @@
+"""Collinearity statistics (VIF) for the inner and outer model.
+
+The VIF of every predictor in a block is the diagonal of the inverse of the
+block's correlation matrix, ``VIF_i = [R^-1]_ii = 1 / (1 - R²_i)``. With a
+Cholesky factor ``R = L L'`` the diagonal is the column sums of squares of
+``L^-1``, so one O(q³) factorization replaces q auxiliary regressions. The
+squared Cholesky pivots are the variance shares each predictor does not
+share with the predictors before it; a tiny pivot means the block is
+(near-)singular.
+"""
+import numpy as np
+import pandas as pd
+
+# Squared Cholesky pivots below this are treated as exact collinearity.
+SINGULAR_TOL = 1e-10
+
+
+def vif_from_corr(R, tol=SINGULAR_TOL):
+    """VIFs of all variables of a correlation matrix and a near-singular flag."""
+    R = np.asarray(R, dtype=float)
+    if len(R) == 1:
+        return np.ones(1), False
+    try:
+        L = np.linalg.cholesky(R)
+    except np.linalg.LinAlgError:
+        return np.full(len(R), np.inf), True
+    if np.min(np.diag(L)) ** 2 < tol:
+        return np.full(len(R), np.inf), True
+    L_inv = np.linalg.solve(L, np.eye(len(R)))
+    return np.sum(L_inv ** 2, axis=0), False
+
+
+def vif(X):
+    """VIFs for the columns of a data matrix (or DataFrame)."""
+    X = np.asarray(X, dtype=float)
+    values, _ = vif_from_corr(np.corrcoef(X, rowvar=False))
+    return values
+
+
+def inner_vif(latent_correlations, spec):
+    """Inner-model VIFs: predictor rows x endogenous construct columns.
+
+    Returns the table and the list of endogenous constructs whose predictor
+    block is (near-)singular.
+    """
+    C = latent_correlations.loc[spec.constructs, spec.constructs].to_numpy()
+    table = pd.DataFrame(np.nan, index=spec.constructs, columns=spec.constructs)
+    singular = []
+    index = {c: i for i, c in enumerate(spec.constructs)}
+    for target in spec.endogenous:
+        preds = [index[a] for a, b in spec.paths if b == target]
+        values, flag = vif_from_corr(C[np.ix_(preds, preds)])
+        table.iloc[preds, index[target]] = values
+        if flag:
+            singular.append(target)
+    table = table.loc[[c for c in spec.constructs if table.loc[c].notna().any()], spec.endogenous]
+    return table, singular
+
+
+def outer_vif(R, spec):
+    """Outer-model VIFs per indicator, computed block by block.
+
+    Returns a Series indexed by indicator and the list of constructs whose
+    indicator block is (near-)singular. Higher-order blocks only repeat
+    lower-order indicators and are skipped.
+    """
+    R = np.asarray(R)
+    position = {item: h for h, item in enumerate(spec.indicators)}
+    values = np.empty(len(spec.indicators))
+    singular = []
+    for construct, items in spec.blocks.items():
+        if construct in spec.higher_order:
+            continue
+        rows = [position[item] for item in items]
+        values[rows], flag = vif_from_corr(R[np.ix_(rows, rows)])
+        if flag:
+            singular.append(construct)
+    return pd.Series(values, index=spec.indicators, name="VIF"), singular
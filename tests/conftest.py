@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from smartpls_assistant.model import ModelSpec
+
+SYNTAX = """
+IMG  =~ img1 + img2 + img3
+QUAL <~ q1 + q2 + q3
+SAT  =~ sat1 + sat2 + sat3 + sat4
+LOY  =~ loy1 + loy2
+SAT ~ IMG + QUAL
+LOY ~ SAT + IMG
+"""
+
+LOADINGS = {
+    "IMG": [0.85, 0.78, 0.6],
+    "QUAL": [0.7, 0.7, 0.65],
+    "SAT": [0.88, 0.82, 0.79, 0.55],
+    "LOY": [0.9, 0.84],
+}
+
+
+def simulate(n, seed=0):
+    """Survey-like data from a population model with the structure of ``SYNTAX``."""
+    rng = np.random.default_rng(seed)
+    img, qual = rng.multivariate_normal([0, 0], [[1, 0.3], [0.3, 1]], n).T
+    sat = 0.45 * img + 0.3 * qual + rng.normal(0, 0.75, n)
+    loy = 0.55 * sat + 0.15 * img + rng.normal(0, 0.8, n)
+    latent = {"IMG": img, "QUAL": qual, "SAT": sat / sat.std(), "LOY": loy / loy.std()}
+    spec = ModelSpec.from_syntax(SYNTAX)
+    columns = {}
+    for construct, items in spec.blocks.items():
+        for item, lam in zip(items, LOADINGS[construct]):
+            columns[item] = lam * latent[construct] + rng.normal(0, np.sqrt(1 - lam ** 2), n)
+    return pd.DataFrame(columns)
+
+
+@pytest.fixture
+def spec():
+    return ModelSpec.from_syntax(SYNTAX)
+
+
+@pytest.fixture
+def survey():
+    return simulate(250)
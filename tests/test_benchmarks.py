@@ -0,0 +1,55 @@
+"""The benchmark cases' own correctness checks, and the regression comparison.
+
+Timing against the committed baseline depends on the machine, so it carries
+the ``perf`` marker (``pytest -m perf``).
+"""
+import json
+import os
+
+import numpy as np
+import pytest
+
+from benchmarks import run
+from benchmarks.synthetic import population
+from smartpls_assistant import pls
+
+
+@pytest.fixture(scope="module")
+def dataset(tmp_path_factory):
+    n, p, k = run.GRIDS["quick"][0]
+    pop = population(k, p, seed=0)
+    return run.Dataset(n, p, k, pop, pop.sample(n), str(tmp_path_factory.mktemp("bench")), 30)
+
+
+def test_population_correlation_is_the_large_sample_limit():
+    pop = population(4, 12, seed=1)
+    sample = pop.sample(200000)
+    np.testing.assert_allclose(pls.correlation(sample[pop.spec.indicators].to_numpy()), pop.correlation, atol=0.02)
+
+
+@pytest.mark.parametrize("name", list(run.CASES))
+def test_case_passes_its_check(dataset, name):
+    work, check = run.CASES[name](dataset)
+    assert check(work())["ok"]
+
+
+def test_compare_flags_only_regressions_beyond_the_floors():
+    old = {"seconds": 0.1, "peak_bytes": 10 * 2 ** 20}
+    baseline = {"results": {"a": old, "b": old, "c": old}}
+    results = {
+        "a": {"seconds": 0.2, "peak_bytes": 10 * 2 ** 20},
+        "b": {"seconds": 0.104, "peak_bytes": 20 * 2 ** 20},
+        "c": {"seconds": 0.11, "peak_bytes": 10.5 * 2 ** 20},
+        "new": {"seconds": 9.0, "peak_bytes": 0},
+    }
+    assert [key for key, _ in run.compare(results, baseline, 0.3)] == ["a", "b"]
+
+
+@pytest.mark.perf
+def test_quick_grid_within_baseline():
+    path = os.path.join(run.ROOT, "benchmarks", "baselines", "quick.json")
+    with open(path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    results = run.run(run.GRIDS["quick"], n_boot=baseline["n_boot"], report=lambda line: None)
+    assert all(result["check"]["ok"] for result in results.values())
+    assert run.compare(results, baseline, 0.3) == []
@@ -0,0 +1,104 @@
+"""Bootstrapping: resampled estimates, reproducibility, non-converged draws and mediation."""
+import numpy as np
+import pytest
+
+from smartpls_assistant import bootstrap as boot
+from smartpls_assistant import pls
+
+
+def _resampled_paths(data, spec, n_boot, seed, chunk_size):
+    """Path coefficients re-estimated on explicitly resampled data, chunk by chunk."""
+    sizes = boot._chunk_sizes(n_boot, chunk_size, 1)
+    n = len(data)
+    paths = []
+    for child, size in zip(np.random.SeedSequence(seed).spawn(len(sizes)), sizes):
+        rng = np.random.default_rng(child)
+        for _ in range(size):
+            counts = np.bincount(rng.integers(0, n, n), minlength=n)
+            sample = data.iloc[np.repeat(np.arange(n), counts)]
+            B = pls.estimate(sample, spec).path_coefficients
+            paths.append([B.loc[a, b] for a, b in spec.paths])
+    return np.array(paths)
+
+
+def test_draws_match_resampled_data(survey, spec):
+    result = boot.bootstrap(survey, spec, n_boot=12, seed=3, n_jobs=1, chunk_size=5)
+    expected = _resampled_paths(survey, spec, 12, 3, 5)
+    np.testing.assert_allclose(result.draws["paths"], expected, atol=1e-6)
+    assert result.non_converged == 0
+
+
+def test_reproducible_across_worker_counts(survey, spec):
+    one = boot.bootstrap(survey, spec, n_boot=40, seed=7, n_jobs=1, chunk_size=10)
+    two = boot.bootstrap(survey, spec, n_boot=40, seed=7, n_jobs=2, chunk_size=10)
+    for key in boot.STATISTICS:
+        np.testing.assert_array_equal(one.draws[key], two.draws[key])
+
+
+def test_summary_columns(survey, spec):
+    result = boot.bootstrap(survey, spec, n_boot=60, seed=1, n_jobs=1)
+    table = result.summary("paths")
+    assert list(table.index) == [f"{a} -> {b}" for a, b in spec.paths]
+    np.testing.assert_allclose(table["Original sample (O)"],
+                               [result.original.path_coefficients.loc[a, b] for a, b in spec.paths])
+    draws = result.draws["paths"]
+    np.testing.assert_allclose(table["Standard deviation (STDEV)"], draws.std(axis=0, ddof=1))
+    assert (table["2.5%"] <= table["97.5%"]).all()
+    assert ((table["P values"] >= 0) & (table["P values"] <= 1)).all()
+
+
+def test_chunk_sizes_cover_every_draw():
+    assert boot._chunk_sizes(1001, 250, 10) == [250, 250, 250, 250, 1]
+    sizes = boot._chunk_sizes(5000, None, 300 * 300)
+    assert sum(sizes) == 5000 and max(sizes) * 8 * 300 * 300 <= boot._CHUNK_BYTES
+
+
+def test_non_converged_draws_are_counted_and_left_out(survey, spec):
+    result = boot.bootstrap(survey, spec, n_boot=20, seed=2, n_jobs=1, max_iter=1, tol=1e-12)
+    assert result.non_converged == 20
+    assert result.draws["paths"].shape == (0, len(spec.paths))
+
+
+def test_only_converged_draws_enter_the_statistics(survey, spec, monkeypatch):
+    full = boot.bootstrap(survey, spec, n_boot=30, seed=5, n_jobs=1, chunk_size=10)
+    fit = pls._fit_entries
+
+    def every_third_fails(*args, **kwargs):
+        *out, converged = fit(*args, **kwargs)
+        converged = np.array(converged, copy=True)
+        if converged.ndim:
+            converged[::3] = False
+        return (*out, converged)
+
+    monkeypatch.setattr(pls, "_fit_entries", every_third_fails)
+    result = boot.bootstrap(survey, spec, n_boot=30, seed=5, n_jobs=1, chunk_size=10)
+    keep = np.arange(30) % 10 % 3 != 0
+    assert result.non_converged == 12
+    np.testing.assert_array_equal(result.draws["paths"], full.draws["paths"][keep])
+    table = result.summary("paths")
+    np.testing.assert_allclose(table["Sample mean (M)"], full.draws["paths"][keep].mean(axis=0))
+
+
+def test_missing_indicator_is_reported(survey, spec):
+    with pytest.raises(ValueError, match="not found"):
+        boot.bootstrap(survey.drop(columns="sat1"), spec, n_boot=10, n_jobs=1)
+
+
+def test_indirect_paths_list_every_chain(spec):
+    assert sorted(spec.indirect_paths()) == [("IMG", "SAT", "LOY"), ("QUAL", "SAT", "LOY")]
+
+
+def test_indirect_effects_are_products_of_path_draws(survey, spec):
+    result = boot.bootstrap(survey, spec, n_boot=50, seed=9, n_jobs=1)
+    paths = dict(zip(spec.paths, result.draws["paths"].T))
+    assert result.labels["indirect"] == [" -> ".join(chain) for chain in result.labels["chains"]]
+    for chain, draws in zip(result.labels["chains"], result.draws["indirect"].T):
+        np.testing.assert_allclose(draws, np.prod([paths[link] for link in zip(chain, chain[1:])], axis=0))
+    B = result.original.path_coefficients
+    table = result.mediation()
+    assert table.loc["IMG -> SAT -> LOY", "Specific indirect effect"] == \
+        pytest.approx(B.loc["IMG", "SAT"] * B.loc["SAT", "LOY"])
+    assert table.loc["IMG -> SAT -> LOY", "Direct effect"] == pytest.approx(B.loc["IMG", "LOY"])
+    # QUAL has no direct path to LOY, so only full or no mediation is possible.
+    assert np.isnan(table.loc["QUAL -> SAT -> LOY", "Direct effect"])
+    assert table.loc["QUAL -> SAT -> LOY", "Mediation"] in ("full", "none")
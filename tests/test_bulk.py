@@ -0,0 +1,66 @@
+"""Bulk classification of SmartPLS tables against the checkers' thresholds."""
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from smartpls_assistant import bulk
+from smartpls_assistant.bulk import FAIL, PASS, WARN
+
+
+def _checker(metric, value):
+    """The if/elif chain of the interactive checker for ``metric``."""
+    if metric == "loading":
+        return PASS if value >= 0.708 else WARN if value >= 0.4 else FAIL
+    if metric == "reliability":
+        return PASS if value >= 0.7 else WARN if value >= 0.6 else FAIL
+    if metric == "ave":
+        return PASS if value >= 0.5 else FAIL
+    if metric == "htmt":
+        return FAIL if value >= 0.9 else WARN if value >= 0.85 else PASS
+    if metric == "vif":
+        return FAIL if value > 5.0 else WARN if value > 3.0 else PASS
+    if metric == "p_value":
+        return PASS if value < 0.05 else FAIL
+    raise KeyError(metric)
+
+
+# Every cut point, values just around it and a spread of ordinary values.
+VALUES = np.unique(np.concatenate([
+    np.linspace(0, 6, 241),
+    [0.05, 0.4, 0.5, 0.6, 0.7, 0.708, 0.85, 0.9, 3.0, 5.0],
+    np.nextafter([0.05, 0.4, 0.5, 0.6, 0.7, 0.708, 0.85, 0.9, 3.0, 5.0], 0),
+    np.nextafter([0.05, 0.4, 0.5, 0.6, 0.7, 0.708, 0.85, 0.9, 3.0, 5.0], 10),
+]))
+
+
+@pytest.mark.parametrize("metric", ["loading", "reliability", "ave", "htmt", "vif", "p_value"])
+def test_classify_matches_the_checkers(metric):
+    expected = [_checker(metric, v) for v in VALUES]
+    assert list(bulk.classify(VALUES, metric)) == expected
+
+
+def test_missing_values_are_not_classified():
+    assert list(bulk.classify([0.8, np.nan], "loading")) == [PASS, ""]
+
+
+def test_construct_reliability_columns():
+    table = pd.DataFrame({
+        "Cronbach's alpha": [0.81, 0.65],
+        "Composite reliability (rho_a)": [0.83, 0.58],
+        "Average variance extracted (AVE)": [0.62, 0.41],
+        "Comment": ["", ""],
+    }, index=["ATT", "INT"])
+    statuses = bulk.classify_report(table, "Construct Reliability")
+    assert statuses.loc["ATT"].tolist() == [PASS, PASS, PASS, ""]
+    assert statuses.loc["INT"].tolist() == [WARN, FAIL, FAIL, ""]
+    assert bulk.summarize(statuses) == {PASS: 3, WARN: 1, FAIL: 2}
+
+
+def test_read_report_matrix():
+    text = ",ATT,INT\natt1,0.852,\natt2,0.512,\nint1,,0.301\n"
+    table = bulk.read_report(io.BytesIO(text.encode()), "Outer loadings.csv")
+    statuses = bulk.classify_report(table, "Outer Loadings")
+    assert list(table.index) == ["att1", "att2", "int1"]
+    assert statuses.to_numpy().tolist() == [[PASS, ""], [WARN, ""], ["", FAIL]]
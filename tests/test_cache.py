@@ -0,0 +1,80 @@
+"""Result cache: keys, LRU budget, disk spill and single computation."""
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from smartpls_assistant import cache
+
+
+def test_keys_follow_the_content():
+    frame = pd.DataFrame({"a": [1.0, 2.0], "b": [3.0, 4.0]})
+    assert cache.key("x", frame, np.arange(3)) == cache.key("x", frame.copy(), np.arange(3))
+    assert cache.key("x", frame) != cache.key("x", frame.assign(b=[3.0, 5.0]))
+    assert cache.key(np.arange(3)) != cache.key(np.arange(3.0))
+
+
+def test_sizeof_counts_buffers_and_containers():
+    array = np.zeros(1000)
+    assert cache.sizeof(array) == 8000
+    assert cache.sizeof({"a": array, "b": [array]}) > 8000
+    assert cache.sizeof({"a": array, "b": [array]}) < 16000
+
+
+def test_least_recently_used_entries_are_evicted():
+    store = cache.ResultCache(max_bytes=25000)
+    for name in "abc":
+        store.put(name, np.zeros(1000))
+    store.get("a")
+    store.put("d", np.zeros(1000))
+    assert "a" in store and "b" not in store
+    stats = store.stats()
+    assert stats["evictions"] == 1 and stats["bytes"] <= 25000
+
+
+def test_evicted_entries_reload_from_disk(tmp_path):
+    store = cache.ResultCache(max_bytes=10000, spill_dir=str(tmp_path))
+    store.put("a", np.arange(1000.0))
+    store.put("b", np.arange(1000.0) + 1)
+    assert len(store) == 1
+    np.testing.assert_array_equal(store.get("a"), np.arange(1000.0))
+    restarted = cache.ResultCache(spill_dir=str(tmp_path))
+    np.testing.assert_array_equal(restarted.get("b"), np.arange(1000.0) + 1)
+    assert restarted.stats()["disk_hits"] == 1
+    restarted.clear(disk=True)
+    assert restarted.get("a", None) is None
+
+
+def test_concurrent_requests_compute_once():
+    store = cache.ResultCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)
+        return 42
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(store.get_or_compute("k", compute)))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [42] * 4 and len(calls) == 1
+
+
+def test_memoize_leaves_underscore_arguments_out_of_the_key():
+    store = cache.ResultCache()
+    calls = []
+
+    @cache.memoize(lambda: store)
+    def total(digest, _data):
+        calls.append(digest)
+        return sum(_data)
+
+    assert total("h1", [1, 2]) == 3
+    assert total("h1", [5, 5]) == 3
+    assert total("h2", [5, 5]) == 10
+    assert calls == ["h1", "h2"]
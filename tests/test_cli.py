@@ -0,0 +1,123 @@
+"""Batch validation of SmartPLS report exports, on the layouts SmartPLS 4 writes."""
+import json
+
+import pytest
+
+from smartpls_assistant import bulk, cli
+from smartpls_assistant.rules import FAIL, PASS
+
+EXPORTS = {
+    # PLS algorithm
+    "Outer loadings - Matrix.csv": (
+        '"","ATT","INT"\n'
+        '"att1","0.852",""\n'
+        '"att2","0.811",""\n'
+        '"int1","","0.903"\n'
+        '"int2","","0.874"\n'
+    ),
+    "Path coefficients - Matrix.csv": (
+        '"","ATT","INT"\n'
+        '"ATT","","0.412"\n'
+        '"INT","",""\n'
+    ),
+    "Discriminant validity - Cross loadings.csv": (
+        '"","ATT","INT"\n'
+        '"att1","0.852","0.214"\n'
+        '"int1","0.198","0.903"\n'
+    ),
+    # Bootstrapping
+    "Outer loadings - Mean, STDEV, T values, p values.csv": (
+        '"","Original sample (O)","Sample mean (M)","Standard deviation (STDEV)","T statistics (|O/STDEV|)","P values"\n'
+        '"att1 <- ATT","0.852","0.851","0.031","27.484","0.000"\n'
+        '"att2 <- ATT","0.811","0.809","0.042","19.310","0.000"\n'
+        '"int1 <- INT","0.903","0.902","0.018","50.167","0.000"\n'
+    ),
+    "Path coefficients - Mean, STDEV, T values, p values.csv": (
+        '"","Original sample (O)","Sample mean (M)","Standard deviation (STDEV)","T statistics (|O/STDEV|)","P values"\n'
+        '"ATT -> INT","0.412","0.415","0.061","6.754","0.000"\n'
+    ),
+    "Discriminant validity - Heterotrait-monotrait ratio (HTMT) - Confidence intervals.csv": (
+        '"","Original sample (O)","Sample mean (M)","2.5%","97.5%"\n'
+        '"INT <-> ATT","0.512","0.514","0.398","0.624"\n'
+    ),
+}
+
+
+@pytest.fixture
+def exports(tmp_path):
+    for name, text in EXPORTS.items():
+        (tmp_path / name).write_text(text, encoding="utf-8")
+    return tmp_path
+
+
+def _records(exports, name, report=None):
+    return cli.check_file(str(exports / name), report, str(exports))
+
+
+def test_bootstrap_loadings_grade_only_the_estimates(exports):
+    [record] = _records(exports, "Outer loadings - Mean, STDEV, T values, p values.csv")
+    assert record["report"] == "Outer Loadings"
+    assert record["cells"] == 3
+    assert record["verdict"] == PASS
+    assert record["flagged"] == []
+
+
+def test_bootstrap_htmt_skips_confidence_bounds(exports):
+    [record] = _records(exports, "Discriminant validity - Heterotrait-monotrait ratio (HTMT) - Confidence intervals.csv")
+    assert (record["report"], record["cells"], record["verdict"]) == ("HTMT", 1, PASS)
+
+
+def test_loading_matrix(exports):
+    [record] = _records(exports, "Outer loadings - Matrix.csv")
+    assert (record["report"], record["cells"], record["verdict"]) == ("Outer Loadings", 4, PASS)
+
+
+def test_bootstrap_path_coefficients(exports):
+    [record] = _records(exports, "Path coefficients - Mean, STDEV, T values, p values.csv")
+    assert (record["report"], record["cells"], record["verdict"]) == ("Path Coefficients (Bootstrapping)", 1, PASS)
+
+
+def test_algorithm_path_coefficients_are_not_the_bootstrap_report(exports):
+    [record] = _records(exports, "Path coefficients - Matrix.csv")
+    assert record["verdict"] == cli.ERROR
+    assert record["report"] == ""
+
+
+def test_forced_report_without_checked_values_is_not_a_pass(exports):
+    [record] = _records(exports, "Path coefficients - Matrix.csv", "Path Coefficients (Bootstrapping)")
+    assert record["cells"] == 0
+    assert record["verdict"] == cli.UNCHECKED
+    assert record["error"]
+
+
+def test_cross_loadings_are_not_outer_loadings(exports):
+    assert bulk.detect_report("Discriminant validity - Cross loadings.csv") is None
+    [record] = _records(exports, "Discriminant validity - Cross loadings.csv")
+    assert record["verdict"] == cli.ERROR
+
+
+def test_low_loading_fails(tmp_path):
+    path = tmp_path / "Outer loadings - Mean, STDEV, T values, p values.csv"
+    path.write_text(EXPORTS[path.name].replace('"0.811","0.809"', '"0.311","0.309"'), encoding="utf-8")
+    [record] = cli.check_file(str(path))
+    assert (record["verdict"], record[FAIL]) == (FAIL, 1)
+    assert [cell["Row"] for cell in record["flagged"]] == ["att2 <- ATT"]
+
+
+def test_main_writes_a_consolidated_report(exports, capsys):
+    out = exports / "verdicts.json"
+    status = cli.main([str(exports), "-o", str(out), "--jobs", "1", "--quiet"])
+    report = json.loads(out.read_text(encoding="utf-8"))
+    verdicts = {record["file"]: record["verdict"] for record in report["reports"]}
+    assert verdicts["Outer loadings - Mean, STDEV, T values, p values.csv"] == PASS
+    assert verdicts["Path coefficients - Matrix.csv"] == cli.ERROR
+    assert report["summary"][cli.UNCHECKED] == 0
+    assert status == 1
+
+
+def test_unchecked_table_fails_the_run(exports):
+    path = str(exports / "Path coefficients - Matrix.csv")
+    out = exports / "verdicts.csv"
+    status = cli.main([path, "-o", str(out), "--report", "Path Coefficients (Bootstrapping)", "--quiet"])
+    assert status == 1
+    assert f",{cli.UNCHECKED}," in out.read_text(encoding="utf-8")
@@ -0,0 +1,124 @@
+"""fsQCA against memberships formed row by row and brute-force minimization."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from smartpls_assistant import fsqca
+
+K = 4
+
+
+@pytest.fixture
+def calibrated():
+    rng = np.random.default_rng(11)
+    m = rng.uniform(size=(80, K))
+    m[:5, 0] = 0.5
+    y = np.clip(np.minimum(m[:, 0], 1 - m[:, 2]) + rng.normal(scale=0.15, size=len(m)), 0, 1)
+    return pd.DataFrame(m, columns=list("ABCD")), y
+
+
+def _membership(m, value, mask=0):
+    """Membership in an implicant, formed explicitly as the minimum over its literals."""
+    columns = [m[:, j] if value >> j & 1 else 1 - m[:, j] for j in range(m.shape[1]) if not mask >> j & 1]
+    return np.min(columns, axis=0) if columns else np.ones(len(m))
+
+
+def _covered(value, mask):
+    return {r for r in range(2 ** K) if r & ~mask == value}
+
+
+def _brute_primes(minterms):
+    """Every term whose rows are all in ``minterms`` and that loses this once widened."""
+    minterms = set(minterms)
+    implicants = set()
+    for mask in range(2 ** K):
+        for value in range(2 ** K):
+            if not value & mask and _covered(value, mask) <= minterms:
+                implicants.add((value, mask))
+    return {(v, mk) for v, mk in implicants
+            if not any((v & ~(1 << j), mk | 1 << j) in implicants for j in range(K) if not mk >> j & 1)}
+
+
+def _parse(labels):
+    for label in labels:
+        value, mask = 0, 2 ** K - 1
+        for literal in label.split("*"):
+            j = "ABCD".index(literal.lstrip("~"))
+            mask &= ~(1 << j)
+            value |= (not literal.startswith("~")) << j
+        yield value, mask
+
+
+def test_calibration_anchors():
+    x = np.array([1.0, 4.0, 7.0, 10.0])
+    m = fsqca.calibrate(x, 1, 4, 7)
+    np.testing.assert_allclose(m[:3], [1 / (1 + np.exp(3)), 0.5, 1 / (1 + np.exp(-3))])
+    assert m[3] > m[2]
+    np.testing.assert_allclose(fsqca.calibrate(x, 7, 4, 1), 1 - m)
+    with pytest.raises(ValueError, match="crossover"):
+        fsqca.calibrate(x, 1, 8, 7)
+
+
+def test_truth_table_matches_row_memberships(calibrated):
+    conditions, y = calibrated
+    m = conditions.to_numpy()
+    table = fsqca.truth_table(conditions, y, frequency=2, consistency=0.8, pri=0.5)
+    for r in range(2 ** K):
+        member = _membership(m, r)
+        hits = np.minimum(member, y).sum()
+        both = np.minimum(member, np.minimum(y, 1 - y)).sum()
+        row = table.loc[r]
+        assert row["Raw consistency"] == pytest.approx(hits / member.sum())
+        assert row["PRI consistency"] == pytest.approx((hits - both) / (member.sum() - both))
+        assert row["Cases"] == np.sum(member > 0.5)
+        assert list(row[list("ABCD")]) == [r >> j & 1 for j in range(K)]
+        if row["Cases"] < 2:
+            assert np.isnan(row["Outcome"])
+        else:
+            assert row["Outcome"] == float(hits / member.sum() >= 0.8 and row["PRI consistency"] >= 0.5)
+
+
+def test_block_boundaries_do_not_change_the_sums(calibrated, monkeypatch):
+    conditions, y = calibrated
+    whole = fsqca.truth_table(conditions, y)
+    monkeypatch.setattr(fsqca, "_BLOCK_BYTES", 8 * (K + 1) * 7)
+    pd.testing.assert_frame_equal(fsqca.truth_table(conditions, y), whole)
+
+
+def test_prime_implicants_match_brute_force():
+    rng = np.random.default_rng(3)
+    for _ in range(20):
+        minterms = np.flatnonzero(rng.uniform(size=2 ** K) < 0.45)
+        if not len(minterms):
+            continue
+        values, masks = fsqca._prime_implicants(minterms, K)
+        assert set(zip(values.tolist(), masks.tolist())) == _brute_primes(minterms)
+
+
+def test_solutions_cover_the_positive_rows(calibrated):
+    conditions, y = calibrated
+    result = fsqca.fsqca(conditions, y, frequency=1, consistency=0.75)
+    outcome = result.truth_table["Outcome"]
+    positive = set(np.flatnonzero(outcome == 1))
+    negative = set(np.flatnonzero(outcome == 0))
+    remainders = set(np.flatnonzero(outcome.isna()))
+    assert positive
+    m = conditions.to_numpy()
+    for kind, solution in result.solutions.items():
+        terms = [(v, mk) for v, mk in _parse(solution.terms.index)]
+        rows = set().union(*(_covered(v, mk) for v, mk in terms))
+        assert positive <= rows and not rows & negative, kind
+        if kind == "complex":
+            assert rows == positive
+        member = np.max([_membership(m, v, mk) for v, mk in terms], axis=0)
+        hits = np.minimum(member, y).sum()
+        assert solution.consistency == pytest.approx(hits / member.sum())
+        assert solution.coverage == pytest.approx(hits / y.sum())
+    primes = _brute_primes(positive | remainders)
+    assert set(_parse(result.solutions["parsimonious"].terms.index)) <= primes
+
+
+def test_no_positive_rows_gives_empty_solutions(calibrated):
+    conditions, y = calibrated
+    result = fsqca.fsqca(conditions, y, consistency=1.01)
+    assert all(solution.formula == "(no solution)" for solution in result.solutions.values())
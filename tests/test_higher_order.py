@@ -0,0 +1,89 @@
+"""Higher-order constructs: repeated indicators and the two-stage approaches."""
+import numpy as np
+import pytest
+
+from smartpls_assistant import blindfolding, higher_order, pls
+from smartpls_assistant.model import ModelSpec
+
+HOC = """
+IMG   =~ img1 + img2 + img3
+QUAL  =~ q1 + q2 + q3
+SAT   =~ sat1 + sat2 + sat3 + sat4
+VALUE =~ QUAL + SAT
+LOY   =~ loy1 + loy2
+VALUE ~ IMG
+LOY ~ VALUE + IMG
+"""
+
+
+@pytest.fixture
+def hoc():
+    return ModelSpec.from_syntax(HOC)
+
+
+def test_repeated_indicators_and_implied_paths(hoc):
+    assert hoc.higher_order == {"VALUE": ["QUAL", "SAT"]}
+    assert hoc.blocks["VALUE"] == hoc.blocks["QUAL"] + hoc.blocks["SAT"]
+    assert {("VALUE", "QUAL"), ("VALUE", "SAT")} <= set(hoc.paths)
+    items, block = hoc.outer_edges()
+    assert len(items) == len(hoc.indicators) + len(hoc.blocks["VALUE"])
+    assert len(set(hoc.indicators)) == len(hoc.indicators)
+    assert ModelSpec.from_syntax(hoc.to_syntax()) == hoc
+
+
+def test_formative_higher_order_paths_point_inwards():
+    spec = ModelSpec.from_syntax(HOC.replace("VALUE =~", "VALUE <~"))
+    assert {("QUAL", "VALUE"), ("SAT", "VALUE")} <= set(spec.paths)
+
+
+def test_repeated_indicators_match_an_explicit_model(survey, hoc):
+    # The same model written out with the repeated items copied into new columns.
+    data = survey.copy()
+    copies = {}
+    for item in hoc.blocks["VALUE"]:
+        copies[item] = f"{item}_v"
+        data[copies[item]] = data[item]
+    blocks = {c: items for c, items in hoc.blocks.items() if c != "VALUE"}
+    blocks["VALUE"] = [copies[item] for item in hoc.blocks["VALUE"]]
+    explicit = ModelSpec(blocks, hoc.paths, hoc.modes)
+    result = pls.estimate(survey, hoc, tol=1e-10)
+    expected = pls.estimate(data, explicit, tol=1e-10)
+    for (a, b) in hoc.paths:
+        assert result.path_coefficients.loc[a, b] == pytest.approx(expected.path_coefficients.loc[a, b], abs=1e-8)
+    for item in hoc.blocks["VALUE"]:
+        assert result.outer_loadings.loc[item, "VALUE"] == pytest.approx(
+            expected.outer_loadings.loc[copies[item], "VALUE"], abs=1e-8)
+        assert result.outer_loadings.loc[item, "SAT" if item.startswith("sat") else "QUAL"] == pytest.approx(
+            expected.outer_loadings.loc[item, "SAT" if item.startswith("sat") else "QUAL"], abs=1e-8)
+
+
+@pytest.mark.parametrize("approach", higher_order.APPROACHES)
+def test_two_stage_uses_lower_order_scores(survey, hoc, approach):
+    result = higher_order.two_stage(survey, hoc, approach, tol=1e-10)
+    first = hoc if approach == "embedded" else higher_order.disjoint_spec(hoc)
+    stage_one = pls.estimate(survey, first, tol=1e-10)
+    np.testing.assert_allclose(result.data[["QUAL", "SAT"]], stage_one.scores[["QUAL", "SAT"]])
+    assert result.stage_two.spec.blocks["VALUE"] == ["QUAL", "SAT"]
+    assert "QUAL" not in result.stage_two.spec.constructs
+    expected = pls.estimate(result.data, higher_order.stage_two_spec(hoc), tol=1e-10)
+    np.testing.assert_allclose(result.stage_two.path_coefficients, expected.path_coefficients)
+
+
+def test_disjoint_stage_one_links_the_lower_order_constructs(hoc):
+    spec = higher_order.disjoint_spec(hoc)
+    assert "VALUE" not in spec.constructs
+    assert set(spec.paths) == {("IMG", "QUAL"), ("IMG", "SAT"), ("QUAL", "LOY"), ("SAT", "LOY"), ("IMG", "LOY")}
+
+
+def test_paths_through_lower_order_constructs_are_rejected(survey):
+    spec = ModelSpec.from_syntax(HOC + "LOY ~ SAT\n")
+    with pytest.raises(ValueError, match="lower-order"):
+        higher_order.two_stage(survey, spec)
+
+
+def test_blindfolding_with_repeated_indicators(survey, hoc):
+    # D must not divide a block size (VALUE has 7 items), or whole columns are omitted.
+    table = blindfolding.blindfolding(survey, hoc, D=6, n_jobs=1)
+    assert list(table.index) == hoc.endogenous
+    assert np.isfinite(table.to_numpy(dtype=float)).all()
+    assert table.loc["VALUE", "SSO"] == pytest.approx(len(survey) * len(hoc.blocks["VALUE"]))
@@ -0,0 +1,78 @@
+"""HTMT against its definition on absolute correlations, and Fornell-Larcker."""
+import numpy as np
+import pytest
+
+from smartpls_assistant import htmt, pls
+from smartpls_assistant.bootstrap import _chunk_sizes
+
+
+def _naive(R, spec):
+    """mean |r_ij| / sqrt(mean |r_ii| * mean |r_jj|) over the distinct item pairs."""
+    index = {item: h for h, item in enumerate(spec.indicators)}
+    blocks = {c: [index[i] for i in items] for c, items in spec.blocks.items()}
+    A = np.abs(R)
+
+    def mono(c):
+        rows = blocks[c]
+        return np.mean([A[a, b] for a in rows for b in rows if a < b])
+
+    out = {}
+    for i, a in enumerate(spec.constructs):
+        for b in spec.constructs[:i]:
+            hetero = A[np.ix_(blocks[a], blocks[b])].mean()
+            out[a, b] = hetero / np.sqrt(mono(a) * mono(b))
+    return out
+
+
+@pytest.fixture
+def reversed_survey(survey):
+    # sat4 is reverse-keyed and the loyalty items are scored the other way round.
+    data = survey.copy()
+    data["sat4"] = -data["sat4"]
+    data[["loy1", "loy2"]] = -data[["loy1", "loy2"]]
+    return data
+
+
+def test_matrix_matches_definition_with_reverse_keyed_items(reversed_survey, spec):
+    R = pls.correlation(reversed_survey[spec.indicators].to_numpy())
+    matrix = htmt.htmt_matrix(R, spec)
+    for (a, b), value in _naive(R, spec).items():
+        assert matrix.loc[a, b] == pytest.approx(value)
+        assert matrix.loc[b, a] == pytest.approx(value)
+        assert value > 0
+    assert np.isnan(np.diag(matrix.to_numpy())).all()
+
+
+def test_reverse_keying_does_not_change_htmt(survey, reversed_survey, spec):
+    before = htmt.htmt_matrix(pls.correlation(survey[spec.indicators].to_numpy()), spec)
+    after = htmt.htmt_matrix(pls.correlation(reversed_survey[spec.indicators].to_numpy()), spec)
+    np.testing.assert_allclose(after.to_numpy(), before.to_numpy())
+
+
+def test_bootstrap_matches_resampled_data(reversed_survey, spec):
+    n_boot, seed, chunk = 30, 4, 8
+    table = htmt.htmt_bootstrap(reversed_survey, spec, n_boot=n_boot, seed=seed, chunk_size=chunk)
+    n = len(reversed_survey)
+    draws = []
+    sizes = _chunk_sizes(n_boot, chunk, 1)
+    for child, size in zip(np.random.SeedSequence(seed).spawn(len(sizes)), sizes):
+        rng = np.random.default_rng(child)
+        for _ in range(size):
+            counts = np.bincount(rng.integers(0, n, n), minlength=n)
+            sample = reversed_survey[spec.indicators].to_numpy()[np.repeat(np.arange(n), counts)]
+            draws.append(_naive(pls.correlation(sample), spec))
+    for label in table.index:
+        a, b = label.split(" <-> ")
+        values = np.array([draw[a, b] for draw in draws])
+        assert table.loc[label, "Sample mean (M)"] == pytest.approx(values.mean())
+        assert table.loc[label, "95% upper bound"] == pytest.approx(np.quantile(values, 0.95))
+
+
+def test_fornell_larcker(survey, spec):
+    result = pls.estimate(survey, spec)
+    table, met = htmt.fornell_larcker(result)
+    root_ave = np.sqrt(result.reliability["Average variance extracted (AVE)"])
+    np.testing.assert_allclose(np.diag(table.to_numpy()), root_ave)
+    C = result.latent_correlations.abs().to_numpy().copy()
+    np.fill_diagonal(C, -np.inf)
+    np.testing.assert_array_equal(met.to_numpy(), root_ave.to_numpy() > C.max(axis=1))
@@ -0,0 +1,49 @@
+"""IPMA against unstandardized regressions on explicitly rescaled scores."""
+import numpy as np
+import pytest
+
+from smartpls_assistant import ipma, pls
+
+
+def test_total_effects_match_path_enumeration(spec):
+    B = np.zeros((4, 4))
+    B[0, 2], B[1, 2], B[2, 3], B[0, 3] = 0.3, 0.4, 0.5, 0.2
+    T = ipma.total_effects(B)
+    assert T[0, 3] == pytest.approx(0.2 + 0.3 * 0.5)
+    assert T[1, 3] == pytest.approx(0.4 * 0.5)
+    assert T[2, 3] == pytest.approx(0.5)
+    assert T[3].sum() == 0
+
+
+def test_importance_and_performance_from_rescaled_scores(survey, spec):
+    result = pls.estimate(survey, spec)
+    constructs, indicators = ipma.ipma(result, survey, "LOY")
+    X = survey[spec.indicators]
+    rescaled = (X - X.min()) / (X.max() - X.min()) * 100
+    scores = {}
+    for construct, items in spec.blocks.items():
+        weights = result.outer_weights.loc[items, construct] / X[items].std(ddof=0) * (X[items].max() - X[items].min())
+        weights /= weights.sum()
+        scores[construct] = rescaled[items] @ weights
+        if construct != "LOY":
+            np.testing.assert_allclose(indicators.loc[items, "Rescaled weight"], weights)
+
+    def regress(target, predictors):
+        P = np.column_stack([scores[c] - scores[c].mean() for c in predictors])
+        return dict(zip(predictors, np.linalg.lstsq(P, scores[target] - scores[target].mean(), rcond=None)[0]))
+
+    sat = regress("SAT", ["IMG", "QUAL"])
+    loy = regress("LOY", ["SAT", "IMG"])
+    expected = {"SAT": loy["SAT"], "IMG": loy["IMG"] + sat["IMG"] * loy["SAT"], "QUAL": sat["QUAL"] * loy["SAT"]}
+    assert set(constructs.index) == set(expected)
+    assert "loy1" not in indicators.index
+    for construct, effect in expected.items():
+        assert constructs.loc[construct, "Importance"] == pytest.approx(effect)
+        assert constructs.loc[construct, "Performance"] == pytest.approx(scores[construct].mean())
+    np.testing.assert_allclose(indicators["Performance"], rescaled[indicators.index].mean())
+
+
+def test_values_outside_the_scale_are_rejected(survey, spec):
+    result = pls.estimate(survey, spec)
+    with pytest.raises(ValueError, match="outside the scale"):
+        ipma.ipma(result, survey, "LOY", scale=(1, 7))
@@ -0,0 +1,92 @@
+"""Background jobs: fair dispatch, cancellation and identical cached jobs."""
+import threading
+import time
+
+import pytest
+
+from smartpls_assistant import cache, jobs
+
+
+def _until(condition, timeout=5.0):
+    end = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < end, "timed out"
+        time.sleep(0.01)
+
+
+def _blocking(release):
+    def work(job):
+        while not release.is_set():
+            job.progress(0, 1)
+            time.sleep(0.01)
+        job.progress(1, 1)
+        return job.owner
+    return work
+
+
+def test_owners_are_served_round_robin():
+    scheduler = jobs.JobScheduler(max_workers=1, max_running=1)
+    release = threading.Event()
+    first = scheduler.submit("a", "first", _blocking(release))
+    queued = [scheduler.submit("a", f"a{i}", _blocking(release)) for i in range(3)]
+    queued.append(scheduler.submit("b", "b0", _blocking(release)))
+    _until(lambda: first.status == jobs.RUNNING)
+    release.set()
+    for job in [first, *queued]:
+        _until(lambda: job.finished)
+    order = sorted(queued, key=lambda job: job.started)
+    assert [job.label for job in order] == ["b0", "a0", "a1", "a2"]
+    assert all(job.status == jobs.DONE for job in queued)
+
+
+def test_cancel_queued_and_running_jobs():
+    scheduler = jobs.JobScheduler(max_workers=1, max_running=1)
+    release = threading.Event()
+    running = scheduler.submit("a", "running", _blocking(release))
+    queued = scheduler.submit("a", "queued", _blocking(release))
+    _until(lambda: running.status == jobs.RUNNING)
+    scheduler.cancel(queued)
+    assert queued.status == jobs.CANCELLED
+    scheduler.cancel(running)
+    _until(lambda: running.finished)
+    assert running.status == jobs.CANCELLED and queued.started is None
+
+
+@pytest.fixture
+def identical():
+    """Two identical cached jobs on a two-job scheduler and the computation they share."""
+    store = cache.ResultCache()
+    release = threading.Event()
+    calls = []
+
+    @cache.memoize(lambda: store, waiting=lambda *args: args[-1].wait())
+    def cached_work(key, _job):
+        calls.append(_job.label)
+        return _blocking(release)(_job)
+
+    scheduler = jobs.JobScheduler(max_workers=2, max_running=2)
+    first = scheduler.submit("a", "first", cached_work, "k")
+    _until(lambda: calls)
+    second = scheduler.submit("b", "second", cached_work, "k")
+    _until(lambda: second.message == "waiting for an identical job")
+    return scheduler, first, second, release, calls
+
+
+def test_waiting_duplicate_can_be_cancelled(identical):
+    scheduler, first, second, release, calls = identical
+    scheduler.cancel(second)
+    _until(lambda: second.finished)
+    assert second.status == jobs.CANCELLED and not first.finished
+    release.set()
+    _until(lambda: first.finished)
+    assert first.status == jobs.DONE and first.result == "a" and calls == ["first"]
+
+
+def test_duplicate_takes_over_when_the_first_is_cancelled(identical):
+    scheduler, first, second, release, calls = identical
+    scheduler.cancel(first)
+    _until(lambda: first.finished and calls == ["first", "second"])
+    release.set()
+    _until(lambda: second.finished)
+    assert first.status == jobs.CANCELLED
+    assert second.status == jobs.DONE and second.result == "b"
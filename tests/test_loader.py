@@ -0,0 +1,69 @@
+"""Reading raw data and multi-table exports."""
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from smartpls_assistant import loader
+from smartpls_assistant.data import read_data
+
+# Respondent 2 skipped every item, respondent 3 answered only a2.
+RAW = (
+    "a1,a2,a3\n"
+    "5,4,5\n"
+    ",,\n"
+    ",3,\n"
+    "2,2,1\n"
+)
+
+
+def test_all_missing_row_is_kept(tmp_path):
+    path = tmp_path / "survey.csv"
+    path.write_text(RAW, encoding="utf-8")
+    data = read_data(str(path))
+    expected = pd.read_csv(path)
+    assert data.shape == expected.shape == (4, 3)
+    np.testing.assert_array_equal(data.to_numpy(dtype=float), expected.to_numpy(dtype=float))
+    assert data.iloc[1].isna().all()
+
+
+def test_all_missing_row_in_uploaded_semicolon_file():
+    text = RAW.replace(",", ";").replace("5;4;5", "5,5;4;5")
+    data = read_data(io.BytesIO(text.encode()), "survey.csv")
+    assert len(data) == 4
+    assert data.iloc[0, 0] == pytest.approx(5.5)
+    assert data.iloc[1].isna().all()
+
+
+def test_all_missing_row_in_workbook(tmp_path):
+    pytest.importorskip("openpyxl")
+    path = tmp_path / "survey.xlsx"
+    pd.read_csv(io.StringIO(RAW)).to_excel(path, index=False)
+    data = read_data(str(path))
+    assert len(data) == 4
+    assert data.iloc[1].isna().all()
+
+
+def test_cached_data_keep_all_rows(tmp_path):
+    path = tmp_path / "survey.csv"
+    path.write_text(RAW, encoding="utf-8")
+    first = read_data(str(path), cache_dir=str(tmp_path / "cache"))
+    second = read_data(str(path), cache_dir=str(tmp_path / "cache"))
+    assert len(first) == len(second) == 4
+
+
+def test_report_sections_are_still_split(tmp_path):
+    path = tmp_path / "Report.csv"
+    path.write_text(
+        "Outer loadings\n"
+        ",ATT,INT\n"
+        "att1,0.852,\n"
+        "int1,,0.903\n"
+        ",,\n"
+        "Path coefficients\n"
+        ",ATT,INT\n"
+        "ATT,,0.412\n",
+        encoding="utf-8")
+    found = loader.sections(str(path))
+    assert [(s.title, s.rows) for s in found] == [("Outer loadings", 2), ("Path coefficients", 1)]
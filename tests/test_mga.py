@@ -0,0 +1,69 @@
+"""Permutation and Henseler MGA against brute-force computations."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from smartpls_assistant import mga, pls
+from smartpls_assistant.bootstrap import bootstrap
+
+from conftest import simulate
+
+
+@pytest.fixture
+def groups():
+    a, b = simulate(120, seed=1), simulate(140, seed=2)
+    # Reverse the loyalty scale in group B: SAT -> LOY changes sign there.
+    b[["loy1", "loy2"]] = -b[["loy1", "loy2"]]
+    return pd.concat([a.assign(group="A"), b.assign(group="B")], ignore_index=True)
+
+
+def _paths(data, spec):
+    B = pls.estimate(data, spec).path_coefficients
+    return np.array([B.loc[a, b] for a, b in spec.paths])
+
+
+def test_permutation_p_values_match_explicit_permutations(groups, spec):
+    table = mga.permutation_mga(groups, spec, "group", n_perm=40, batch_size=15, seed=6, n_jobs=1)
+    observed = _paths(groups[groups.group == "A"], spec) - _paths(groups[groups.group == "B"], spec)
+    np.testing.assert_allclose(table["Difference (A - B)"], observed, atol=1e-6)
+    n, size_a = len(groups), int((groups.group == "A").sum())
+    exceed = np.zeros(len(spec.paths))
+    for child, size in zip(np.random.SeedSequence(6).spawn(3), (15, 15, 10)):
+        rng = np.random.default_rng(child)
+        for _ in range(size):
+            rows = rng.permutation(n)[:size_a]
+            mask = np.zeros(n, dtype=bool)
+            mask[rows] = True
+            diff = _paths(groups[mask], spec) - _paths(groups[~mask], spec)
+            exceed += np.abs(diff) >= np.abs(observed) - 1e-9
+    np.testing.assert_allclose(table["Permutation p value"], (exceed + 1) / 41)
+    assert (table["Permutations"] == 40).all()
+
+
+def test_early_stopping_decides_clear_paths(groups, spec):
+    full = mga.permutation_mga(groups, spec, "group", n_perm=600, seed=1, n_jobs=1)
+    early = mga.permutation_mga(groups, spec, "group", n_perm=600, seed=1, n_jobs=1,
+                                early_stopping=True, min_perm=200)
+    assert early.loc["SAT -> LOY", "Permutations"] < 600
+    assert early.loc["SAT -> LOY", "Permutation p value"] < 0.05
+    assert ((early["Permutation p value"] < 0.05) == (full["Permutation p value"] < 0.05)).all()
+
+
+def test_henseler_p_values_match_all_pairs(groups, spec):
+    table = mga.henseler_mga(groups, spec, "group", n_boot=60, seed=2, n_jobs=1)
+    # The same bootstrap draws, compared pair by pair.
+    seeds = np.random.SeedSequence(2).spawn(2)
+    draws = [bootstrap(groups[groups.group == g], spec, 60, "path", int(child.generate_state(1)[0]), 1).draws["paths"]
+             for g, child in zip("AB", seeds)]
+    a, b = draws
+    for m, label in enumerate(table.index):
+        diff = 2 * a[:, m].mean() - a[:, None, m] - 2 * b[:, m].mean() + b[None, :, m]
+        p = 1 - np.mean(diff > 0)
+        assert table.loc[label, "p value (A > B)"] == pytest.approx(p)
+        assert table.loc[label, "Henseler p value (2-tailed)"] == pytest.approx(2 * min(p, 1 - p))
+
+
+def test_groups_must_be_chosen(groups, spec):
+    three = groups.assign(group=np.arange(len(groups)) % 3)
+    with pytest.raises(ValueError, match="3 groups"):
+        mga.permutation_mga(three, spec, "group", n_perm=10, n_jobs=1)
@@ -0,0 +1,50 @@
+"""Simple slopes and Johnson-Neyman against per-point computations."""
+import numpy as np
+import pytest
+
+from smartpls_assistant import moderation, pls
+from smartpls_assistant._stats import norm_ppf
+
+B1, B3 = 0.12, 0.09
+COV = moderation.covariance(0.04, 0.03, 0.0004)
+
+
+def test_conditional_effects_match_the_linear_combination():
+    z = norm_ppf(0.975)
+    table = moderation.conditional_effects(B1, B3, COV, np.linspace(-3, 3, 13))
+    for _, row in table.iterrows():
+        g = np.array([1.0, row["Moderator"]])
+        se = np.sqrt(g @ COV @ g)
+        assert row["Conditional effect"] == pytest.approx(B1 + B3 * row["Moderator"])
+        assert row["Standard error"] == pytest.approx(se)
+        assert row["Lower"] == pytest.approx(row["Conditional effect"] - z * se)
+        assert row["Significant"] == (abs(row["Conditional effect"]) > z * se)
+
+
+def test_simple_slopes_at_sd_levels():
+    table = moderation.simple_slopes(B1, B3, COV)
+    assert list(table.index) == ["Moderator at -1 SD", "Moderator at mean", "Moderator at +1 SD"]
+    np.testing.assert_allclose(table["Simple slope"], [B1 - B3, B1, B1 + B3])
+    assert table["P values"].iloc[1] < 0.05 < table["P values"].iloc[0]
+
+
+def test_johnson_neyman_bounds_the_significant_region():
+    bounds = moderation.johnson_neyman(B1, B3, COV)
+    assert len(bounds) == 2
+    grid = np.linspace(-20, 20, 40001)
+    significant = moderation.conditional_effects(B1, B3, COV, grid)["Significant"].to_numpy()
+    changes = grid[1:][significant[1:] != significant[:-1]]
+    np.testing.assert_allclose(changes, bounds, atol=1e-3)
+    # No effect at any moderator value: no boundary.
+    assert len(moderation.johnson_neyman(0.0, 0.0, COV)) == 0
+
+
+def test_two_stage_interaction_term(survey, spec):
+    result = pls.estimate(survey, spec)
+    interaction = moderation.two_stage(result, survey, "SAT", "IMG", "LOY", n_boot=40, seed=1, n_jobs=1)
+    assert list(interaction.paths.index) == ["SAT -> LOY", "IMG -> LOY", "SAT x IMG -> LOY"]
+    assert interaction.covariance.shape == (2, 2)
+    lo, hi = interaction.moderator_range
+    assert lo == pytest.approx(result.scores["IMG"].min()) and hi == pytest.approx(result.scores["IMG"].max())
+    with pytest.raises(ValueError, match="no path"):
+        moderation.two_stage(result, survey, "QUAL", "IMG", "LOY", n_boot=10)
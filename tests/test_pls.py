@@ -0,0 +1,101 @@
+"""The correlation-based PLS algorithm against a naive data-based implementation."""
+import numpy as np
+import pytest
+
+from smartpls_assistant import pls
+
+
+def _naive(data, spec, scheme, tol=1e-10, max_iter=1000):
+    """Lohmöller's algorithm on the data matrix, one construct at a time."""
+    X = {c: data[items].to_numpy(dtype=float) for c, items in spec.blocks.items()}
+    X = {c: (x - x.mean(axis=0)) / x.std(axis=0) for c, x in X.items()}
+    n = len(data)
+    constructs = spec.constructs
+    preds = {c: [a for a, b in spec.paths if b == c] for c in constructs}
+    succs = {c: [b for a, b in spec.paths if a == c] for c in constructs}
+    w = {c: np.ones(X[c].shape[1]) for c in constructs}
+
+    def scores(w):
+        Y = {c: X[c] @ w[c] for c in constructs}
+        return {c: Y[c] / Y[c].std() for c in constructs}, {c: w[c] / (X[c] @ w[c]).std() for c in constructs}
+
+    Y, w = scores(w)
+    for _ in range(max_iter):
+        corr = lambda a, b: Y[a] @ Y[b] / n
+        proxy = {}
+        for c in constructs:
+            inner = np.zeros(n)
+            neighbours = preds[c] + succs[c]
+            if scheme == "path":
+                if preds[c]:
+                    P = np.column_stack([Y[a] for a in preds[c]])
+                    beta = np.linalg.lstsq(P, Y[c], rcond=None)[0]
+                    inner += P @ beta
+                for b in succs[c]:
+                    inner += corr(c, b) * Y[b]
+            else:
+                for b in neighbours:
+                    e = corr(c, b) if scheme == "factor" else np.sign(corr(c, b))
+                    inner += e * Y[b]
+            proxy[c] = inner
+        new = {}
+        for c in constructs:
+            if spec.modes[c] == "B":
+                new[c] = np.linalg.lstsq(X[c], proxy[c], rcond=None)[0]
+            else:
+                new[c] = X[c].T @ proxy[c] / n
+        Y_new, new = scores(new)
+        delta = max(np.max(np.abs(new[c] - w[c])) for c in constructs)
+        Y, w = Y_new, new
+        if delta < tol:
+            break
+    loadings = {c: X[c].T @ Y[c] / n for c in constructs}
+    paths = {}
+    r2 = {}
+    for c in constructs:
+        if preds[c]:
+            P = np.column_stack([Y[a] for a in preds[c]])
+            beta = np.linalg.lstsq(P, Y[c], rcond=None)[0]
+            paths.update({(a, c): b for a, b in zip(preds[c], beta)})
+            r2[c] = 1 - np.var(Y[c] - P @ beta)
+    return w, loadings, paths, r2
+
+
+@pytest.mark.parametrize("scheme", ["path", "factor", "centroid"])
+def test_matches_naive_algorithm(survey, spec, scheme):
+    result = pls.estimate(survey, spec, scheme=scheme, tol=1e-10, max_iter=1000)
+    weights, loadings, paths, r2 = _naive(survey, spec, scheme)
+    assert result.converged
+    for construct, items in spec.blocks.items():
+        np.testing.assert_allclose(result.outer_weights.loc[items, construct], weights[construct], atol=1e-8)
+        np.testing.assert_allclose(result.outer_loadings.loc[items, construct], loadings[construct], atol=1e-8)
+    for (a, b), beta in paths.items():
+        assert result.path_coefficients.loc[a, b] == pytest.approx(beta, abs=1e-8)
+    for construct, value in r2.items():
+        assert result.r2[construct] == pytest.approx(value, abs=1e-8)
+
+
+def test_reliability_from_loadings(survey, spec):
+    result = pls.estimate(survey, spec)
+    items = spec.blocks["SAT"]
+    lam = result.outer_loadings.loc[items, "SAT"].to_numpy()
+    rho_c = lam.sum() ** 2 / (lam.sum() ** 2 + np.sum(1 - lam ** 2))
+    R = survey[items].corr().to_numpy()
+    q = len(items)
+    alpha = q / (q - 1) * (1 - q / R.sum())
+    row = result.reliability.loc["SAT"]
+    assert row["Composite reliability (rho_c)"] == pytest.approx(rho_c)
+    assert row["Average variance extracted (AVE)"] == pytest.approx(np.mean(lam ** 2))
+    assert row["Cronbach's alpha"] == pytest.approx(alpha)
+
+
+def test_scores_have_unit_variance(survey, spec):
+    result = pls.estimate(survey, spec)
+    np.testing.assert_allclose(result.scores.std(ddof=0), 1.0)
+    np.testing.assert_allclose(result.scores.corr(), result.latent_correlations, atol=1e-10)
+
+
+def test_missing_values_are_rejected(survey, spec):
+    survey.iloc[3, 0] = np.nan
+    with pytest.raises(ValueError, match="missing"):
+        pls.estimate(survey, spec)
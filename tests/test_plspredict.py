@@ -0,0 +1,64 @@
+"""PLSpredict against k-fold cross-validation on explicitly split data."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from smartpls_assistant import plspredict, pls
+
+
+def _naive(data, spec, folds, seed):
+    """Hold-out predictions of every endogenous indicator, one repetition."""
+    exogenous = [c for c in spec.constructs if c not in spec.endogenous]
+    x_items = [i for c in exogenous for i in spec.blocks[c]]
+    y_items = [i for c in spec.endogenous for i in spec.blocks[c]]
+    n = len(data)
+    child = np.random.SeedSequence(seed).spawn(1)[0]
+    pls_pred = pd.DataFrame(np.nan, index=data.index, columns=y_items)
+    lm_pred = pls_pred.copy()
+    for test in np.array_split(np.random.default_rng(child).permutation(n), folds):
+        train = data.drop(index=data.index[test])
+        held = data.iloc[test]
+        result = pls.estimate(train, spec, tol=1e-10, max_iter=1000)
+        mean, sd = train.mean(), train.std(ddof=0)
+        Z = (held[spec.indicators] - mean[spec.indicators]) / sd[spec.indicators]
+        scores = Z.to_numpy() @ np.nan_to_num(result.outer_weights.to_numpy())
+        scores = pd.DataFrame(scores, index=held.index, columns=spec.constructs)
+        for construct in spec.endogenous:  # already in causal order here
+            preds = [a for a, b in spec.paths if b == construct]
+            scores[construct] = sum(scores[a] * result.path_coefficients.loc[a, construct] for a in preds)
+        for construct in spec.endogenous:
+            for item in spec.blocks[construct]:
+                loading = result.outer_loadings.loc[item, construct]
+                pls_pred.loc[held.index, item] = mean[item] + sd[item] * scores[construct] * loading
+        X = np.column_stack([np.ones(len(train)), train[x_items]])
+        beta = np.linalg.lstsq(X, train[y_items].to_numpy(), rcond=None)[0]
+        lm_pred.loc[held.index] = np.column_stack([np.ones(len(held)), held[x_items]]) @ beta
+    actual = data[y_items]
+    naive_mean = pd.DataFrame(np.nan, index=data.index, columns=y_items)
+    for test in np.array_split(np.random.default_rng(child).permutation(n), folds):
+        naive_mean.iloc[test] = data[y_items].drop(index=data.index[test]).mean().to_numpy()
+    return actual, pls_pred, lm_pred, naive_mean
+
+
+def test_matches_explicit_cross_validation(survey, spec):
+    table = plspredict.plspredict(survey, spec, folds=5, repetitions=1, seed=3, n_jobs=1, tol=1e-10, max_iter=1000)
+    actual, pls_pred, lm_pred, naive_mean = _naive(survey, spec, 5, 3)
+    assert list(table.index) == list(actual.columns)
+    rmse = lambda pred: np.sqrt(((actual - pred) ** 2).mean())
+    np.testing.assert_allclose(table["PLS RMSE"], rmse(pls_pred), rtol=1e-7)
+    np.testing.assert_allclose(table["LM RMSE"], rmse(lm_pred), rtol=1e-7)
+    np.testing.assert_allclose(table["PLS MAE"], (actual - pls_pred).abs().mean(), rtol=1e-7)
+    q2 = 1 - ((actual - pls_pred) ** 2).sum() / ((actual - naive_mean) ** 2).sum()
+    np.testing.assert_allclose(table["Q²predict"], q2, rtol=1e-7)
+
+
+def test_predictive_power_verdicts():
+    table = pd.DataFrame({"PLS RMSE": [1.0, 1.0, 1.0], "LM RMSE": [1.1, 1.2, 0.9]})
+    assert plspredict.predictive_power(table) == ("medium", 2, 3)
+    assert plspredict.predictive_power(table.assign(**{"LM RMSE": 2.0})) == ("high", 3, 3)
+    assert plspredict.predictive_power(table.assign(**{"LM RMSE": 0.5}))[0] == "none"
+
+
+def test_folds_are_checked(survey, spec):
+    with pytest.raises(ValueError, match="folds"):
+        plspredict.plspredict(survey, spec, folds=1, n_jobs=1)
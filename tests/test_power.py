@@ -0,0 +1,78 @@
+"""Minimum sample sizes and Monte Carlo power."""
+import numpy as np
+import pytest
+
+from smartpls_assistant import power
+from smartpls_assistant.model import ModelSpec
+
+SYNTAX = """
+A =~ a1 + a2 + a3
+B =~ b1 + b2 + b3
+C =~ c1 + c2 + c3
+B ~ A
+C ~ A + B
+"""
+BETAS = {("A", "B"): 0.4, ("A", "C"): 0.0, ("B", "C"): 0.3}
+
+
+@pytest.fixture
+def model():
+    return ModelSpec.from_syntax(SYNTAX)
+
+
+def test_inverse_square_root():
+    assert power.inverse_square_root(0.2) == int(np.ceil((2.486 / 0.2) ** 2)) == 155
+    assert power.inverse_square_root(-0.2) == 155
+    z = power.critical_value(0.05, 2) + power.critical_value(0.2, 1)
+    assert power.inverse_square_root(0.2, tails=2) == int(np.ceil((z / 0.2) ** 2))
+    with pytest.raises(ValueError):
+        power.inverse_square_root(0)
+
+
+def test_gamma_exponential_is_never_above_the_inverse_square_root():
+    assert (power.inverse_square_root(0.197), power.gamma_exponential(0.197)) == (160, 148)
+    z = power.critical_value(0.05, 1) + power.critical_value(0.2, 1)
+    for beta in np.linspace(0.05, 0.95, 19):
+        n = power.gamma_exponential(beta)
+        assert n <= power.inverse_square_root(beta)
+        assert n == int(np.ceil((z * np.exp(-beta ** 2) / beta) ** 2))
+    with pytest.raises(ValueError):
+        power.gamma_exponential(1.0)
+
+
+def test_implied_correlation(model):
+    R, phi = power.implied_correlation(model, BETAS, loadings=0.8, exogenous_correlation=0.0)
+    assert phi.loc["A", "B"] == pytest.approx(0.4)
+    assert phi.loc["A", "C"] == pytest.approx(0.4 * 0.3)
+    assert phi.loc["B", "C"] == pytest.approx(0.3)
+    index = model.indicators.index
+    assert R[index("a1"), index("a2")] == pytest.approx(0.64)
+    assert R[index("a1"), index("b1")] == pytest.approx(0.64 * 0.4)
+    with pytest.raises(ValueError, match="explain"):
+        power.implied_correlation(model, {**BETAS, ("A", "B"): 1.2})
+
+
+@pytest.mark.parametrize("n", [5, 40])
+def test_sample_correlations_have_the_sampling_distribution(model, n):
+    R, _ = power.implied_correlation(model, BETAS)
+    chol = np.linalg.cholesky(R)
+    draws = power.sample_correlations(np.random.default_rng(n), chol, n, 20000)
+    np.testing.assert_allclose(np.diagonal(draws, axis1=1, axis2=2), 1.0)
+    # The same correlation computed from explicitly drawn samples.
+    data = np.random.default_rng(n + 1).standard_normal((20000, n, len(R))) @ chol.T
+    x, y = (data[:, :, j] - data[:, :, j].mean(axis=1, keepdims=True) for j in (0, 3))
+    explicit = (x * y).sum(axis=1) / np.sqrt((x * x).sum(axis=1) * (y * y).sum(axis=1))
+    assert draws[:, 0, 3].mean() == pytest.approx(explicit.mean(), abs=0.01)
+    assert draws[:, 0, 3].std() == pytest.approx(explicit.std(), rel=0.03)
+
+
+def test_simulate(model):
+    result = power.simulate(model, BETAS, sizes=(60, 400), replications=400, seed=1, n_jobs=1, chunk_size=150)
+    assert list(result.power.index) == [60, 400]
+    assert result.power.loc[400, "A -> B"] > 0.99
+    assert result.power.loc[400, "A -> C"] < 0.1
+    assert result.power.loc[60, "B -> C"] < result.power.loc[400, "B -> C"]
+    assert result.required(0.8)["A -> B"] in (60, 400)
+    assert result.required(0.8).isna()["A -> C"]
+    again = power.simulate(model, BETAS, sizes=(60, 400), replications=400, seed=1, n_jobs=2, chunk_size=150)
+    np.testing.assert_array_equal(again.power, result.power)
@@ -0,0 +1,73 @@
+"""Profiling runs: spans, counters, memory, isolation and the cache hooks."""
+import json
+import logging
+import threading
+
+import numpy as np
+import pytest
+
+from smartpls_assistant import cache, profiling
+
+
+def test_spans_and_counters_are_collected_only_inside_a_run():
+    with profiling.span("outside"):
+        profiling.count("ignored")
+    with profiling.Run("rerun") as run:
+        with profiling.span("outer", "page"):
+            with profiling.span("inner", "computation"):
+                profiling.count("cache hits", 2)
+    assert [(s.name, s.kind, s.depth) for s in run.spans] == [("outer", "page", 0), ("inner", "computation", 1)]
+    assert run.spans[0].seconds >= run.spans[1].seconds
+    summary = run.as_dict()
+    assert summary["counters"] == {"cache hits": 2} and "bytes" not in summary["spans"][0]
+    assert profiling.current() is None
+
+
+def test_other_threads_do_not_leak_into_a_run():
+    with profiling.Run() as run:
+        thread = threading.Thread(target=profiling.count, args=("job",))
+        thread.start()
+        thread.join()
+    assert not run.counters
+
+
+def test_memory_peaks_include_nested_spans():
+    with profiling.Run(memory=True) as run:
+        with profiling.span("outer"):
+            with profiling.span("inner"):
+                block = np.ones(2 ** 20)
+            del block
+    outer, inner = run.spans
+    assert inner.memory >= 8 * 2 ** 20
+    assert outer.memory >= inner.memory
+
+
+def test_cprofile_report():
+    with profiling.Run(profiler="cprofile") as run:
+        sum(range(1000))
+    name, data, mime = run.profile_report()
+    assert (name, mime) == ("profile.txt", "text/plain") and b"function calls" in data
+    assert run.profile_dump()
+    with pytest.raises(ValueError, match="Unknown profiler"):
+        profiling.Run(profiler="nope")
+
+
+def test_memoize_reports_hits_misses_and_computations():
+    store = cache.ResultCache()
+
+    @cache.memoize(lambda: store)
+    def cached_square(x):
+        return x * x
+
+    with profiling.Run() as run:
+        cached_square(3)
+        cached_square(3)
+    assert run.counters == {"cache misses": 1, "cache hits": 1}
+    assert [(s.name, s.kind) for s in run.spans] == [("square", "computation")]
+
+
+def test_log_writes_one_json_line(caplog):
+    with caplog.at_level(logging.INFO, logger="smartpls_assistant.profiling"):
+        profiling.log({"label": "x", "ms": 1.5}, event="rerun")
+    record = json.loads(caplog.records[-1].getMessage())
+    assert record["event"] == "rerun" and record["ms"] == 1.5 and "time" in record
@@ -0,0 +1,91 @@
+"""Report outline, check log and the three output formats."""
+import io
+import re
+import zipfile
+
+import pandas as pd
+import pytest
+
+from smartpls_assistant import bootstrap, htmt, pls, report
+from smartpls_assistant.rules import FAIL, PASS, WARN
+
+
+@pytest.fixture
+def inputs(survey, spec):
+    result = pls.estimate(survey, spec)
+    R = pls.correlation(survey[spec.indicators].to_numpy())
+    checks = [report.Check("ave", "AVE of SAT", "0.61", PASS, "Convergent validity."),
+              report.Check("missing", "Missing in q1", "2%", WARN, "Some missing values."),
+              report.Check("custom", "Other", "1", FAIL, "Outside every section.")]
+    return report.ReportInput(checks=checks, result=result, htmt=htmt.htmt_matrix(R, spec))
+
+
+def test_check_log_replaces_and_limits():
+    log = report.CheckLog(limit=2)
+    log.add("p_value", "SAT -> LOY", 0.2, FAIL, "not supported")
+    log.add("ave", "SAT", 0.6, PASS, "ok")
+    log.add("p_value", "SAT -> LOY", 0.01, PASS, "supported")
+    assert len(log) == 2
+    assert [c.value for c in log] == ["0.01", "0.6"]
+    log.add("htmt", "SAT <-> LOY", 0.7, PASS, "ok")
+    assert [c.metric for c in log] == ["ave", "htmt"]
+    table = log.table()
+    assert list(table["Section"]) == ["Measurement model", "Measurement model"]
+    assert list(table["Verdict"]) == ["Pass", "Pass"]
+
+
+def test_apa_style():
+    assert report._apa(0.456) == ".46"
+    assert report._apa(-0.05, 3) == "-.050"
+    assert report._apa(2.5, 2, False) == "2.50"
+    assert report._apa_p(0.0004) == "p < .001"
+    assert report._apa_p(0.0312) == "p = .031"
+    assert report._listing(["a", "b", "c"]) == "a, b, and c"
+
+
+def test_outline_numbers_tables_and_figures(inputs):
+    blocks = report.outline(inputs)
+    assert blocks[0] == ("title", inputs.title)
+    for kind in ("table", "figure"):
+        captions = [block[1] for block in blocks if block[0] == kind]
+        assert captions
+        assert [int(re.match(rf"{kind.capitalize()} (\d+)\. ", c).group(1)) for c in captions] == \
+            list(range(1, len(captions) + 1))
+    checks = next(block[2] for block in blocks if block[0] == "table" and block[1].endswith("Their Interpretation"))
+    assert list(checks["Section"]) == ["Data screening", "Measurement model", "Other checks"]
+
+
+def test_checks_only_report():
+    blocks = report.outline(report.ReportInput(checks=[report.Check("ave", "AVE", "0.4", FAIL, "low")]))
+    assert "lists the interactive checks only" in blocks[1][1]
+    assert [block[0] for block in blocks] == ["title", "text", "heading", "text", "table"]
+
+
+def test_bootstrap_text_reports_left_out_subsamples(survey, spec, inputs):
+    boot = bootstrap.bootstrap(survey, spec, n_boot=20, seed=1, n_jobs=1)
+    boot.non_converged = 3
+    inputs.bootstrap = boot
+    text = " ".join(block[1] for block in report.outline(inputs) if block[0] == "text")
+    assert "Bootstrapping with 20 subsamples" in text
+    assert "3 subsamples did not converge and were left out" in text
+
+
+def test_large_htmt_matrix_lists_its_highest_pairs():
+    names = [f"C{i}" for i in range(report.MATRIX_CONSTRUCTS + 2)]
+    values = pd.DataFrame(0.5, index=names, columns=names)
+    blocks = report._discriminant(values)
+    assert blocks[1][1].startswith(f"The {report.HTMT_PAIRS} Highest")
+    assert len(blocks[1][2]) == report.HTMT_PAIRS
+
+
+def test_render_formats(inputs):
+    figures = sum(block[0] == "figure" for block in report.outline(inputs))
+    page = report.render(inputs, "html", n_jobs=1).decode()
+    assert page.count("<svg") == figures
+    assert "Table 1." in page
+    document = zipfile.ZipFile(io.BytesIO(report.render(inputs, "docx", n_jobs=1)))
+    assert "word/document.xml" in document.namelist()
+    assert sum(name.startswith("word/media/") for name in document.namelist()) == figures
+    assert report.render(inputs, "pdf", n_jobs=1).startswith(b"%PDF")
+    with pytest.raises(ValueError, match="Unknown report format"):
+        report.render(inputs, "odt")
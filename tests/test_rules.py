@@ -0,0 +1,65 @@
+"""The rule registry against the per-form if/elif chains it replaced."""
+import numpy as np
+import pytest
+
+from smartpls_assistant import rules
+from smartpls_assistant.rules import FAIL, PASS, WARN
+
+# (status, verdict) of the original checkers, one if/elif chain per metric.
+CHAINS = {
+    "loading": lambda v: (PASS, "PASS") if v >= 0.708 else (WARN, "ACCEPTABLE") if v >= 0.4 else (FAIL, "FAIL"),
+    "reliability": lambda v: (PASS, "PASS") if v >= 0.7 else (WARN, "ACCEPTABLE") if v >= 0.6 else (FAIL, "FAIL"),
+    "ave": lambda v: (PASS, "PASS") if v >= 0.5 else (FAIL, "FAIL"),
+    "htmt": lambda v: (FAIL, "FAIL") if v >= 0.9 else (WARN, "ACCEPTABLE") if v >= 0.85 else (PASS, "PASS"),
+    "vif": lambda v: (FAIL, "FAIL") if v > 5.0 else (WARN, "ACCEPTABLE") if v > 3.0 else (PASS, "PASS"),
+    "p_value": lambda v: (PASS, "SUPPORTED") if v < 0.05 else (FAIL, "NOT SUPPORTED"),
+    "r2": lambda v: ((PASS, "Substantial explanatory power.") if v >= 0.75
+                     else (PASS, "Moderate explanatory power.") if v >= 0.50
+                     else (WARN, "Weak explanatory power.") if v >= 0.25
+                     else (FAIL, "Very weak explanatory power.")),
+    "f2": lambda v: ((PASS, "Large effect size.") if v >= 0.35
+                     else (PASS, "Medium effect size.") if v >= 0.15
+                     else (WARN, "Small effect size.") if v >= 0.02
+                     else (FAIL, "No effect size (or negligible).")),
+    "q2": lambda v: (PASS, "PASS") if v > 0 else (FAIL, "FAIL"),
+    "moderation_p": lambda v: (PASS, "SUPPORTED") if v < 0.05 else (FAIL, "NOT SUPPORTED"),
+    "mga_p": lambda v: (PASS, "DIFFERENCE FOUND") if v < 0.05 else (FAIL, "NO DIFFERENCE"),
+    "fsqca_consistency": lambda v: (PASS, "VALID RECIPE") if v > 0.80 else (FAIL, "NOT VALID"),
+}
+
+CUTS = [0.0, 0.02, 0.05, 0.15, 0.25, 0.35, 0.4, 0.5, 0.6, 0.7, 0.708, 0.75, 0.8, 0.85, 0.9, 3.0, 5.0]
+VALUES = np.unique(np.concatenate([
+    np.linspace(-0.5, 6, 261), CUTS, np.nextafter(CUTS, -1), np.nextafter(CUTS, 10),
+]))
+
+
+@pytest.mark.parametrize("metric", list(CHAINS))
+def test_rule_matches_its_chain(metric):
+    expected = [CHAINS[metric](v) for v in VALUES]
+    bands = [rules.evaluate(metric, v) for v in VALUES]
+    assert [(b.status, b.verdict) for b in bands] == expected
+    assert list(rules.evaluate(metric, VALUES)) == [status for status, _ in expected]
+
+
+def test_missing_values_get_no_status():
+    assert list(rules.evaluate("ave", [0.6, np.nan])) == [PASS, ""]
+
+
+def test_explanations_fill_their_context():
+    band = rules.evaluate("p_value", 0.01)
+    assert band.explain(0.01, direction="positive", beta=0.3) == \
+        "SUPPORTED. The relationship is significant and positive. (β = 0.300)"
+    assert rules.evaluate("r2", 0.42).explain(0.42) == "The model explains 42% of the variance."
+
+
+def test_mediation_type_matches_the_nested_chain():
+    indirect, direct = np.meshgrid([0.001, 0.049, 0.05, 0.2], [0.001, 0.049, 0.05, 0.2])
+    expected = [("partial" if d < 0.05 else "full") if i < 0.05 else "none"
+                for i, d in zip(indirect.ravel(), direct.ravel())]
+    assert list(rules.mediation_type(indirect.ravel(), direct.ravel())) == expected
+    assert rules.mediation_type(0.01, 0.3) == "full"
+
+
+def test_rule_rejects_mismatched_bands():
+    with pytest.raises(ValueError):
+        rules.Rule("broken", (0.5,), (rules.Band(PASS, "PASS", ""),))
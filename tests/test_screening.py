@@ -0,0 +1,126 @@
+"""Data screening and missing-value treatment against row-by-row computations."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from smartpls_assistant import screening
+from smartpls_assistant._stats import chi2_ppf
+
+
+@pytest.fixture
+def answers():
+    # Correlated 1-7 answers with scattered missing cells, a straight-liner and two bad codes.
+    rng = np.random.default_rng(5)
+    factor = rng.normal(size=(120, 1))
+    X = np.clip(np.round(4 + 1.2 * factor + rng.normal(size=(120, 5))), 1, 7)
+    X[rng.uniform(size=X.shape) < 0.08] = np.nan
+    X[7] = 4
+    X[10, 1], X[11, 3] = 9, 2.5
+    data = pd.DataFrame(X, columns=[f"x{j}" for j in range(5)])
+    data["id"] = np.arange(len(data))
+    return data
+
+
+def _naive_distances(Z, mask):
+    """d_o' S_oo^-1 d_o over each row's observed cells, one row at a time."""
+    S = Z.T @ Z / (len(Z) - 1)
+    out = []
+    for z, m in zip(Z, mask):
+        o = ~m
+        out.append(z[o] @ np.linalg.solve(S[np.ix_(o, o)], z[o]))
+    return np.array(out)
+
+
+def _naive_em(X, mask, tol=1e-12, max_iter=5000):
+    """Textbook EM for a multivariate normal, one row (missing pattern) at a time."""
+    n, p = X.shape
+    mu = np.nanmean(np.where(mask, np.nan, X), axis=0)
+    S = np.cov(np.where(mask, mu, X), rowvar=False, bias=True)
+    for _ in range(max_iter):
+        filled = np.where(mask, 0.0, X)
+        spread = np.zeros((p, p))
+        for i in range(n):
+            m, o = mask[i], ~mask[i]
+            if not m.any():
+                continue
+            B = S[np.ix_(m, o)] @ np.linalg.inv(S[np.ix_(o, o)])
+            filled[i, m] = mu[m] + B @ (X[i, o] - mu[o])
+            spread[np.ix_(m, m)] += S[np.ix_(m, m)] - B @ S[np.ix_(o, m)]
+        new_mu = filled.mean(axis=0)
+        dev = filled - new_mu
+        new_S = (dev.T @ dev + spread) / n
+        done = max(np.abs(new_mu - mu).max(), np.abs(new_S - S).max()) < tol
+        mu, S = new_mu, new_S
+        if done:
+            break
+    return filled
+
+
+def test_screen_counts(answers):
+    columns = [f"x{j}" for j in range(5)]
+    report = screening.screen(answers, columns, scale=(1, 7))
+    X = answers[columns]
+    np.testing.assert_array_equal(report.indicators["Missing"], X.isna().sum())
+    assert report.indicators["Out of range"].sum() == 2
+    assert report.respondents.loc[10, "Out of range"] == 1
+    valid = X.mask((X > 7) | (X != X.round()))
+    np.testing.assert_allclose(report.indicators["Mean"], valid.mean())
+    np.testing.assert_allclose(report.indicators["SD"], valid.std())
+    assert report.respondents.loc[7, "Straight-lining"]
+    expected = valid.apply(lambda row: row.count() >= 3 and row.max() == row.min(), axis=1)
+    np.testing.assert_array_equal(report.respondents["Straight-lining"], expected)
+
+
+def test_mahalanobis_over_answered_indicators(answers):
+    columns = [f"x{j}" for j in range(5)]
+    _, X, missing, invalid = screening._matrix(answers, columns, (1, 7))
+    mask = missing | invalid
+    Z, _, _ = screening._standardize(X, mask)
+    report = screening.screen(answers, columns, scale=(1, 7))
+    distance = _naive_distances(Z, mask)
+    np.testing.assert_allclose(report.respondents["Mahalanobis D²"], distance)
+    df = (~mask).sum(axis=1)
+    np.testing.assert_array_equal(report.respondents["Multivariate outlier"],
+                                  distance > chi2_ppf(1 - screening.MAHALANOBIS_ALPHA, df))
+
+
+def test_mean_replacement_and_casewise(answers):
+    columns = [f"x{j}" for j in range(5)]
+    mean = screening.clean(answers, "mean", columns)
+    pd.testing.assert_frame_equal(mean.data, answers.fillna(answers.mean()))
+    assert mean.imputed == answers[columns].isna().sum().sum()
+    casewise = screening.clean(answers, "casewise", columns)
+    pd.testing.assert_frame_equal(casewise.data, answers.dropna())
+    assert list(casewise.removed) == list(answers.index[answers.isna().any(axis=1)])
+
+
+def test_em_matches_row_by_row_em(answers):
+    columns = [f"x{j}" for j in range(5)]
+    result = screening.clean(answers, "em", columns, tol=1e-12, max_iter=5000)
+    assert result.converged
+    X = answers[columns].to_numpy()
+    expected = _naive_em(X, np.isnan(X))
+    np.testing.assert_allclose(result.data[columns].to_numpy(), expected, atol=1e-8)
+    np.testing.assert_array_equal(result.data["id"], answers["id"])
+
+
+def test_drop_flagged_respondents(answers):
+    columns = [f"x{j}" for j in range(5)]
+    result = screening.clean(answers, "mean", columns, drop_straight_lining=True)
+    assert 7 in result.removed and 7 not in result.data.index
+
+
+def test_chi2_quantiles():
+    # Tabulated quantiles; df 1 and 2 are computed exactly.
+    np.testing.assert_allclose(chi2_ppf([0.95, 0.999], 1), [3.8415, 10.8276], rtol=1e-4)
+    np.testing.assert_allclose(chi2_ppf([0.95, 0.999], 2), [5.9915, 13.8155], rtol=1e-4)
+    np.testing.assert_allclose(chi2_ppf(0.999, [3, 5, 10, 30]), [16.266, 20.515, 29.588, 59.703], rtol=0.02)
+    np.testing.assert_allclose(chi2_ppf(0.95, [3, 5, 10, 30]), [7.815, 11.070, 18.307, 43.773], rtol=0.02)
+
+
+def test_errors(answers):
+    with pytest.raises(ValueError, match="Unknown method"):
+        screening.clean(answers, "median")
+    empty = answers.assign(x0=np.nan)
+    with pytest.raises(ValueError, match="without valid values"):
+        screening.clean(empty, "mean", [f"x{j}" for j in range(5)])
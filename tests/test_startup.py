@@ -0,0 +1,29 @@
+"""Cold-start and rerun budgets of the Streamlit app (see benchmarks/startup.py).
+
+The timing checks depend on the machine, so they carry the ``perf`` marker
+and only run with ``pytest -m perf``.
+"""
+import pytest
+
+pytest.importorskip("streamlit")
+
+from benchmarks import startup  # noqa: E402
+from smartpls_assistant.ui import PAGES  # noqa: E402
+
+
+def test_every_page_has_an_import_budget():
+    assert set(startup.IMPORT_BUDGETS) == set(PAGES.values())
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("module", list(startup.IMPORT_BUDGETS))
+def test_import_budget(module):
+    assert startup.import_time(module) <= startup.IMPORT_BUDGETS[module]
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("page", list(PAGES))
+def test_render_budgets(page):
+    first, rerun = startup.render_times(page)
+    assert first <= startup.FIRST_RENDER_BUDGET
+    assert rerun <= startup.RERUN_BUDGET
@@ -0,0 +1,47 @@
+"""Closed-form VIFs against one auxiliary regression per predictor."""
+import numpy as np
+import pytest
+
+from smartpls_assistant import pls, vif
+
+
+def _auxiliary(X):
+    """1 / (1 - R²) of regressing each column on all the others."""
+    X = (X - X.mean(axis=0)) / X.std(axis=0)
+    values = []
+    for i in range(X.shape[1]):
+        others = np.delete(X, i, axis=1)
+        beta = np.linalg.lstsq(others, X[:, i], rcond=None)[0]
+        values.append(1 / np.var(X[:, i] - others @ beta) if others.size else 1.0)
+    return np.array(values)
+
+
+def test_matches_auxiliary_regressions():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(300, 5))
+    X[:, 3] += 0.8 * X[:, 0] - 0.5 * X[:, 1]
+    np.testing.assert_allclose(vif.vif(X), _auxiliary(X))
+
+
+def test_singular_block_is_flagged():
+    rng = np.random.default_rng(1)
+    X = rng.normal(size=(100, 3))
+    X = np.column_stack([X, X[:, 0] + X[:, 1]])
+    values, singular = vif.vif_from_corr(np.corrcoef(X, rowvar=False))
+    assert singular and np.isinf(values).all()
+    assert vif.vif_from_corr(np.ones((1, 1))) == (pytest.approx([1.0]), False)
+
+
+def test_inner_and_outer_tables(survey, spec):
+    result = pls.estimate(survey, spec)
+    inner, singular = vif.inner_vif(result.latent_correlations, spec)
+    assert singular == []
+    assert list(inner.columns) == spec.endogenous
+    scores = result.scores[["IMG", "QUAL"]].to_numpy()
+    np.testing.assert_allclose(inner.loc[["IMG", "QUAL"], "SAT"], _auxiliary(scores))
+    assert np.isnan(inner.loc["QUAL", "LOY"])
+
+    outer, singular = vif.outer_vif(pls.correlation(survey[spec.indicators].to_numpy()), spec)
+    assert singular == []
+    for construct, items in spec.blocks.items():
+        np.testing.assert_allclose(outer[items], _auxiliary(survey[items].to_numpy()))
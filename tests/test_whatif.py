@@ -0,0 +1,82 @@
+"""Item-deletion what-if screening against re-estimating each reduced model."""
+import numpy as np
+import pytest
+
+from smartpls_assistant import htmt, pls, whatif
+from smartpls_assistant.model import ModelSpec
+
+
+def _equal(a, b):
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(_equal(x, y) for x, y in zip(a, b))
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return np.array_equal(a, b)
+    return a == b
+
+
+def _reduced(data, spec, item):
+    blocks = {c: [i for i in items if i != item] for c, items in spec.blocks.items()}
+    reduced = ModelSpec(blocks, spec.paths, spec.modes, spec.higher_order)
+    return reduced, pls.correlation(data[reduced.indicators].to_numpy())
+
+
+@pytest.fixture
+def weak(survey):
+    # Weaken two items so that both constructs have deletion candidates.
+    data = survey.copy()
+    data["img3"] = 0.3 * data["img3"] + np.random.default_rng(1).normal(size=len(data))
+    return data
+
+
+def test_single_deletions_match_re_estimation(weak, spec):
+    R = pls.correlation(weak[spec.indicators].to_numpy())
+    table = whatif.single_deletions(R, spec, tol=1e-10)
+    assert {"img3", "sat4"} <= set(table.index)
+    for item, row in table.iterrows():
+        reduced, R_reduced = _reduced(weak, spec, item)
+        result = pls.estimate_correlation(R_reduced, reduced, tol=1e-10)
+        construct = row["Construct"]
+        reliability = result.reliability.loc[construct]
+        assert row["rho_c after"] == pytest.approx(reliability["Composite reliability (rho_c)"], abs=1e-7)
+        assert row["AVE after"] == pytest.approx(reliability["Average variance extracted (AVE)"], abs=1e-7)
+        matrix = htmt.htmt_matrix(R_reduced, reduced)
+        assert row["Max HTMT after"] == pytest.approx(np.nanmax(matrix.loc[construct]))
+
+
+@pytest.fixture
+def second_order():
+    # VALUE repeats the QUAL and SAT items, so deleting one of them changes two blocks.
+    return ModelSpec.from_syntax("""
+IMG   =~ img1 + img2 + img3
+QUAL  =~ q1 + q2 + q3
+SAT   =~ sat1 + sat2 + sat3 + sat4
+VALUE =~ QUAL + SAT
+LOY   =~ loy1 + loy2
+VALUE ~ IMG
+LOY ~ VALUE + IMG
+""")
+
+
+@pytest.mark.parametrize("model", ["spec", "second_order"])
+def test_variant_structure_and_sums_are_derived_exactly(weak, model, request):
+    spec = request.getfixturevalue(model)
+    R = pls.correlation(weak[spec.indicators].to_numpy())
+    base = whatif._State(R, spec, None, "path", 1e-7, 300)
+    for item in ("img1", "img3", "q2", "sat4", "loy2"):
+        variant = base.without(item, "path", 1e-7, 300)
+        reduced, R_reduced = _reduced(weak, spec, item)
+        fresh = pls._Structure(reduced)
+        derived = variant.s
+        assert set(vars(derived)) == set(vars(fresh))
+        for name, value in vars(fresh).items():
+            if name != "spec":
+                assert _equal(getattr(derived, name), value), name
+        rebuilt = whatif._State(R_reduced, reduced, None, "path", 1e-7, 300)
+        np.testing.assert_allclose(variant.S, rebuilt.S)
+
+
+def test_greedy_deletions_improve_ave(weak, spec):
+    R = pls.correlation(weak[spec.indicators].to_numpy())
+    steps = whatif.greedy_deletions(R, spec)
+    assert steps["Deleted item"].iloc[0] == "img3"
+    assert (steps["Δ AVE"] > 0).all()